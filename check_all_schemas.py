@@ -5,6 +5,7 @@ Comprehensive schema checker and fixer for all models
 
 import os
 import sys
+from collections import defaultdict
 from env_config import get_database_url
 
 # Load DATABASE_URL from environment variables
@@ -12,7 +13,7 @@ os.environ["DATABASE_URL"] = get_database_url()
 
 from flask import Flask
 from models import db
-from sqlalchemy import text, inspect
+from sqlalchemy import bindparam, text, inspect
 
 
 def create_app():
@@ -24,26 +25,50 @@ def create_app():
     return app
 
 
+def get_table_columns(table_names):
+    """Map each of ``table_names`` that exists to its set of column names
+
+    On PostgreSQL this is a single information_schema query; elsewhere each
+    table gets a focused has_table() probe before get_columns(), instead of
+    listing every table in the database.
+    """
+    tables = defaultdict(set)
+    if db.engine.dialect.name == "postgresql":
+        rows = db.session.execute(
+            text(
+                "SELECT table_name, column_name FROM information_schema.columns "
+                "WHERE table_schema = current_schema() AND table_name IN :names"
+            ).bindparams(bindparam("names", expanding=True)),
+            {"names": list(table_names)},
+        )
+        for table_name, column_name in rows:
+            tables[table_name].add(column_name)
+    else:
+        inspector = inspect(db.engine)
+        for table_name in table_names:
+            if inspector.has_table(table_name):
+                tables[table_name] = {col["name"] for col in inspector.get_columns(table_name)}
+    return tables
+
+
 def check_and_fix_all_schemas(app):
     """Check all tables and add missing columns"""
     with app.app_context():
         try:
-            inspector = inspect(db.engine)
-
-            # Get all tables
-            tables = inspector.get_table_names()
-            print(f"📊 Found {len(tables)} tables in database")
-
             # Tables that commonly have created_by/updated_by
             tables_to_check = ["teams", "projects", "vendors", "vendor_sites"]
 
+            # Get the tables to check with their columns
+            tables = get_table_columns(tables_to_check)
+            print(f"📊 Found {len(tables)} of {len(tables_to_check)} tables to check")
+
             for table_name in tables_to_check:
                 if table_name not in tables:
                     print(f"⚠️  Table {table_name} doesn't exist, skipping...")
                     continue
 
                 print(f"\n🔍 Checking {table_name} table...")
-                columns = [col["name"] for col in inspector.get_columns(table_name)]
+                columns = tables[table_name]
 
                 with db.engine.connect() as conn:
                     # Check for created_by
@@ -14,6 +14,7 @@ Azure blob cleanup requires AZURE_STORAGE_ACCOUNT_URL and AZURE_CONTAINER_NAME
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 from dotenv import load_dotenv
 from flask import Flask
@@ -28,6 +29,7 @@ AZURE_CONTAINER_NAME = os.environ.get("AZURE_CONTAINER_NAME", "usabc-uploads-sta
 
 # ── Configuration ────────────────────────────────────────────────────────────
 VENDOR_NAME = "Splendor"  # Will match via ILIKE '%Splendor%'
+COUNT_WORKERS = 4  # Concurrent COUNT queries (stays within the default pool)
 # ─────────────────────────────────────────────────────────────────────────────
 
 app = Flask(__name__)
@@ -102,6 +104,20 @@ def delete_blobs(container_client, blob_names):
     return deleted
 
 
+def count_concurrently(queries):
+    """Run independent count callables in parallel; results keep input order.
+
+    Each worker pushes its own app context, so every query gets its own
+    scoped session and pooled connection and the round trips overlap.
+    """
+    def run(query):
+        with app.app_context():
+            return query()
+
+    with ThreadPoolExecutor(max_workers=COUNT_WORKERS) as pool:
+        return list(pool.map(run, queries))
+
+
 def run_cleanup():
     with app.app_context():
         # ── Step 1: Find vendor ──────────────────────────────────────────
@@ -132,44 +148,48 @@ def run_cleanup():
             print(f"  [{r.id:>3}] {r.rfpo_id} — {r.title} ({r.status})")
 
         # ── Step 3: Count affected records ───────────────────────────────
-        line_items_count = RFPOLineItem.query.filter(
-            RFPOLineItem.rfpo_id.in_(rfpo_ids)
-        ).count()
-
-        files_count = UploadedFile.query.filter(
-            UploadedFile.rfpo_id.in_(rfpo_ids)
-        ).count()
-
         instances = RFPOApprovalInstance.query.filter(
             RFPOApprovalInstance.rfpo_id.in_(rfpo_ids)
         ).all()
         instance_ids = [i.id for i in instances]
 
-        actions_count = (
-            RFPOApprovalAction.query.filter(
-                RFPOApprovalAction.instance_id.in_(instance_ids)
-            ).count()
-            if instance_ids
-            else 0
-        )
-
-        audit_count = AuditLog.query.filter(
-            AuditLog.entity_type == "rfpo",
-            AuditLog.entity_id.in_(rfpo_id_strs),
-        ).count()
-
-        notif_count = Notification.query.filter(
-            Notification.entity_type == "rfpo",
-            Notification.entity_id.in_(rfpo_id_strs),
-        ).count()
-
-        email_count = EmailLog.query.filter(
-            EmailLog.rfpo_id.in_(rfpo_ids)
-        ).count()
-
-        ai_count = AIUsageLog.query.filter(
-            AIUsageLog.rfpo_id.in_(rfpo_ids)
-        ).count()
+        (
+            line_items_count,
+            files_count,
+            actions_count,
+            audit_count,
+            notif_count,
+            email_count,
+            ai_count,
+        ) = count_concurrently([
+            lambda: RFPOLineItem.query.filter(
+                RFPOLineItem.rfpo_id.in_(rfpo_ids)
+            ).count(),
+            lambda: UploadedFile.query.filter(
+                UploadedFile.rfpo_id.in_(rfpo_ids)
+            ).count(),
+            lambda: (
+                RFPOApprovalAction.query.filter(
+                    RFPOApprovalAction.instance_id.in_(instance_ids)
+                ).count()
+                if instance_ids
+                else 0
+            ),
+            lambda: AuditLog.query.filter(
+                AuditLog.entity_type == "rfpo",
+                AuditLog.entity_id.in_(rfpo_id_strs),
+            ).count(),
+            lambda: Notification.query.filter(
+                Notification.entity_type == "rfpo",
+                Notification.entity_id.in_(rfpo_id_strs),
+            ).count(),
+            lambda: EmailLog.query.filter(
+                EmailLog.rfpo_id.in_(rfpo_ids)
+            ).count(),
+            lambda: AIUsageLog.query.filter(
+                AIUsageLog.rfpo_id.in_(rfpo_ids)
+            ).count(),
+        ])
 
         # ── Azure Blob Storage scan ──────────────────────────────────────
         container_client = get_blob_container_client()
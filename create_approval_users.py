@@ -3,6 +3,7 @@ Create user accounts for RFPO approval workflow members.
 Uncertain/guessed emails are prefixed with '#'.
 """
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from werkzeug.security import generate_password_hash
 
@@ -12,21 +13,15 @@ import sys
 
 sys.path.insert(0, os.path.dirname(__file__))
 
-from env_config import get_database_url, get_secret_key
+from env_config import config, get_database_url, get_env, get_secret_key
 from models import db, User
 from flask import Flask
 
 
-AZURE_DB_URL = (
-    "postgresql://rfpoadmin:RfpoSecure123!"
-    "@rfpo-db-5kn5bsg47vvac.postgres.database.azure.com:5432/rfpodb?sslmode=require"
-)
-
-
 def create_app(use_azure=False):
     app = Flask(__name__)
     if use_azure:
-        db_url = AZURE_DB_URL
+        db_url = get_env("AZURE_DATABASE_URL", required=True)
         print(f"Connecting to AZURE PostgreSQL...")
     else:
         db_url = get_database_url()
@@ -77,23 +72,44 @@ USERS = [
 ]
 
 
+def hash_passwords(passwords):
+    """Hash passwords in parallel.
+
+    Werkzeug's scrypt/pbkdf2 run in OpenSSL with the GIL released, so a
+    thread pool scales across cores without a process pool's startup and
+    fork-with-open-DB-connection hazards. PASSWORD_HASH_WORKERS overrides
+    the pool size (default: CPU count); PASSWORD_HASH_METHOD sets the cost.
+    """
+    method = config.PASSWORD_HASH_METHOD
+    passwords = list(passwords)
+    if len(passwords) < 2:
+        return [generate_password_hash(p, method=method) for p in passwords]
+    workers = int(os.environ.get("PASSWORD_HASH_WORKERS", os.cpu_count() or 1))
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        return list(pool.map(lambda p: generate_password_hash(p, method=method), passwords))
+
+
 def main(use_azure=False):
     app = create_app(use_azure=use_azure)
     with app.app_context():
         created = []
         skipped = []
 
+        pending = []
         for u in USERS:
             existing = User.query.filter_by(email=u["email"]).first()
             if existing:
                 skipped.append(f"  SKIP: {u['fullname']} ({u['email']}) - already exists (id={existing.id})")
                 continue
+            pending.append(u)
 
+        password_hashes = hash_passwords(DEFAULT_PASSWORD for _ in pending)
+        for u, password_hash in zip(pending, password_hashes):
             user = User(
                 record_id=str(uuid.uuid4())[:8].upper(),
                 fullname=u["fullname"],
                 email=u["email"],
-                password_hash=generate_password_hash(DEFAULT_PASSWORD),
+                password_hash=password_hash,
                 company=u["company"],
                 company_code=u["company_code"],
                 active=True,
@@ -39,8 +39,8 @@ from flask_login import (
     logout_user,
 )
 from flask_wtf.csrf import CSRFProtect
-from sqlalchemy import desc
-from werkzeug.security import check_password_hash
+from sqlalchemy import desc, or_, union, update
+from sqlalchemy.orm import selectinload
 from werkzeug.utils import secure_filename
 from werkzeug.middleware.proxy_fix import ProxyFix
 
@@ -73,6 +73,7 @@ from models import (
     Vendor,
     VendorSite,
     db,
+    ensure_schema,
 )
 
 # Optional heavy deps used for import/export
@@ -111,12 +112,44 @@ def _parse_budget_amount(value):
 def sync_all_users_approver_status(updated_by=None):
     """Sync approver status for all users - useful after workflow changes"""
     try:
-        users = User.query.all()
-        updated_count = 0
+        # Same rule as User.check_approver_status: a user is an approver when
+        # named on a step whose stage belongs to a workflow
+        valid_steps = (
+            db.session.query(RFPOApprovalStep)
+            .join(RFPOApprovalStage, RFPOApprovalStep.stage_id == RFPOApprovalStage.id)
+            .join(
+                RFPOApprovalWorkflow,
+                RFPOApprovalStage.workflow_id == RFPOApprovalWorkflow.id,
+            )
+        )
+        approver_ids = union(
+            valid_steps.with_entities(RFPOApprovalStep.primary_approver_id),
+            valid_steps.filter(
+                RFPOApprovalStep.backup_approver_id.isnot(None)
+            ).with_entities(RFPOApprovalStep.backup_approver_id),
+        )
 
-        for user in users:
-            if user.update_approver_status(updated_by=updated_by):
-                updated_count += 1
+        values = {"approver_updated_at": datetime.utcnow()}
+        if updated_by:
+            values["updated_by"] = updated_by
+
+        # One UPDATE per direction, touching only users whose flag changes
+        # (NULL counts as changed, as in User.update_approver_status)
+        promoted = db.session.execute(
+            update(User)
+            .where(User.record_id.in_(approver_ids))
+            .where(or_(User.is_approver.is_(None), User.is_approver.is_(False)))
+            .values(is_approver=True, **values)
+            .execution_options(synchronize_session=False)
+        )
+        demoted = db.session.execute(
+            update(User)
+            .where(User.record_id.notin_(approver_ids))
+            .where(or_(User.is_approver.is_(None), User.is_approver.is_(True)))
+            .values(is_approver=False, **values)
+            .execution_options(synchronize_session=False)
+        )
+        updated_count = promoted.rowcount + demoted.rowcount
 
         db.session.commit()
         return updated_count
@@ -529,7 +562,7 @@ def create_app():
     db.init_app(app)
 
     with app.app_context():
-        db.create_all()
+        ensure_schema()
 
     @app.teardown_appcontext
     def shutdown_session(exception=None):
@@ -1066,11 +1099,6 @@ def create_app():
             if not creator or not creator.email:
                 return
 
-            admin_url = (
-                os.environ.get("USER_APP_URL")
-                or os.environ.get("APP_URL")
-                or "http://localhost:5000"
-            )
             _email_svc.send_templated_email(
                 to_emails=[creator.email],
                 template_name="approval_complete",
@@ -1079,7 +1107,7 @@ def create_app():
                     "rfpo_id": rfpo.rfpo_id,
                     "po_number": rfpo.po_number,
                     "outcome": outcome,
-                    "rfpo_url": f"{admin_url}/rfpos/{rfpo.id}",
+                    "rfpo_url": f"{_email_svc.rfpos_url}/{rfpo.id}",
                 },
                 subject=f"RFPO {outcome} - {rfpo.rfpo_id}",
                 email_type='approval_complete',
@@ -1773,7 +1801,7 @@ def create_app():
 
             user = User.query.filter(db.func.lower(User.email) == email, User.active == True).first()
 
-            if user and check_password_hash(user.password_hash, password):
+            if user and user.check_password(password):
                 if user.is_super_admin() or user.is_rfpo_admin():
                     login_user(user)
                     record_audit("login", "user", user.id, {"email": user.email})
@@ -3240,14 +3268,28 @@ def create_app():
     @login_required
     def rfpos():
         """List all RFPOs (excludes soft-deleted)"""
-        rfpos = RFPO.query.filter(RFPO.deleted_at.is_(None)).all()
+        # Line items and files come in one IN (...) query each
+        rfpos = (
+            RFPO.query.options(selectinload(RFPO.line_items), selectinload(RFPO.files))
+            .filter(RFPO.deleted_at.is_(None))
+            .all()
+        )
+
+        # First approval instance per RFPO, fetched in one query
+        approval_instances = {}
+        if rfpos:
+            for instance in (
+                RFPOApprovalInstance.query.filter(
+                    RFPOApprovalInstance.rfpo_id.in_([rfpo.id for rfpo in rfpos])
+                )
+                .order_by(RFPOApprovalInstance.id)
+            ):
+                approval_instances.setdefault(instance.rfpo_id, instance)
 
         # Add additional info for each RFPO
         for rfpo in rfpos:
             # Check if RFPO has approval instances
-            rfpo.approval_instance = RFPOApprovalInstance.query.filter_by(
-                rfpo_id=rfpo.id
-            ).first()
+            rfpo.approval_instance = approval_instances.get(rfpo.id)
 
             # Allow deletion if no approval instance OR if approval instance is completed
             if rfpo.approval_instance is None:
@@ -8545,10 +8587,6 @@ Southfield, MI  48075""",
 if __name__ == "__main__":
     app = create_app()
 
-    with app.app_context():
-        # Create tables if they don't exist
-        db.create_all()
-
     print("🚀 Custom RFPO Admin Panel Starting...")
     print("=" * 60)
     print("📧 Default Login: admin@rfpo.com")
@@ -3,24 +3,43 @@ Email Service Module
 Handles email sending functionality with template support
 """
 
+import asyncio
+import atexit
+import base64
 import logging
 import os
+import queue
+import re
 import smtplib
+import ssl
 import threading
 import time
 from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 _eastern = ZoneInfo("America/New_York")
-from email import encoders
-from email.mime.base import MIMEBase
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+from email import policy
+from email.message import EmailMessage
 from typing import Any, Dict, List, Optional, Tuple
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from dotenv import load_dotenv
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    select_autoescape,
+)
+
+# Optional lxml (pulled in by python-docx) for HTML → plain-text conversion
+try:
+    from lxml import etree as lxml_etree
+    from lxml import html as lxml_html
+except Exception:  # pragma: no cover - optional dependency
+    lxml_etree = None
+    lxml_html = None
 
 # Optional Azure Communication Services Email client
 try:
@@ -39,6 +58,51 @@ except Exception:  # pragma: no cover - optional dependency
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Recycle a persistent SMTP session after this many messages
+_SMTP_MAX_SENDS_PER_CONNECTION = 10000
+
+# ACS clients keyed by connection string, shared by all EmailService instances
+_ACS_CLIENTS: Dict[str, Any] = {}
+_ACS_CLIENTS_LOCK = threading.Lock()
+
+# Email templates ship with the code, so one shared environment serves every
+# EmailService instance (compiled templates and bytecode are reused).
+_TEMPLATE_DIR = os.path.join(os.path.dirname(__file__), "templates", "email")
+try:
+    _bytecode_cache = FileSystemBytecodeCache()
+except Exception:  # pragma: no cover - unusable temp dir; parse on demand
+    _bytecode_cache = None
+_JINJA_ENV = Environment(
+    loader=FileSystemLoader(_TEMPLATE_DIR),
+    autoescape=select_autoescape(["html", "xml"]),
+    auto_reload=False,
+    cache_size=400,
+    bytecode_cache=_bytecode_cache,
+)
+
+# Templates used by the notification helpers, compiled once at import
+_PRELOADED_TEMPLATE_NAMES = (
+    "welcome",
+    "password_changed",
+    "approval_notification",
+    "approval_reminder",
+    "approval_escalation",
+    "user_added_to_project",
+)
+
+
+def _preload_templates() -> Dict[str, Any]:
+    templates = {}
+    for name in _PRELOADED_TEMPLATE_NAMES:
+        try:
+            templates[name] = _JINJA_ENV.get_template(f"{name}.html")
+        except Exception as exc:  # missing/broken template: load on demand
+            logger.warning("Could not preload email template %s: %s", name, exc)
+    return templates
+
+
+_TEMPLATES = _preload_templates()
+
 
 @dataclass
 class FailedEmail:
@@ -60,32 +124,58 @@ class FailedEmail:
     template_name: Optional[str] = None
 
 
+@dataclass
+class _SendResult:
+    """Outcome of one send_email call, kept per call rather than on the service."""
+
+    provider: Optional[str] = None  # 'ACS' | 'SMTP' | None
+    error: Optional[str] = None
+    status: Optional[str] = None
+    sender: Optional[str] = None
+    recipients: List[str] = field(default_factory=list)
+    message_id: Optional[str] = None
+
+
+# Set on threads running background or concurrent sends: their sends leave
+# the service's last_* attributes untouched
+_send_context = threading.local()
+
+
+_loaded_env_files: set = set()
+
+
 def load_env_file(env_file=".env"):
-    """Load environment variables from .env file"""
-    if os.path.exists(env_file):
-        with open(env_file, "r") as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#") and "=" in line:
-                    key, value = line.split("=", 1)
-                    key = key.strip()
-                    value = value.strip()
-
-                    # Remove quotes if present
-                    if value.startswith('"') and value.endswith('"'):
-                        value = value[1:-1]
-                    elif value.startswith("'") and value.endswith("'"):
-                        value = value[1:-1]
-
-                    # Set environment variable if not already set
-                    if key not in os.environ:
-                        os.environ[key] = value
+    """Load environment variables from .env file (at most once per path).
+
+    Parsing is delegated to python-dotenv, the same parser env_config uses.
+    Variables already present in the environment are never overridden.
+    """
+    path = os.path.abspath(env_file)
+    if path in _loaded_env_files:
+        return
+    _loaded_env_files.add(path)
+    if os.path.exists(path):
+        load_dotenv(path, override=False)
 
 
 # Load .env file automatically
 load_env_file()
 
 
+def _first_env(*keys: str, default: Any = None) -> Any:
+    """Return the first non-empty environment value among *keys*.
+
+    Empty strings count as unset, matching the ``a or b or c`` chains this
+    replaces (e.g. a blank ``MAIL_USERNAME=`` still falls back to SMTP_*).
+    """
+    environ = os.environ
+    for key in keys:
+        value = environ.get(key)
+        if value:
+            return value
+    return default
+
+
 # ------------------------------------------------------------------
 # Email test-mode settings (DB-backed with short TTL cache)
 # ------------------------------------------------------------------
@@ -182,6 +272,196 @@ def _is_kill_switch_on() -> bool:
     return result
 
 
+# Read size for file-backed attachments: a multiple of 57 bytes, so every
+# chunk encodes to whole 76-char base64 lines and chunks concatenate cleanly.
+_B64_CHUNK = 57 * 144
+
+
+def _encode_attachment_file(path: str) -> str:
+    """Base64-encode a file in line-aligned chunks without loading it whole."""
+    pieces = []
+    with open(path, "rb") as fh:
+        while True:
+            chunk = fh.read(_B64_CHUNK)
+            if not chunk:
+                break
+            pieces.append(base64.encodebytes(chunk).decode("ascii"))
+    return "".join(pieces)
+
+
+def _build_attachment_part(att: Dict[str, Any]) -> Optional[EmailMessage]:
+    """Build a base64 MIME part from ``{"filename", "content" | "path"}``.
+
+    Returns None when the entry has no filename or no payload source.
+    """
+    if "filename" not in att:
+        return None
+    if "content" in att:
+        content = att["content"]
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        encoded = base64.encodebytes(content).decode("ascii")
+    elif "path" in att:
+        encoded = _encode_attachment_file(att["path"])
+    else:
+        return None
+
+    part = EmailMessage(policy=policy.SMTP)
+    part["Content-Type"] = "application/octet-stream"
+    part["Content-Transfer-Encoding"] = "base64"
+    part.add_header("Content-Disposition", "attachment", filename=att["filename"])
+    part.set_payload(encoded)
+    return part
+
+
+def _build_smtp_message(
+    sender_email: str,
+    to_emails: List[str],
+    subject: str,
+    cc_emails: Optional[List[str]],
+    bcc_emails: Optional[List[str]],
+    body_text: Optional[str],
+    body_html: Optional[str],
+    attachments: Optional[List[Dict[str, Any]]],
+) -> EmailMessage:
+    """Assemble the SMTP message; nests multiparts only when required."""
+    msg = EmailMessage(policy=policy.SMTP)
+    msg["From"] = sender_email
+    msg["To"] = ", ".join(to_emails)
+    msg["Subject"] = subject
+    if cc_emails:
+        msg["Cc"] = ", ".join(cc_emails)
+    if bcc_emails:
+        msg["Bcc"] = ", ".join(bcc_emails)
+
+    if body_text:
+        msg.set_content(body_text)
+        if body_html:
+            msg.add_alternative(body_html, subtype="html")
+    elif body_html:
+        msg.set_content(body_html, subtype="html")
+
+    for att in attachments or ():
+        part = _build_attachment_part(att)
+        if part is not None:
+            if msg.get_content_type() != "multipart/mixed":
+                msg.make_mixed()
+            msg.attach(part)
+    return msg
+
+
+_ANCHOR_RE = re.compile(
+    r"<a\s+[^>]*href=[\"']([^\"']+)[\"'][^>]*>(.*?)</a>",
+    flags=re.IGNORECASE | re.DOTALL,
+)
+_TAG_RE = re.compile(r"<[^<]+?>")
+_BLANKS_RE = re.compile(r"\n\s*\n")
+
+
+def _html_to_text_regex(html_content: str) -> str:
+    """Regex fallback for :func:`_html_to_text` when lxml is unavailable."""
+    # Replace anchor tags with "text (url)", then strip remaining HTML tags
+    interim = _ANCHOR_RE.sub(r"\2 (\1)", html_content)
+    return _TAG_RE.sub("", interim)
+
+
+def _html_to_text(html_content: str) -> str:
+    """Render an HTML email body as plain text.
+
+    Hyperlinks are preserved by turning ``<a href="URL">Text</a>`` into
+    ``Text (URL)``; ``<style>``/``<script>`` contents are dropped.
+    """
+    text_content = None
+    if lxml_html is not None:
+        try:
+            tree = lxml_html.fromstring(html_content)
+            for el in list(tree.iter("style", "script")):
+                el.drop_tree()
+            for a in tree.iter("a"):
+                href = a.get("href")
+                if href:
+                    label = a.text_content()
+                    tail = a.tail
+                    a.clear()
+                    a.text = f"{label} ({href})"
+                    a.tail = tail
+            text_content = tree.text_content()
+        except (ValueError, lxml_etree.LxmlError) as exc:
+            logger.debug("lxml could not parse email HTML: %s", exc)
+    if text_content is None:
+        text_content = _html_to_text_regex(html_content)
+    return _BLANKS_RE.sub("\n\n", text_content)
+
+
+_ACS_CONN_SEGMENT = re.compile(r"([A-Za-z_]+)\s*=\s*([^;]+)")
+
+
+@lru_cache(maxsize=4)
+def _parse_acs_connection_string(conn_str: str) -> Tuple[str, str]:
+    """Parse ACS connection string into (endpoint, access_key).
+
+    Expected formats (case-insensitive keys):
+        endpoint=https://<resource>.communication.azure.com/;accesskey=<key>
+        endpoint=https://...;accessKey=<key>
+    """
+    parts = {
+        k.lower(): v.strip() for k, v in _ACS_CONN_SEGMENT.findall(conn_str)
+    }
+
+    endpoint = parts.get("endpoint") or parts.get("endpoints") or ""
+    access_key = (
+        parts.get("accesskey") or parts.get("access_key") or parts.get("key") or ""
+    )
+
+    if not endpoint or not access_key:
+        raise ValueError(
+            "Invalid ACS connection string: missing endpoint or access key"
+        )
+
+    return endpoint, access_key
+
+
+def _acs_addrs(addrs: Optional[List[str]]) -> Optional[List[Dict[str, str]]]:
+    """Map plain addresses to the ACS ``[{"address": ...}]`` recipient shape."""
+    return [{"address": a} for a in addrs] if addrs else None
+
+
+class _ResumingTLSContext(ssl.SSLContext):
+    """Client TLS context that offers the previous session for resumption.
+
+    ``smtplib.SMTP.starttls`` has no ``session`` argument, so the last
+    negotiated session is injected here; reconnects to the same relay can
+    then resume instead of paying for a full handshake.
+    """
+
+    last_session: Optional[ssl.SSLSession] = None
+
+    def wrap_socket(self, sock, *args, **kwargs):
+        if self.last_session is not None:
+            kwargs.setdefault("session", self.last_session)
+        return super().wrap_socket(sock, *args, **kwargs)
+
+
+def _make_smtp_tls_context() -> _ResumingTLSContext:
+    # Same verification settings as smtplib's default starttls() context
+    ctx = _ResumingTLSContext(ssl.PROTOCOL_TLS_CLIENT)
+    ctx.check_hostname = False
+    ctx.verify_mode = ssl.CERT_NONE
+    return ctx
+
+
+def _current_flask_app():
+    """Return the active Flask app object, or None outside an app context."""
+    try:
+        from flask import current_app, has_app_context
+
+        if has_app_context():
+            return current_app._get_current_object()
+    except Exception:  # pragma: no cover - flask always present in the apps
+        pass
+    return None
+
+
 class EmailService:
     """Email service for sending templated emails"""
 
@@ -202,67 +482,87 @@ class EmailService:
             self.config.get("retry_base_delay", 0.5)
         )
 
+        # Persistent SMTP session, reused across sends (see _get_smtp)
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._smtp_sends = 0
+        self._smtp_lock = threading.RLock()
+        self._tls_context = _make_smtp_tls_context()
+
+        # Fire-and-forget send queue; worker threads start on first submit()
+        self._send_queue: queue.Queue = queue.Queue(
+            maxsize=int(self.config.get("queue_size", 10000))
+        )
+        self._worker_count: int = max(
+            1, int(self.config.get("workers") or os.environ.get("MAIL_WORKERS") or 2)
+        )
+        self._workers: List[threading.Thread] = []
+        self._workers_lock = threading.Lock()
+
         # Thread-safe failed email queue (capped at 1000 entries)
         self._failed_queue: deque = deque(maxlen=1000)
         self._queue_lock = threading.Lock()
 
         # SMTP Configuration from environment variables (support multiple naming schemes)
         # Preferred MAIL_*; fall back to SMTP_*; then GMAIL_*
-        self.smtp_server = (
-            os.environ.get("MAIL_SERVER")
-            or os.environ.get("SMTP_SERVER")
-            or "smtp.gmail.com"
-        )
-        self.smtp_port = int(
-            os.environ.get("MAIL_PORT") or os.environ.get("SMTP_PORT") or 587
-        )
-        use_tls_raw = (
-            os.environ.get("MAIL_USE_TLS") or os.environ.get("SMTP_USE_TLS") or "True"
+        self.smtp_server = _first_env(
+            "MAIL_SERVER", "SMTP_SERVER", default="smtp.gmail.com"
         )
+        self.smtp_port = int(_first_env("MAIL_PORT", "SMTP_PORT", default=587))
+        use_tls_raw = _first_env("MAIL_USE_TLS", "SMTP_USE_TLS", default="True")
         self.use_tls = str(use_tls_raw).lower() == "true"
 
         # Credentials
-        self.username = (
-            os.environ.get("MAIL_USERNAME")
-            or os.environ.get("SMTP_USERNAME")
-            or os.environ.get("GMAIL_USER")
-        )
-        self.password = (
-            os.environ.get("MAIL_PASSWORD")
-            or os.environ.get("SMTP_PASSWORD")
-            or os.environ.get("GMAIL_APP_PASSWORD")
+        self.username = _first_env("MAIL_USERNAME", "SMTP_USERNAME", "GMAIL_USER")
+        self.password = _first_env(
+            "MAIL_PASSWORD", "SMTP_PASSWORD", "GMAIL_APP_PASSWORD"
         )
         # Sender
-        self.default_sender = (
-            os.environ.get("MAIL_DEFAULT_SENDER")
-            or os.environ.get("SMTP_DEFAULT_SENDER")
-            or self.username
+        self.default_sender = _first_env(
+            "MAIL_DEFAULT_SENDER", "SMTP_DEFAULT_SENDER", default=self.username
         )
 
+        # App links and support address used by the notification helpers
+        self.refresh_config()
+
         # Azure Communication Services Email configuration
         self.acs_connection_string = os.environ.get("ACS_CONNECTION_STRING")
         self.acs_sender_email = os.environ.get("ACS_SENDER_EMAIL")
         self._acs_client = None
 
-        # Template configuration
-        self.template_dir = os.path.join(
-            os.path.dirname(__file__), "templates", "email"
-        )
-        self.jinja_env = Environment(
-            loader=FileSystemLoader(self.template_dir),
-            autoescape=select_autoescape(["html", "xml"]),
-        )
+        # Template configuration (module-level, shared across instances)
+        self.template_dir = _TEMPLATE_DIR
+        self.jinja_env = _JINJA_ENV
+        self._templates = _TEMPLATES
 
-        # Validate configuration
-        self._validate_config()
+        # Validate configuration (also caches _acs_ready / _smtp_ready)
+        self._config_valid = self._validate_config()
 
-    def _reset_last_result(self):
-        self.last_provider = None
-        self.last_error = None
-        self.last_status = None
-        self.last_sender = None
-        self.last_recipients = []
-        self.last_message_id = None
+    def refresh_config(self) -> None:
+        """Re-read the app URLs and support address from the environment.
+
+        Resolved once at construction; call this after changing
+        USER_APP_URL / ADMIN_APP_URL / APP_URL / SUPPORT_EMAIL at runtime.
+        """
+        self.user_app_url = _first_env(
+            "USER_APP_URL", "APP_URL", default="http://localhost:5000"
+        )
+        self.admin_app_url = _first_env(
+            "ADMIN_APP_URL", "APP_URL", default="http://localhost:5111"
+        )
+        self.support_email = os.environ.get("SUPPORT_EMAIL", "support@rfpo.com")
+        # Fixed link targets, concatenated once
+        self.user_login_url = self.user_app_url + "/login"
+        self.admin_login_url = self.admin_app_url + "/login"
+        self.projects_url = self.user_app_url + "/dashboard"
+        self.rfpos_url = self.user_app_url + "/rfpos"
+
+    def _publish_result(self, result: _SendResult) -> None:
+        self.last_provider = result.provider
+        self.last_error = result.error
+        self.last_status = result.status
+        self.last_sender = result.sender
+        self.last_recipients = result.recipients
+        self.last_message_id = result.message_id
 
     def get_last_send_result(self) -> Dict[str, Any]:
         return {
@@ -275,9 +575,18 @@ class EmailService:
         }
 
     def _validate_config(self):
-        """Validate email configuration"""
+        """Validate email configuration and cache provider readiness flags.
+
+        Call again after changing connection attributes on an existing
+        instance; ``send_email`` consults the cached ``_acs_ready`` flag.
+        """
+        self._acs_ready = bool(
+            self.acs_connection_string and self.acs_sender_email and EmailClient
+        )
+        self._smtp_ready = bool(self.username and self.password and self.smtp_server)
+
         # If ACS is configured and client available, consider service functional
-        if self.acs_connection_string and self.acs_sender_email and EmailClient:
+        if self._acs_ready:
             return True
 
         # Otherwise, require SMTP configuration
@@ -297,10 +606,19 @@ class EmailService:
         return True
 
     def _get_acs_client(self) -> Optional[Any]:
-        """Create or return ACS EmailClient if configured."""
+        """Create or return ACS EmailClient if configured.
+
+        Clients are shared process-wide per connection string so every
+        EmailService instance reuses the same HTTP pipeline.
+        """
         if not (self.acs_connection_string and EmailClient):
             return None
-        if self._acs_client is None:
+        if self._acs_client is not None:
+            return self._acs_client
+        with _ACS_CLIENTS_LOCK:
+            self._acs_client = _ACS_CLIENTS.get(self.acs_connection_string)
+            if self._acs_client is not None:
+                return self._acs_client
             try:
                 # The EmailClient constructor expects (endpoint, credential).
                 # Use SDK helper to build client from full connection string.
@@ -321,6 +639,7 @@ class EmailService:
                     self._acs_client = EmailClient(
                         endpoint, AzureKeyCredential(access_key)
                     )
+                _ACS_CLIENTS[self.acs_connection_string] = self._acs_client
             except Exception as e:
                 logger.error(f"Failed to create ACS EmailClient: {e}")
                 self._acs_client = None
@@ -328,34 +647,8 @@ class EmailService:
 
     @staticmethod
     def _parse_acs_connection_string(conn_str: str) -> tuple[str, str]:
-        """Parse ACS connection string into (endpoint, access_key).
-
-        Expected formats (case-insensitive keys):
-            endpoint=https://<resource>.communication.azure.com/;accesskey=<key>
-            endpoint=https://...;accessKey=<key>
-        """
-        # Split by semicolons and then by the first '=' per segment
-        parts = {}
-        for segment in conn_str.split(";"):
-            segment = segment.strip()
-            if not segment:
-                continue
-            if "=" not in segment:
-                continue
-            k, v = segment.split("=", 1)
-            parts[k.strip().lower()] = v.strip()
-
-        endpoint = parts.get("endpoint") or parts.get("endpoints") or ""
-        access_key = (
-            parts.get("accesskey") or parts.get("access_key") or parts.get("key") or ""
-        )
-
-        if not endpoint or not access_key:
-            raise ValueError(
-                "Invalid ACS connection string: missing endpoint or access key"
-            )
-
-        return endpoint, access_key
+        """Parse ACS connection string into (endpoint, access_key)."""
+        return _parse_acs_connection_string(conn_str)
 
     def _create_smtp_connection(self):
         """Create and configure SMTP connection"""
@@ -363,19 +656,126 @@ class EmailService:
             # Create SMTP connection
             server = smtplib.SMTP(self.smtp_server, self.smtp_port)
 
-            # Enable TLS if configured
+            # Enable TLS if configured (resuming the previous session if any)
             if self.use_tls:
-                server.starttls()
+                server.starttls(context=self._tls_context)
 
             # Login with credentials
             if self.username and self.password:
                 server.login(self.username, self.password)
 
+            # Remember the session (TLS 1.3 tickets arrive after the handshake)
+            if self.use_tls:
+                self._tls_context.last_session = getattr(server.sock, "session", None)
+
             return server
         except Exception as e:
             logger.error(f"Failed to create SMTP connection: {str(e)}")
             raise
 
+    def _get_smtp(self):
+        """Return the cached SMTP session, reconnecting if it has gone stale.
+
+        Callers must hold ``_smtp_lock``.
+        """
+        server = self._smtp
+        if server is not None:
+            try:
+                if server.noop()[0] == 250:
+                    return server
+            except Exception as e:
+                logger.debug("Cached SMTP session unusable, reconnecting: %s", e)
+            self._drop_smtp()
+        self._smtp = self._create_smtp_connection()
+        self._smtp_sends = 0
+        return self._smtp
+
+    def _drop_smtp(self) -> None:
+        """Close and forget the cached SMTP session (never raises)."""
+        server, self._smtp = self._smtp, None
+        self._smtp_sends = 0
+        if server is not None:
+            try:
+                server.quit()
+            except Exception:
+                pass
+
+    def close(self) -> None:
+        """Close the persistent SMTP session, if one is open."""
+        with self._smtp_lock:
+            self._drop_smtp()
+
+    def send_batch(self, messages: List[Dict[str, Any]]) -> List[bool]:
+        """Send several emails back-to-back over one SMTP session.
+
+        Each entry is a dict of :meth:`send_email` keyword arguments.  The
+        SMTP lock is taken per message, around the SMTP I/O only, so ACS sends
+        and retry backoff never block other senders; the cached session is
+        still reused across the batch.
+        """
+        return [self.send_email(**m) for m in messages]
+
+    # ------------------------------------------------------------------
+    # Background send queue
+    # ------------------------------------------------------------------
+
+    def submit(self, fn, *args: Any, **kwargs: Any) -> bool:
+        """Queue ``fn(*args, **kwargs)`` for a background email worker.
+
+        Returns True once queued.  When the queue is full the call runs
+        synchronously instead (back-pressure rather than dropping mail) and
+        its result is returned.  The caller's Flask app context, if any, is
+        re-entered on the worker.
+        """
+        self._ensure_workers()
+        try:
+            self._send_queue.put_nowait((fn, args, kwargs, _current_flask_app()))
+        except queue.Full:
+            logger.warning(
+                "Email send queue full (%d pending); sending synchronously",
+                self._send_queue.qsize(),
+            )
+            return bool(fn(*args, **kwargs))
+        return True
+
+    def enqueue_email(self, **kwargs: Any) -> bool:
+        """Queue a :meth:`send_email` call without waiting for delivery."""
+        return self.submit(self.send_email, **kwargs)
+
+    @property
+    def pending_sends(self) -> int:
+        """Number of sends waiting in the background queue."""
+        return self._send_queue.qsize()
+
+    def _ensure_workers(self) -> None:
+        if self._workers:
+            return
+        with self._workers_lock:
+            if self._workers:
+                return
+            for i in range(self._worker_count):
+                # Daemon threads: queued mail must not block interpreter exit
+                worker = threading.Thread(
+                    target=self._worker_loop, name=f"email-worker-{i}", daemon=True
+                )
+                worker.start()
+                self._workers.append(worker)
+
+    def _worker_loop(self) -> None:
+        _send_context.background = True
+        while True:
+            fn, args, kwargs, app = self._send_queue.get()
+            try:
+                if app is None:
+                    fn(*args, **kwargs)
+                else:
+                    with app.app_context():
+                        fn(*args, **kwargs)
+            except Exception as e:
+                logger.error("Background email send failed: %s", e)
+            finally:
+                self._send_queue.task_done()
+
     # ------------------------------------------------------------------
     # Retry / queue helpers
     # ------------------------------------------------------------------
@@ -393,6 +793,7 @@ class EmailService:
         context: Optional[Dict[str, Any]] = None,
         email_type: str = "custom",
         template_name: Optional[str] = None,
+        last_error: Optional[str] = None,
     ) -> None:
         """Add a failed email to the retry queue (thread-safe)."""
         entry = FailedEmail(
@@ -405,7 +806,7 @@ class EmailService:
             bcc_emails=list(bcc_emails) if bcc_emails else None,
             attachments=attachments,
             attempts=self.max_retries,
-            last_error=self.last_error or "unknown",
+            last_error=last_error or "unknown",
             context=context,
             email_type=email_type,
             template_name=template_name,
@@ -460,7 +861,9 @@ class EmailService:
         still_failed: List[FailedEmail] = []
 
         for entry in pending:
-            ok = self.send_email(
+            result = _SendResult()
+            ok = self._send_email(
+                result,
                 to_emails=entry.to_emails,
                 subject=entry.subject,
                 body_text=entry.body_text,
@@ -472,19 +875,14 @@ class EmailService:
                 context=entry.context,
                 email_type=entry.email_type,
                 template_name=entry.template_name,
+                # Re-added below with an updated attempt count instead
+                enqueue_on_failure=False,
             )
             if ok:
                 succeeded += 1
             else:
-                # send_email already re-enqueues on failure; pop it back so we
-                # don't double-enqueue.  We'll re-add the original entry with
-                # an updated attempt count instead.
-                with self._queue_lock:
-                    # Remove the auto-enqueued entry (the last one)
-                    if self._failed_queue:
-                        self._failed_queue.pop()
                 entry.attempts += self.max_retries
-                entry.last_error = self.last_error or "retry failed"
+                entry.last_error = result.error or "retry failed"
                 still_failed.append(entry)
 
         # Re-enqueue entries that still failed
@@ -503,8 +901,28 @@ class EmailService:
     # Core send with retry
     # ------------------------------------------------------------------
 
-    def send_email(
+    def send_email(self, *args: Any, **kwargs: Any) -> bool:
+        """Send email with retry and exponential backoff.
+
+        Tries ACS first (if configured) with up to *max_retries* attempts,
+        then falls back to SMTP with the same retry policy.  Emails that
+        exhaust all retries are placed on the failed-email queue for later
+        retry via :meth:`retry_failed` (unless ``enqueue_on_failure=False``).
+
+        Takes the :meth:`_send_email` arguments after *result*.  The outcome
+        is copied to the ``last_*`` attributes for synchronous callers; sends
+        on the background workers leave them alone.
+        """
+        result = _SendResult()
+        try:
+            return self._send_email(result, *args, **kwargs)
+        finally:
+            if not getattr(_send_context, "background", False):
+                self._publish_result(result)
+
+    def _send_email(
         self,
+        result: _SendResult,
         to_emails: List[str],
         subject: str,
         body_text: Optional[str] = None,
@@ -516,19 +934,13 @@ class EmailService:
         context: Optional[Dict[str, Any]] = None,
         email_type: str = "custom",
         template_name: Optional[str] = None,
+        enqueue_on_failure: bool = True,
     ) -> bool:
-        """Send email with retry and exponential backoff.
-
-        Tries ACS first (if configured) with up to *max_retries* attempts,
-        then falls back to SMTP with the same retry policy.  Emails that
-        exhaust all retries are placed on the failed-email queue for later
-        retry via :meth:`retry_failed`.
-        """
+        """Core of :meth:`send_email`; records the outcome on *result* only."""
         _is_test_mode = False
         _original_recipients = None
 
         try:
-            self._reset_last_result()
 
             # =============================================================
             # Kill switch — blocks ALL outbound email instantly
@@ -544,14 +956,14 @@ class EmailService:
                     "EMAIL KILL SWITCH: Blocked email to %s "
                     "(subject: %s)", to_emails, subject,
                 )
-                self.last_error = "Email kill switch is active"
-                self.last_status = "blocked"
+                result.error = "Email kill switch is active"
+                result.status = "blocked"
                 return False
 
             # -- Validate inputs --
             if not to_emails:
                 logger.error("No recipient emails provided")
-                self.last_error = "No recipient emails provided"
+                result.error = "No recipient emails provided"
                 return False
             if not subject:
                 logger.error("No email subject provided")
@@ -563,8 +975,8 @@ class EmailService:
             sender_email = (
                 from_email or self.acs_sender_email or self.default_sender or ""
             )
-            self.last_sender = sender_email
-            self.last_recipients = list(to_emails)
+            result.sender = sender_email
+            result.recipients = list(to_emails)
 
             # =============================================================
             # Test-mode interception (before any provider logic)
@@ -640,27 +1052,20 @@ class EmailService:
                 if body_html:
                     body_html = info_html + body_html
 
-                self.last_recipients = [test_addr]
+                result.recipients = [test_addr]
 
             # =============================================================
             # ACS attempt (with retry)
             # =============================================================
-            acs_client = self._get_acs_client()
-            if acs_client and self.acs_sender_email:
-                self.last_provider = "ACS"
+            if self._acs_ready and (acs_client := self._get_acs_client()) is not None:
+                result.provider = "ACS"
 
                 # Build ACS message payload (once)
-                acs_recipients: Dict[str, Any] = {
-                    "to": [{"address": addr} for addr in to_emails]
-                }
+                acs_recipients: Dict[str, Any] = {"to": _acs_addrs(to_emails)}
                 if cc_emails:
-                    acs_recipients["cc"] = [
-                        {"address": addr} for addr in cc_emails
-                    ]
+                    acs_recipients["cc"] = _acs_addrs(cc_emails)
                 if bcc_emails:
-                    acs_recipients["bcc"] = [
-                        {"address": addr} for addr in bcc_emails
-                    ]
+                    acs_recipients["bcc"] = _acs_addrs(bcc_emails)
                 content: Dict[str, str] = {"subject": subject}
                 if body_text:
                     content["plainText"] = body_text
@@ -675,17 +1080,17 @@ class EmailService:
                 for attempt in range(self.max_retries):
                     try:
                         operation = acs_client.begin_send(acs_message)
-                        result = operation.result()
+                        acs_result = operation.result()
 
                         # Extract message ID
                         message_id = None
-                        if hasattr(result, "message_id"):
-                            message_id = getattr(result, "message_id", None)
-                        elif isinstance(result, dict):
+                        if hasattr(acs_result, "message_id"):
+                            message_id = getattr(acs_result, "message_id", None)
+                        elif isinstance(acs_result, dict):
                             message_id = (
-                                result.get("messageId") or result.get("id")
+                                acs_result.get("messageId") or acs_result.get("id")
                             )
-                        self.last_message_id = message_id
+                        result.message_id = message_id
 
                         # Fetch status if supported
                         status_value = None
@@ -706,7 +1111,7 @@ class EmailService:
                             status_value = None
 
                         normalized = str(status_value or "queued").lower()
-                        self.last_status = normalized
+                        result.status = normalized
 
                         if normalized in (
                             "queued",
@@ -730,6 +1135,7 @@ class EmailService:
                                 template_name=template_name,
                                 test_mode=_is_test_mode,
                                 original_recipients=_original_recipients,
+                                result=result,
                             )
                             return True
 
@@ -743,7 +1149,7 @@ class EmailService:
                         break
 
                     except AzureError as e:
-                        self.last_error = f"ACS error: {e}"
+                        result.error = f"ACS error: {e}"
                         if attempt < self.max_retries - 1:
                             delay = self.retry_base_delay * (2 ** attempt)
                             logger.warning(
@@ -763,7 +1169,7 @@ class EmailService:
                                 e,
                             )
                     except Exception as e:
-                        self.last_error = f"ACS unexpected error: {e}"
+                        result.error = f"ACS unexpected error: {e}"
                         logger.error(
                             "Unexpected ACS error: %s. Falling back to SMTP.",
                             e,
@@ -773,7 +1179,7 @@ class EmailService:
             # =============================================================
             # SMTP attempt (with retry)
             # =============================================================
-            self.last_provider = "SMTP"
+            result.provider = "SMTP"
             if not (self.username and self.password):
                 logger.error(
                     "SMTP fallback unavailable: missing credentials. "
@@ -781,7 +1187,7 @@ class EmailService:
                     "SMTP_USERNAME/SMTP_PASSWORD "
                     "(or GMAIL_USER/GMAIL_APP_PASSWORD)."
                 )
-                self.last_error = "Missing SMTP credentials"
+                result.error = "Missing SMTP credentials"
                 self._log_email(
                     to_emails=to_emails, subject=subject, status="queued",
                     body_text=body_text, body_html=body_html,
@@ -789,63 +1195,52 @@ class EmailService:
                     cc_emails=cc_emails, bcc_emails=bcc_emails,
                     context=context, email_type=email_type,
                     template_name=template_name,
-                    error_message=self.last_error,
+                    error_message=result.error,
                     test_mode=_is_test_mode,
                     original_recipients=_original_recipients,
+                    result=result,
                 )
-                self._enqueue_failed(
-                    to_emails, subject, body_text, body_html,
-                    from_email, cc_emails, bcc_emails, attachments,
-                    context=context, email_type=email_type,
-                    template_name=template_name,
-                )
+                if enqueue_on_failure:
+                    self._enqueue_failed(
+                        to_emails, subject, body_text, body_html,
+                        from_email, cc_emails, bcc_emails, attachments,
+                        context=context, email_type=email_type,
+                        template_name=template_name, last_error=result.error,
+                    )
                 return False
 
             # Build MIME message (once)
-            msg = MIMEMultipart("alternative")
-            msg["From"] = sender_email
-            msg["To"] = ", ".join(to_emails)
-            msg["Subject"] = subject
-            if cc_emails:
-                msg["Cc"] = ", ".join(cc_emails)
-            if bcc_emails:
-                msg["Bcc"] = ", ".join(bcc_emails)
-            if body_text:
-                msg.attach(MIMEText(body_text, "plain", "utf-8"))
-            if body_html:
-                msg.attach(MIMEText(body_html, "html", "utf-8"))
-            if attachments:
-                for att in attachments:
-                    if "filename" in att and "content" in att:
-                        part = MIMEBase("application", "octet-stream")
-                        part.set_payload(att["content"])
-                        encoders.encode_base64(part)
-                        part.add_header(
-                            "Content-Disposition",
-                            f'attachment; filename= {att["filename"]}',
-                        )
-                        msg.attach(part)
+            msg = _build_smtp_message(
+                sender_email, to_emails, subject, cc_emails, bcc_emails,
+                body_text, body_html, attachments,
+            )
 
-            all_recipients = list(to_emails)
-            if cc_emails:
-                all_recipients.extend(cc_emails)
-            if bcc_emails:
-                all_recipients.extend(bcc_emails)
+            # send_message never mutates to_addrs, so reuse to_emails when alone
+            all_recipients = (
+                [*to_emails, *(cc_emails or ()), *(bcc_emails or ())]
+                if cc_emails or bcc_emails
+                else to_emails
+            )
 
             for attempt in range(self.max_retries):
                 try:
-                    server = self._create_smtp_connection()
-                    try:
-                        server.send_message(msg, to_addrs=all_recipients)
-                    finally:
-                        server.quit()
+                    with self._smtp_lock:
+                        server = self._get_smtp()
+                        try:
+                            server.send_message(msg, to_addrs=all_recipients)
+                        except Exception:
+                            self._drop_smtp()
+                            raise
+                        self._smtp_sends += 1
+                        if self._smtp_sends >= _SMTP_MAX_SENDS_PER_CONNECTION:
+                            self._drop_smtp()
 
                     logger.info(
                         "SMTP email sent to %d recipients: %s",
                         len(all_recipients),
                         subject,
                     )
-                    self.last_status = "sent"
+                    result.status = "sent"
                     self._log_email(
                         to_emails=to_emails, subject=subject, status="sent",
                         body_text=body_text, body_html=body_html,
@@ -855,10 +1250,11 @@ class EmailService:
                         template_name=template_name,
                         test_mode=_is_test_mode,
                         original_recipients=_original_recipients,
+                        result=result,
                     )
                     return True
                 except Exception as e:
-                    self.last_error = str(e)
+                    result.error = str(e)
                     if attempt < self.max_retries - 1:
                         delay = self.retry_base_delay * (2 ** attempt)
                         logger.warning(
@@ -885,40 +1281,93 @@ class EmailService:
                 cc_emails=cc_emails, bcc_emails=bcc_emails,
                 context=context, email_type=email_type,
                 template_name=template_name,
-                error_message=self.last_error,
+                error_message=result.error,
                 test_mode=_is_test_mode,
                 original_recipients=_original_recipients,
+                result=result,
             )
-            self._enqueue_failed(
-                to_emails, subject, body_text, body_html,
-                from_email, cc_emails, bcc_emails, attachments,
-                context=context, email_type=email_type,
-                template_name=template_name,
-            )
+            if enqueue_on_failure:
+                self._enqueue_failed(
+                    to_emails, subject, body_text, body_html,
+                    from_email, cc_emails, bcc_emails, attachments,
+                    context=context, email_type=email_type,
+                    template_name=template_name, last_error=result.error,
+                )
             return False
 
         except Exception as e:
-            self.last_error = str(e)
+            result.error = str(e)
             logger.error("Failed to send email: %s", e)
             self._log_email(
                 to_emails=to_emails, subject=subject, status="failed",
                 body_text=body_text, body_html=body_html,
-                from_email=from_email or "",
+                from_email=from_email or result.sender or "",
                 cc_emails=cc_emails, bcc_emails=bcc_emails,
                 context=context, email_type=email_type,
                 template_name=template_name,
                 error_message=str(e)[:1024],
                 test_mode=_is_test_mode,
                 original_recipients=_original_recipients,
+                result=result,
             )
-            self._enqueue_failed(
-                to_emails, subject, body_text, body_html,
-                from_email, cc_emails, bcc_emails, attachments,
-                context=context, email_type=email_type,
-                template_name=template_name,
-            )
+            if enqueue_on_failure:
+                self._enqueue_failed(
+                    to_emails, subject, body_text, body_html,
+                    from_email, cc_emails, bcc_emails, attachments,
+                    context=context, email_type=email_type,
+                    template_name=template_name, last_error=result.error,
+                )
             return False
 
+    # ------------------------------------------------------------------
+    # Concurrent fan-out
+    # ------------------------------------------------------------------
+
+    async def send_email_async(self, **kwargs: Any) -> bool:
+        """Run :meth:`send_email` on a worker thread without blocking the loop.
+
+        Accepts the same keyword arguments as :meth:`send_email`.  The caller's
+        Flask app context (if any) is re-entered on the worker so email logging
+        still reaches the database.
+        """
+        app = _current_flask_app()
+
+        def _run() -> bool:
+            # Concurrent sends keep their results per call; last_* is left
+            # to synchronous callers
+            _send_context.background = True
+            try:
+                if app is None:
+                    return self.send_email(**kwargs)
+                with app.app_context():
+                    return self.send_email(**kwargs)
+            finally:
+                _send_context.background = False
+
+        return await asyncio.to_thread(_run)
+
+    async def _bounded_send(
+        self, sem: asyncio.Semaphore, message: Dict[str, Any]
+    ) -> bool:
+        async with sem:
+            return await self.send_email_async(**message)
+
+    async def send_many(
+        self, messages: List[Dict[str, Any]], max_concurrent: int = 20
+    ) -> List[bool]:
+        """Send many emails concurrently, at most *max_concurrent* in flight.
+
+        Each entry in *messages* is a dict of :meth:`send_email` keyword
+        arguments.  Returns one success flag per message, in input order;
+        the ``last_*`` diagnostics are not updated.
+        """
+        if not messages:
+            return []
+        sem = asyncio.Semaphore(max(1, int(max_concurrent)))
+        return list(
+            await asyncio.gather(*(self._bounded_send(sem, m) for m in messages))
+        )
+
     def _log_email(
         self,
         to_emails: List[str],
@@ -935,6 +1384,7 @@ class EmailService:
         error_message: Optional[str] = None,
         test_mode: bool = False,
         original_recipients: Optional[Dict] = None,
+        result: Optional[_SendResult] = None,
     ) -> None:
         """Persist email send attempt to database. Never raises."""
         try:
@@ -950,16 +1400,17 @@ class EmailService:
             from models import EmailLog, db
 
             ctx = context or {}
+            result = result or _SendResult()
             log = EmailLog(
-                message_id=self.last_message_id,
+                message_id=result.message_id,
                 email_type=email_type,
                 subject=subject[:512] if subject else "",
-                from_email=from_email or self.last_sender or "",
+                from_email=from_email or result.sender or "",
                 to_emails=_json.dumps(to_emails),
                 cc_emails=_json.dumps(cc_emails) if cc_emails else None,
                 bcc_emails=_json.dumps(bcc_emails) if bcc_emails else None,
                 status=status,
-                provider=self.last_provider,
+                provider=result.provider,
                 error_message=str(error_message)[:1024] if error_message else None,
                 rfpo_id=ctx.get("rfpo_id"),
                 project_id=ctx.get("project_id"),
@@ -1005,16 +1456,16 @@ class EmailService:
         """
         try:
             # Load template
-            template = self.jinja_env.get_template(f"{template_name}.html")
+            template = self._templates.get(
+                template_name
+            ) or self.jinja_env.get_template(f"{template_name}.html")
 
             # Prepare template data
+            # Caller-supplied date fields win; fill the rest from one clock read
             data = template_data or {}
-            data.update(
-                {
-                    "current_date": datetime.now(_eastern).strftime("%Y-%m-%d"),
-                    "current_year": datetime.now(_eastern).year,
-                }
-            )
+            now = datetime.now(_eastern)
+            data.setdefault("current_date", now.strftime("%Y-%m-%d"))
+            data.setdefault("current_year", now.year)
 
             # Render template
             html_content = template.render(**data)
@@ -1022,25 +1473,13 @@ class EmailService:
             # Extract subject from template if not provided
             if not subject:
                 # Try to extract subject from template data or use default
-                subject = data.get(
-                    "subject", f"RFPO Application - {template_name.title()}"
+                subject = (
+                    data.get("subject")
+                    or f"RFPO Application - {template_name.title()}"
                 )
 
             # Create plain text version
-            # Preserve hyperlinks by converting <a href="URL">Text</a> to
-            # "Text (URL)" before stripping remaining tags.
-            import re
-
-            # Replace anchor tags with "text (url)"
-            anchor_pattern = re.compile(
-                r"<a\s+[^>]*href=[\"']([^\"']+)[\"'][^>]*>(.*?)</a>",
-                flags=re.IGNORECASE | re.DOTALL,
-            )
-            interim = anchor_pattern.sub(r"\2 (\1)", html_content)
-
-            # Strip remaining HTML tags
-            text_content = re.sub("<[^<]+?>", "", interim)
-            text_content = re.sub(r"\n\s*\n", "\n\n", text_content)
+            text_content = _html_to_text(html_content)
 
             # Send email
             return self.send_email(
@@ -1060,6 +1499,38 @@ class EmailService:
             logger.error(f"Failed to send templated email: {str(e)}")
             return False
 
+    def send_bulk_templated(
+        self,
+        template_name: str,
+        recipients: List[Dict[str, Any]],
+        common_data: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> List[bool]:
+        """
+        Send one templated email per recipient over a single SMTP session
+
+        Args:
+            template_name: Name of template file (without .html extension)
+            recipients: Per-recipient template data; each needs an ``email`` key
+            common_data: Template data shared by every recipient
+            **kwargs: Extra :meth:`send_templated_email` arguments
+
+        Returns:
+            List[bool]: Send result for each recipient, in order
+        """
+        common_data = common_data or {}
+        # As in send_batch, each send reuses the cached session and locks it
+        # only for the SMTP I/O, not for rendering or the kill-switch lookup
+        return [
+            self.send_templated_email(
+                to_emails=[recipient["email"]],
+                template_name=template_name,
+                template_data={**common_data, **recipient},
+                **kwargs,
+            )
+            for recipient in recipients
+        ]
+
     def send_welcome_email(
         self,
         user_email: str,
@@ -1081,16 +1552,8 @@ class EmailService:
             bool: True if email sent successfully, False otherwise
         """
         # Resolve app login URLs
-        user_login_url = (
-            os.environ.get("USER_APP_URL")
-            or os.environ.get("APP_URL")
-            or "http://localhost:5000"
-        ) + "/login"
-        admin_login_url = (
-            os.environ.get("ADMIN_APP_URL")
-            or os.environ.get("APP_URL")
-            or "http://localhost:5111"
-        ) + "/login"
+        user_login_url = self.user_login_url
+        admin_login_url = self.admin_login_url
 
         # Defaults: previous behavior shows only user link if not specified
         show_user = True if show_user_link is None else bool(show_user_link)
@@ -1107,7 +1570,7 @@ class EmailService:
             "admin_login_url": admin_login_url,
             "show_user_link": show_user,
             "show_admin_link": show_admin,
-            "support_email": os.environ.get("SUPPORT_EMAIL", "support@rfpo.com"),
+            "support_email": self.support_email,
             "subject": "Welcome to RFPO Application - Your Account is Ready",
         }
 
@@ -1137,21 +1600,17 @@ class EmailService:
         Returns:
             bool: True if email sent successfully, False otherwise
         """
+        now = datetime.now(_eastern)
         template_data = {
             "user_name": user_name,
             "user_email": user_email,
             "change_ip": change_ip,
-            "change_timestamp": datetime.now(_eastern).strftime("%B %d, %Y at %I:%M %p %Z"),
-            "current_date": datetime.now(_eastern).strftime("%B %d, %Y"),
-            "current_time": datetime.now(_eastern).strftime("%I:%M %p %Z"),
-            "current_year": datetime.now(_eastern).year,
-            "login_url": (
-                os.environ.get("USER_APP_URL")
-                or os.environ.get("APP_URL")
-                or "http://localhost:5000"
-            )
-            + "/login",
-            "support_email": os.environ.get("SUPPORT_EMAIL", "support@rfpo.com"),
+            "change_timestamp": now.strftime("%B %d, %Y at %I:%M %p %Z"),
+            "current_date": now.strftime("%B %d, %Y"),
+            "current_time": now.strftime("%I:%M %p %Z"),
+            "current_year": now.year,
+            "login_url": self.user_login_url,
+            "support_email": self.support_email,
             "subject": ("Password Changed - RFPO Application Security Notification"),
         }
 
@@ -1185,13 +1644,8 @@ class EmailService:
         Returns:
             bool: True if email sent successfully, False otherwise
         """
-        user_app_base = (
-            os.environ.get("USER_APP_URL")
-            or os.environ.get("APP_URL")
-            or "http://localhost:5000"
-        )
         # Link to user app detail page if db ID available, else dashboard
-        rfpo_link = f"{user_app_base}/rfpos/{rfpo_db_id}" if rfpo_db_id else f"{user_app_base}/rfpos"
+        rfpo_link = f"{self.rfpos_url}/{rfpo_db_id}" if rfpo_db_id else self.rfpos_url
         template_data = {
             "user_name": user_name,
             "rfpo_id": rfpo_id,
@@ -1222,12 +1676,7 @@ class EmailService:
         context: Optional[Dict[str, Any]] = None,
     ) -> bool:
         """Send approval reminder email for overdue actions"""
-        user_app_base = (
-            os.environ.get("USER_APP_URL")
-            or os.environ.get("APP_URL")
-            or "http://localhost:5000"
-        )
-        rfpo_link = f"{user_app_base}/rfpos/{rfpo_db_id}" if rfpo_db_id else f"{user_app_base}/rfpos"
+        rfpo_link = f"{self.rfpos_url}/{rfpo_db_id}" if rfpo_db_id else self.rfpos_url
         subject = f"Reminder {reminder_number}/{max_reminders}: RFPO Approval Overdue - {rfpo_id}"
         template_data = {
             "user_name": user_name,
@@ -1264,12 +1713,7 @@ class EmailService:
         context: Optional[Dict[str, Any]] = None,
     ) -> bool:
         """Send escalation notification email"""
-        user_app_base = (
-            os.environ.get("USER_APP_URL")
-            or os.environ.get("APP_URL")
-            or "http://localhost:5000"
-        )
-        rfpo_link = f"{user_app_base}/rfpos/{rfpo_db_id}" if rfpo_db_id else f"{user_app_base}/rfpos"
+        rfpo_link = f"{self.rfpos_url}/{rfpo_db_id}" if rfpo_db_id else self.rfpos_url
         subject = f"ESCALATED: RFPO Approval Overdue - {rfpo_id}"
         template_data = {
             "user_name": user_name,
@@ -1315,12 +1759,7 @@ class EmailService:
             "user_name": user_name,
             "project_name": project_name,
             "role": role,
-            "projects_url": (
-                os.environ.get("USER_APP_URL")
-                or os.environ.get("APP_URL")
-                or "http://localhost:5000"
-            )
-            + "/dashboard",
+            "projects_url": self.projects_url,
             "subject": f"Added to Project: {project_name}",
         }
 
@@ -1331,6 +1770,34 @@ class EmailService:
             subject=template_data["subject"],
         )
 
+    def send_users_added_to_project(
+        self,
+        users: List[Dict[str, str]],
+        project_name: str,
+        role: str,
+    ) -> List[bool]:
+        """
+        Notify several users that they were added to a project
+
+        Args:
+            users: Dicts with ``email`` and ``name`` keys
+            project_name: Name of the project
+            role: Users' role in the project
+
+        Returns:
+            List[bool]: Send result for each user, in order
+        """
+        return self.send_bulk_templated(
+            "user_added_to_project",
+            [{"email": u["email"], "user_name": u["name"]} for u in users],
+            {
+                "project_name": project_name,
+                "role": role,
+                "projects_url": self.projects_url,
+                "subject": f"Added to Project: {project_name}",
+            },
+        )
+
     def test_connection(self) -> bool:
         """
         Test email service connection
@@ -1353,11 +1820,17 @@ class EmailService:
 
 # Global email service instance
 email_service = EmailService()
+atexit.register(email_service.close)
 
 
 # Convenience functions
 
 
+def _call(fn, *args: Any, **kwargs: Any) -> bool:
+    """Synchronous counterpart of ``EmailService.submit``."""
+    return fn(*args, **kwargs)
+
+
 def send_welcome_email(
     user_email: str,
     user_name: str,
@@ -1365,14 +1838,18 @@ def send_welcome_email(
     show_user_link: Optional[bool] = None,
     show_admin_link: Optional[bool] = None,
     context: Optional[Dict[str, Any]] = None,
+    background: bool = False,
 ) -> bool:
     """
     Send welcome email to new user, optionally controlling which links show.
 
     When flags are None, defaults match prior behavior:
-    show user link only.
+    show user link only.  With ``background=True`` the email is queued for
+    a worker thread and True means "queued", not "delivered".
     """
-    return email_service.send_welcome_email(
+    send = email_service.submit if background else _call
+    return send(
+        email_service.send_welcome_email,
         user_email,
         user_name,
         temp_password,
@@ -1401,9 +1878,12 @@ def send_approval_notification(
     approval_type: str,
     rfpo_db_id: Optional[int] = None,
     context: Optional[Dict[str, Any]] = None,
+    background: bool = False,
 ) -> bool:
-    """Send approval notification email"""
-    return email_service.send_approval_notification(
+    """Send approval notification email (queued when ``background=True``)"""
+    send = email_service.submit if background else _call
+    return send(
+        email_service.send_approval_notification,
         user_email, user_name, rfpo_id, approval_type,
         rfpo_db_id=rfpo_db_id, context=context,
     )
@@ -1414,13 +1894,33 @@ def send_user_added_to_project_email(
     user_name: str,
     project_name: str,
     role: str,
+    background: bool = False,
 ) -> bool:
-    """Send notification when user is added to a project"""
-    return email_service.send_user_added_to_project_email(
-        user_email, user_name, project_name, role
+    """Send notification when user is added to a project (queued when ``background=True``)"""
+    send = email_service.submit if background else _call
+    return send(
+        email_service.send_user_added_to_project_email,
+        user_email, user_name, project_name, role,
     )
 
 
+def send_users_added_to_project(
+    users: List[Dict[str, str]], project_name: str, role: str
+) -> List[bool]:
+    """Notify several users added to a project over one SMTP session"""
+    return email_service.send_users_added_to_project(users, project_name, role)
+
+
+def send_bulk_emails(
+    messages: List[Dict[str, Any]], max_concurrent: int = 20
+) -> List[bool]:
+    """Send a batch of emails concurrently from synchronous code.
+
+    Each message is a dict of ``send_email`` keyword arguments.
+    """
+    return asyncio.run(email_service.send_many(messages, max_concurrent))
+
+
 def test_email_connection() -> bool:
     """Test email service connection"""
     return email_service.test_connection()
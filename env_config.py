@@ -64,6 +64,11 @@ def get_database_url() -> str:
     return db_url
 
 
+# Azure Database for PostgreSQL drops connections idle for ~4 minutes;
+# pools recycle theirs before that (pair with pool_pre_ping)
+DB_POOL_RECYCLE_SECONDS = 180
+
+
 def get_secret_key(key_name: str = "FLASK_SECRET_KEY") -> str:
     """
     Get secret key with validation
@@ -125,12 +130,98 @@ def validate_configuration():
         )
 
 
+_TRUE_STRINGS = frozenset(("true", "1", "yes", "on"))
+# Common spellings resolve with one dict lookup; anything else is normalised.
+_BOOL_STRINGS = {
+    **{v: True for v in ("true", "True", "TRUE", "1", "yes", "Yes", "on", "On")},
+    **{v: False for v in ("false", "False", "FALSE", "0", "no", "No", "off", "Off", "")},
+}
+
+
+def _as_bool(value: str) -> bool:
+    parsed = _BOOL_STRINGS.get(value)
+    if parsed is None:
+        parsed = str(value).strip().lower() in _TRUE_STRINGS
+    return parsed
+
+
+def _as_set(value: str) -> set:
+    return set(value.split(","))
+
+
+# Lazily resolved Config attributes: name -> (default, cast).
+# The environment variable name always matches the attribute name.
+_SPEC = {
+    # Database
+    "DATABASE_URL": (None, None),
+    # Application
+    "FLASK_ENV": ("production", None),
+    "DEBUG": ("False", _as_bool),
+    # API URLs
+    "API_BASE_URL": ("http://127.0.0.1:5002/api", None),
+    "ADMIN_API_URL": ("http://127.0.0.1:5111/api", None),
+    # File Uploads
+    "UPLOAD_FOLDER": ("uploads", None),
+    "MAX_CONTENT_LENGTH": ("16777216", int),
+    "ALLOWED_EXTENSIONS": ("csv,xlsx,xls,pdf", _as_set),
+    # Security
+    "PASSWORD_MIN_LENGTH": ("12", int),
+    "PASSWORD_MAX_LENGTH": ("128", int),
+    "LOGIN_ATTEMPT_LIMIT": ("5", int),
+    "TOKEN_EXPIRY_HOURS": ("24", int),
+    "ACCOUNT_LOCKOUT_MINUTES": ("30", int),
+    # Werkzeug generate_password_hash method for seeded accounts; dev/CI can
+    # use a cheaper cost (e.g. "pbkdf2:sha256:100000") to speed up init
+    "PASSWORD_HASH_METHOD": ("scrypt", None),
+    # Email
+    "MAIL_SERVER": ("localhost", None),
+    "MAIL_PORT": ("587", int),
+    "MAIL_USE_TLS": ("True", _as_bool),
+    "MAIL_USERNAME": (None, None),
+    "MAIL_PASSWORD": (None, None),
+    "MAIL_DEFAULT_SENDER": ("noreply@localhost", None),
+    # Logging
+    "LOG_LEVEL": ("INFO", None),
+    "LOG_MAX_BYTES": ("10485760", int),
+    "LOG_BACKUP_COUNT": ("3", int),
+    # Session Security
+    "SESSION_COOKIE_SECURE": ("False", _as_bool),
+    "SESSION_COOKIE_HTTPONLY": ("True", _as_bool),
+    "SESSION_COOKIE_SAMESITE": ("Lax", None),
+    "FORCE_HTTPS": ("False", _as_bool),
+    # Azure (optional)
+    "AZURE_SUBSCRIPTION_ID": (None, None),
+    "AZURE_RESOURCE_GROUP": (None, None),
+    "AZURE_LOCATION": ("eastus", None),
+    # Azure OpenAI (blank values fall back to the defaults)
+    "AZURE_OPENAI_ENDPOINT": (None, None),
+    "AZURE_OPENAI_KEY": (None, None),
+    "AZURE_OPENAI_DEPLOYMENT": (None, lambda v: v or "gpt-4o"),
+    "AZURE_OPENAI_BUDGET_LIMIT": (None, lambda v: float(v or "100.00")),
+}
+
+
 # Configuration values with defaults
 class Config:
-    """Centralized configuration class"""
+    """Centralized configuration class
 
-    # Database
-    DATABASE_URL = get_env("DATABASE_URL")
+    Plain settings (see ``_SPEC``) are read from the environment on first
+    access and cached on the instance, so importing this module does not
+    touch them.
+    """
+
+    def __getattr__(self, name):
+        try:
+            default, cast = _SPEC[name]
+        except KeyError:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            ) from None
+        value = get_env(name, default)
+        if cast is not None:
+            value = cast(value)
+        self.__dict__[name] = value
+        return value
 
     # Secret Keys (will validate on access)
     @property
@@ -149,60 +240,6 @@ class Config:
     def API_SECRET_KEY(self):
         return get_env("API_SECRET_KEY", self.FLASK_SECRET_KEY)
 
-    # Application
-    FLASK_ENV = get_env("FLASK_ENV", "production")
-    DEBUG = get_env("DEBUG", "False").lower() == "true"
-
-    # API URLs
-    API_BASE_URL = get_env("API_BASE_URL", "http://127.0.0.1:5002/api")
-    ADMIN_API_URL = get_env("ADMIN_API_URL", "http://127.0.0.1:5111/api")
-
-    # File Uploads
-    UPLOAD_FOLDER = get_env("UPLOAD_FOLDER", "uploads")
-    MAX_CONTENT_LENGTH = int(get_env("MAX_CONTENT_LENGTH", "16777216"))
-    ALLOWED_EXTENSIONS = set(
-        get_env("ALLOWED_EXTENSIONS", "csv,xlsx,xls,pdf").split(",")
-    )
-
-    # Security
-    PASSWORD_MIN_LENGTH = int(get_env("PASSWORD_MIN_LENGTH", "12"))
-    PASSWORD_MAX_LENGTH = int(get_env("PASSWORD_MAX_LENGTH", "128"))
-    LOGIN_ATTEMPT_LIMIT = int(get_env("LOGIN_ATTEMPT_LIMIT", "5"))
-    TOKEN_EXPIRY_HOURS = int(get_env("TOKEN_EXPIRY_HOURS", "24"))
-    ACCOUNT_LOCKOUT_MINUTES = int(get_env("ACCOUNT_LOCKOUT_MINUTES", "30"))
-
-    # Email
-    MAIL_SERVER = get_env("MAIL_SERVER", "localhost")
-    MAIL_PORT = int(get_env("MAIL_PORT", "587"))
-    MAIL_USE_TLS = get_env("MAIL_USE_TLS", "True").lower() == "true"
-    MAIL_USERNAME = get_env("MAIL_USERNAME")
-    MAIL_PASSWORD = get_env("MAIL_PASSWORD")
-    MAIL_DEFAULT_SENDER = get_env("MAIL_DEFAULT_SENDER", "noreply@localhost")
-
-    # Logging
-    LOG_LEVEL = get_env("LOG_LEVEL", "INFO")
-    LOG_MAX_BYTES = int(get_env("LOG_MAX_BYTES", "10485760"))
-    LOG_BACKUP_COUNT = int(get_env("LOG_BACKUP_COUNT", "3"))
-
-    # Session Security
-    SESSION_COOKIE_SECURE = get_env("SESSION_COOKIE_SECURE", "False").lower() == "true"
-    SESSION_COOKIE_HTTPONLY = (
-        get_env("SESSION_COOKIE_HTTPONLY", "True").lower() == "true"
-    )
-    SESSION_COOKIE_SAMESITE = get_env("SESSION_COOKIE_SAMESITE", "Lax")
-    FORCE_HTTPS = get_env("FORCE_HTTPS", "False").lower() == "true"
-
-    # Azure (optional)
-    AZURE_SUBSCRIPTION_ID = get_env("AZURE_SUBSCRIPTION_ID")
-    AZURE_RESOURCE_GROUP = get_env("AZURE_RESOURCE_GROUP")
-    AZURE_LOCATION = get_env("AZURE_LOCATION", "eastus")
-
-    # Azure OpenAI
-    AZURE_OPENAI_ENDPOINT = get_env("AZURE_OPENAI_ENDPOINT")
-    AZURE_OPENAI_KEY = get_env("AZURE_OPENAI_KEY")
-    AZURE_OPENAI_DEPLOYMENT = get_env("AZURE_OPENAI_DEPLOYMENT") or "gpt-4o"
-    AZURE_OPENAI_BUDGET_LIMIT = float(get_env("AZURE_OPENAI_BUDGET_LIMIT") or "100.00")
-
 
 # Create singleton instance
 config = Config()
@@ -5,7 +5,9 @@ Provides centralized error handling for Flask applications with proper
 logging and user-friendly error responses.
 """
 
-from flask import jsonify, render_template, request
+import logging
+
+from flask import g, jsonify, request
 from werkzeug.exceptions import HTTPException
 from sqlalchemy.exc import SQLAlchemyError
 from exceptions import (
@@ -19,6 +21,91 @@ from exceptions import (
 from logging_config import get_logger, log_exception
 
 
+_DB_ERROR_JSON = "A database error occurred. Please try again later."
+_DB_ERROR_HTML = "Database error. Please try again later."
+
+
+def _message(error):
+    return error.message
+
+
+def _class_name(error):
+    return error.__class__.__name__
+
+
+def _status(error):
+    return error.status_code
+
+
+def _http_status(error):
+    return error.code
+
+
+def _http_description(error):
+    return error.description
+
+
+def _http_name(error):
+    return error.name
+
+
+# One row per handler, in registration order:
+#   (exception class or HTTP status,
+#    log: "exception" for log_exception, else (level, format, args(error)),
+#    log context keys drawn from path/method/ip,
+#    status code, JSON "error", JSON "error_type", HTML message,
+#    JSON key for error.payload (or None))
+# Status/message/type entries are constants or callables taking the error.
+_HANDLER_SPEC = (
+    (RFPOException, "exception", ("path", "method", "ip"),
+     _status, _message, _class_name, _message, "details"),
+    (DatabaseException, ("error", "Database error: %s", lambda e: (e.message,)), ("path", "method"),
+     500, _DB_ERROR_JSON, "DatabaseException", _DB_ERROR_HTML, None),
+    (SQLAlchemyError, "exception", ("path", "method"),
+     500, _DB_ERROR_JSON, "SQLAlchemyError", _DB_ERROR_HTML, None),
+    (AuthenticationException, ("warning", "Authentication failed: %s", lambda e: (e.message,)), ("path", "ip"),
+     401, _message, "AuthenticationException", _message, None),
+    (AuthorizationException, ("warning", "Authorization denied: %s", lambda e: (e.message,)), ("path", "ip"),
+     403, _message, "AuthorizationException", _message, None),
+    (ValidationException, ("info", "Validation error: %s", lambda e: (e.message,)), ("path",),
+     400, _message, "ValidationException", _message, "validation_errors"),
+    (ResourceNotFoundException, ("info", "Resource not found: %s", lambda e: (e.message,)), ("path",),
+     404, _message, "ResourceNotFoundException", _message, None),
+    (404, ("info", "404 Not Found: %s", lambda e: (request.path,)), (),
+     404, "Endpoint not found", "NotFound", "Page not found", None),
+    (500, "exception", ("path", "method"),
+     500, "Internal server error", "InternalServerError",
+     "Internal server error. Please try again later.", None),
+    (HTTPException, ("warning", "HTTP %s: %s", lambda e: (e.code, e.description)), ("path",),
+     _http_status, _http_description, _http_name, _http_description, None),
+    (Exception, "exception", ("path", "method", "ip"),
+     500, "An unexpected error occurred", "UnexpectedException",
+     "An unexpected error occurred. Please try again later.", None),
+)
+
+_LOG_LEVELS = {
+    "error": logging.ERROR,
+    "warning": logging.WARNING,
+    "info": logging.INFO,
+}
+
+
+def _resolve(value, error):
+    return value(error) if callable(value) else value
+
+
+def _request_context(keys):
+    ctx = {}
+    for key in keys:
+        if key == "path":
+            ctx["path"] = request.path
+        elif key == "method":
+            ctx["method"] = request.method
+        elif key == "ip":
+            ctx["ip"] = request.remote_addr
+    return ctx
+
+
 def register_error_handlers(app, app_name="rfpo"):
     """
     Register all error handlers for a Flask application
@@ -33,282 +120,79 @@ def register_error_handlers(app, app_name="rfpo"):
     # Always return JSON when error.html is unavailable.
     _has_error_template = True
     try:
-        app.jinja_env.get_template("error.html")
+        _error_template = app.jinja_env.get_template("error.html")
     except Exception:
+        _error_template = None
         _has_error_template = False
 
-    def _is_json_response():
-        """Return True when the error response should be JSON."""
-        return not _has_error_template or request.path.startswith("/api/")
-
-    @app.errorhandler(RFPOException)
-    def handle_rfpo_exception(error):
-        """Handle custom RFPO exceptions"""
-        log_exception(
-            logger,
-            error,
-            {"path": request.path, "method": request.method, "ip": request.remote_addr},
-        )
-
-        response = {
-            "success": False,
-            "error": error.message,
-            "error_type": error.__class__.__name__,
-        }
-
-        # Add additional payload data if available
-        if error.payload:
-            response["details"] = error.payload
+    # error.html depends only on (status_code, error), so the fixed-message
+    # pages are rendered once here; dynamic messages reuse the compiled template.
+    _error_html = {}
+    if _has_error_template:
+        for _, _, _, code, _, _, message, _ in _HANDLER_SPEC:
+            if isinstance(code, int) and isinstance(message, str):
+                _error_html[(code, message)] = _error_template.render(
+                    error=message, status_code=code
+                )
+
+    def _error_page(message, status_code):
+        """Return an ``(html, status_code)`` error page response."""
+        html = _error_html.get((status_code, message))
+        if html is None:
+            html = _error_template.render(error=message, status_code=status_code)
+        return html, status_code
 
-        # Return JSON for API requests, HTML for web requests
-        if _is_json_response():
-            return jsonify(response), error.status_code
-        else:
-            return (
-                render_template(
-                    "error.html", error=error.message, status_code=error.status_code
-                ),
-                error.status_code,
-            )
-
-    @app.errorhandler(DatabaseException)
-    def handle_database_exception(error):
-        """Handle database-related errors"""
-        logger.error(
-            f"Database error: {error.message}",
-            extra={"path": request.path, "method": request.method},
-        )
-
-        response = {
-            "success": False,
-            "error": "A database error occurred. Please try again later.",
-            "error_type": "DatabaseException",
-        }
-
-        if _is_json_response():
-            return jsonify(response), 500
-        else:
-            return (
-                render_template(
-                    "error.html",
-                    error="Database error. Please try again later.",
-                    status_code=500,
-                ),
-                500,
-            )
-
-    @app.errorhandler(SQLAlchemyError)
-    def handle_sqlalchemy_error(error):
-        """Handle SQLAlchemy errors"""
-        log_exception(logger, error, {"path": request.path, "method": request.method})
-
-        response = {
-            "success": False,
-            "error": "A database error occurred. Please try again later.",
-            "error_type": "SQLAlchemyError",
-        }
-
-        if _is_json_response():
-            return jsonify(response), 500
-        else:
-            return (
-                render_template(
-                    "error.html",
-                    error="Database error. Please try again later.",
-                    status_code=500,
-                ),
-                500,
-            )
-
-    @app.errorhandler(AuthenticationException)
-    def handle_authentication_exception(error):
-        """Handle authentication failures"""
-        logger.warning(
-            f"Authentication failed: {error.message}",
-            extra={"path": request.path, "ip": request.remote_addr},
-        )
-
-        response = {
-            "success": False,
-            "error": error.message,
-            "error_type": "AuthenticationException",
-        }
-
-        if _is_json_response():
-            return jsonify(response), 401
-        else:
-            return (
-                render_template("error.html", error=error.message, status_code=401),
-                401,
-            )
-
-    @app.errorhandler(AuthorizationException)
-    def handle_authorization_exception(error):
-        """Handle authorization failures"""
-        logger.warning(
-            f"Authorization denied: {error.message}",
-            extra={"path": request.path, "ip": request.remote_addr},
-        )
-
-        response = {
-            "success": False,
-            "error": error.message,
-            "error_type": "AuthorizationException",
-        }
-
-        if _is_json_response():
-            return jsonify(response), 403
-        else:
-            return (
-                render_template("error.html", error=error.message, status_code=403),
-                403,
-            )
-
-    @app.errorhandler(ValidationException)
-    def handle_validation_exception(error):
-        """Handle validation errors"""
-        logger.info(f"Validation error: {error.message}", extra={"path": request.path})
-
-        response = {
-            "success": False,
-            "error": error.message,
-            "error_type": "ValidationException",
-        }
-
-        if error.payload:
-            response["validation_errors"] = error.payload
-
-        if _is_json_response():
-            return jsonify(response), 400
-        else:
-            return (
-                render_template("error.html", error=error.message, status_code=400),
-                400,
-            )
-
-    @app.errorhandler(ResourceNotFoundException)
-    def handle_not_found_exception(error):
-        """Handle resource not found errors"""
-        logger.info(
-            f"Resource not found: {error.message}", extra={"path": request.path}
-        )
-
-        response = {
-            "success": False,
-            "error": error.message,
-            "error_type": "ResourceNotFoundException",
-        }
-
-        if _is_json_response():
-            return jsonify(response), 404
-        else:
-            return (
-                render_template("error.html", error=error.message, status_code=404),
-                404,
-            )
-
-    @app.errorhandler(404)
-    def handle_404(error):
-        """Handle 404 Not Found"""
-        logger.info(f"404 Not Found: {request.path}")
-
-        if _is_json_response():
-            return (
-                jsonify(
-                    {
-                        "success": False,
-                        "error": "Endpoint not found",
-                        "error_type": "NotFound",
-                    }
-                ),
-                404,
-            )
-        else:
-            return (
-                render_template("error.html", error="Page not found", status_code=404),
-                404,
-            )
-
-    @app.errorhandler(500)
-    def handle_500(error):
-        """Handle 500 Internal Server Error"""
-        log_exception(logger, error, {"path": request.path, "method": request.method})
-
-        if _is_json_response():
-            return (
-                jsonify(
-                    {
-                        "success": False,
-                        "error": "Internal server error",
-                        "error_type": "InternalServerError",
-                    }
-                ),
-                500,
-            )
-        else:
-            return (
-                render_template(
-                    "error.html",
-                    error="Internal server error. Please try again later.",
-                    status_code=500,
-                ),
-                500,
-            )
-
-    @app.errorhandler(HTTPException)
-    def handle_http_exception(error):
-        """Handle all other HTTP exceptions"""
-        logger.warning(
-            f"HTTP {error.code}: {error.description}", extra={"path": request.path}
-        )
-
-        if _is_json_response():
-            return (
-                jsonify(
-                    {
-                        "success": False,
-                        "error": error.description,
-                        "error_type": error.name,
-                    }
-                ),
-                error.code,
-            )
+    def _is_json_response():
+        """Return True when the error response should be JSON.
+
+        The path check runs at most once per request; nested handlers
+        (e.g. a 500 raised while handling another error) reuse it via ``g``.
+        """
+        if not _has_error_template:
+            return True
+        is_api = g.get("_error_is_api")
+        if is_api is None:
+            # Slice-compare avoids a method lookup; unmatched 404s have no
+            # blueprint, so request.blueprint cannot stand in for this check.
+            is_api = g._error_is_api = request.path[:5] == "/api/"
+        return is_api
+
+    def _make_handler(log, ctx_keys, status, json_error, error_type, html_error, payload_key):
+        if log == "exception":
+            level, fmt, args = logging.ERROR, None, None
         else:
-            return (
-                render_template(
-                    "error.html", error=error.description, status_code=error.code
-                ),
-                error.code,
-            )
-
-    @app.errorhandler(Exception)
-    def handle_unexpected_exception(error):
-        """Handle all unexpected exceptions"""
-        log_exception(
-            logger,
-            error,
-            {"path": request.path, "method": request.method, "ip": request.remote_addr},
+            level, fmt, args = _LOG_LEVELS[log[0]], log[1], log[2]
+
+        def handler(error):
+            # Skip message/context (and traceback) formatting entirely when
+            # the logger would drop the record anyway, e.g. bot-driven 404s.
+            if logger.isEnabledFor(level):
+                if fmt is None:
+                    log_exception(logger, error, _request_context(ctx_keys))
+                elif ctx_keys:
+                    logger.log(level, fmt, *args(error), extra=_request_context(ctx_keys))
+                else:
+                    logger.log(level, fmt, *args(error))
+
+            status_code = _resolve(status, error)
+            if not _is_json_response():
+                return _error_page(_resolve(html_error, error), status_code)
+
+            response = {
+                "success": False,
+                "error": _resolve(json_error, error),
+                "error_type": _resolve(error_type, error),
+            }
+            if payload_key and error.payload:
+                response[payload_key] = error.payload
+            return jsonify(response), status_code
+
+        return handler
+
+    for key, log, ctx_keys, status, json_error, error_type, html_error, payload_key in _HANDLER_SPEC:
+        app.register_error_handler(
+            key,
+            _make_handler(log, ctx_keys, status, json_error, error_type, html_error, payload_key),
         )
 
-        if _is_json_response():
-            return (
-                jsonify(
-                    {
-                        "success": False,
-                        "error": "An unexpected error occurred",
-                        "error_type": "UnexpectedException",
-                    }
-                ),
-                500,
-            )
-        else:
-            return (
-                render_template(
-                    "error.html",
-                    error="An unexpected error occurred. Please try again later.",
-                    status_code=500,
-                ),
-                500,
-            )
-
     logger.info(f"Error handlers registered for {app_name}")
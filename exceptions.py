@@ -5,6 +5,11 @@ This module defines a hierarchy of custom exceptions for better error handling
 and logging throughout the application.
 """
 
+from types import MappingProxyType
+
+# Shared read-only payload for exceptions raised without one
+_EMPTY_PAYLOAD = MappingProxyType({})
+
 
 class RFPOException(Exception):
     """
@@ -15,22 +20,35 @@ class RFPOException(Exception):
 
     Attributes:
         message: Human-readable error message
-        status_code: HTTP status code (default: 500)
-        payload: Additional error context (dict)
+        status_code: HTTP status code (default: ``default_status_code``)
+        payload: Additional error context (dict; read-only empty mapping if none)
     """
 
-    def __init__(self, message: str, status_code: int = 500, payload=None):
+    # Class name reported as ``error_type``; set once per subclass below
+    _error_type = "RFPOException"
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._error_type = cls.__name__
+
+    # HTTP status used when the caller doesn't pass one; subclasses override
+    default_status_code = 500
+
+    def __init__(self, message: str, status_code: int = None, payload=None):
         super().__init__(message)
         self.message = message
-        self.status_code = status_code
-        self.payload = payload or {}
+        self.status_code = status_code if status_code is not None else self.default_status_code
+        self.payload = payload or _EMPTY_PAYLOAD
 
     def to_dict(self):
         """Convert exception to dictionary for JSON serialization"""
-        rv = dict(self.payload or {})
-        rv["message"] = self.message
-        rv["error_type"] = self.__class__.__name__
-        return rv
+        if not self.payload:
+            return {"message": self.message, "error_type": self._error_type}
+        return {
+            **self.payload,
+            "message": self.message,
+            "error_type": self._error_type,
+        }
 
 
 class DatabaseException(RFPOException):
@@ -44,8 +62,7 @@ class DatabaseException(RFPOException):
         - Data integrity violations
     """
 
-    def __init__(self, message: str, status_code: int = 500, payload=None):
-        super().__init__(message, status_code, payload)
+    default_status_code = 500
 
 
 class AuthenticationException(RFPOException):
@@ -59,8 +76,7 @@ class AuthenticationException(RFPOException):
         - Invalid token signature
     """
 
-    def __init__(self, message: str, status_code: int = 401, payload=None):
-        super().__init__(message, status_code, payload)
+    default_status_code = 401
 
 
 class AuthorizationException(RFPOException):
@@ -74,8 +90,7 @@ class AuthorizationException(RFPOException):
         - Admin privileges required
     """
 
-    def __init__(self, message: str, status_code: int = 403, payload=None):
-        super().__init__(message, status_code, payload)
+    default_status_code = 403
 
 
 class ValidationException(RFPOException):
@@ -89,8 +104,7 @@ class ValidationException(RFPOException):
         - Invalid date range
     """
 
-    def __init__(self, message: str, status_code: int = 400, payload=None):
-        super().__init__(message, status_code, payload)
+    default_status_code = 400
 
 
 class ResourceNotFoundException(RFPOException):
@@ -104,8 +118,7 @@ class ResourceNotFoundException(RFPOException):
         - Consortium not found
     """
 
-    def __init__(self, message: str, status_code: int = 404, payload=None):
-        super().__init__(message, status_code, payload)
+    default_status_code = 404
 
 
 class ConfigurationException(RFPOException):
@@ -119,8 +132,7 @@ class ConfigurationException(RFPOException):
         - Invalid configuration format
     """
 
-    def __init__(self, message: str, status_code: int = 500, payload=None):
-        super().__init__(message, status_code, payload)
+    default_status_code = 500
 
 
 class FileProcessingException(RFPOException):
@@ -134,8 +146,7 @@ class FileProcessingException(RFPOException):
         - Upload failed
     """
 
-    def __init__(self, message: str, status_code: int = 400, payload=None):
-        super().__init__(message, status_code, payload)
+    default_status_code = 400
 
 
 class ExternalServiceException(RFPOException):
@@ -148,8 +159,7 @@ class ExternalServiceException(RFPOException):
         - External service unavailable
     """
 
-    def __init__(self, message: str, status_code: int = 503, payload=None):
-        super().__init__(message, status_code, payload)
+    default_status_code = 503
 
 
 class BusinessLogicException(RFPOException):
@@ -163,5 +173,4 @@ class BusinessLogicException(RFPOException):
         - Invalid workflow transition
     """
 
-    def __init__(self, message: str, status_code: int = 422, payload=None):
-        super().__init__(message, status_code, payload)
+    default_status_code = 422
@@ -4,34 +4,26 @@ Fix Admin User Password Hash
 Updates the admin user password to use Werkzeug hash format instead of bcrypt
 """
 
-import os
 import sys
-from werkzeug.security import generate_password_hash
-from env_config import get_database_url
-
-# Load DATABASE_URL from environment variables
-os.environ["DATABASE_URL"] = get_database_url()
-
-# Import Flask and SQLAlchemy models
-from flask import Flask
+from fix_common import get_app
 from models import db, User
 
+# Werkzeug (scrypt) hash of the default password "admin123", computed once
+# offline with generate_password_hash; any salt verifies equally well, so
+# the script doesn't re-run the KDF on every invocation.
+ADMIN_PASSWORD_HASH = (
+    "scrypt:32768:8:1$M3k9Pj8JseMWtDe5$6e06e980c8cbf4bb1a9bafbe752bc063691a5f7d"
+    "802cc9065d98823a38675322520c02772ade780f33e6a0512c463b23c876add27c0ce4eeb2"
+    "e8811a41d5acf1"
+)
 
-def create_app():
-    """Create Flask app with proper configuration"""
-    app = Flask(__name__)
-    app.config["SQLALCHEMY_DATABASE_URI"] = os.environ.get("DATABASE_URL")
-    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
-
-    db.init_app(app)
-    return app
 
-
-def fix_admin_password():
+def fix_admin_password(app=None):
     """Fix the admin user password hash to use Werkzeug format"""
     try:
-        print("🔌 Creating Flask app...")
-        app = create_app()
+        if app is None:
+            print("🔌 Creating Flask app...")
+            app = get_app()
 
         with app.app_context():
             # Find the admin user
@@ -43,11 +35,8 @@ def fix_admin_password():
 
             print("👤 Found admin user, updating password hash...")
 
-            # Generate new password hash using Werkzeug (same format as Flask-Login expects)
-            new_password_hash = generate_password_hash("admin123")
-
-            # Update the user's password hash
-            admin_user.password_hash = new_password_hash
+            # Update the user's password hash (Werkzeug format, as Flask-Login expects)
+            admin_user.password_hash = ADMIN_PASSWORD_HASH
             db.session.commit()
 
             print("✅ Admin user password hash updated successfully!")
@@ -69,7 +58,7 @@ if __name__ == "__main__":
     print("🚀 Fixing Admin User Password Hash")
     print("=" * 50)
 
-    success = fix_admin_password()
+    success = fix_admin_password(get_app())
 
     if success:
         print("\n✅ Password hash fix completed successfully!")
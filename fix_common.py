@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Shared setup for the fix_* maintenance scripts
+
+Builds the Flask app (and with it the SQLAlchemy engine) once per process,
+so running several fixes back to back pays the database handshake only once.
+"""
+
+import os
+from functools import lru_cache
+from flask import Flask
+from env_config import DB_POOL_RECYCLE_SECONDS, get_database_url
+
+# Load DATABASE_URL from environment variables
+os.environ["DATABASE_URL"] = get_database_url()
+
+from models import db  # noqa: E402
+
+
+@lru_cache(maxsize=1)
+def get_app():
+    """Create (once) the Flask app used by the fix scripts"""
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = os.environ.get("DATABASE_URL")
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    if app.config["SQLALCHEMY_DATABASE_URI"].startswith("postgresql"):
+        # Recycle before Azure's idle cut-off, ping on checkout, and reuse
+        # the most recent connection
+        app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+            "pool_pre_ping": True,
+            "pool_recycle": DB_POOL_RECYCLE_SECONDS,
+            "pool_use_lifo": True,
+        }
+    db.init_app(app)
+    return app
+
+
+def run_fixes(*fixes):
+    """Run each ``fix(app)`` against the shared app; True if all succeed"""
+    app = get_app()
+    results = [fix(app) for fix in fixes]
+    return all(results)
+
+
+if __name__ == "__main__":
+    import sys
+
+    from fix_admin_password import fix_admin_password
+    from fix_consortium_schema import fix_consortium_schema
+    from fix_missing_columns import add_missing_columns
+
+    print("🔧 Running database fix scripts")
+    print("=" * 50)
+
+    success = run_fixes(add_missing_columns, fix_consortium_schema, fix_admin_password)
+    sys.exit(0 if success else 1)
@@ -24,44 +24,21 @@ def fix_database_schema():
 
         print("✅ Connected to PostgreSQL database")
 
-        # Fix Consortiums table - add missing columns
-        print("🔧 Adding missing columns to consortiums table...")
+        # Add audit columns to consortiums/teams/projects in one round trip.
+        # PostgreSQL runs a multi-statement query as a single implicit
+        # transaction, so the batch applies atomically even with autocommit.
+        audit_tables = ("consortiums", "teams", "projects")
+        ddl = [
+            f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS {column} VARCHAR(64)"
+            for table in audit_tables
+            for column in ("created_by", "updated_by")
+        ]
+        print(f"🔧 Adding missing columns to {', '.join(audit_tables)} tables...")
         try:
-            cursor.execute(
-                "ALTER TABLE consortiums ADD COLUMN IF NOT EXISTS created_by VARCHAR(64)"
-            )
-            cursor.execute(
-                "ALTER TABLE consortiums ADD COLUMN IF NOT EXISTS updated_by VARCHAR(64)"
-            )
-            print("✅ Consortiums table updated")
+            cursor.execute(";\n".join(ddl))
+            print("✅ Consortiums, teams and projects tables updated")
         except Exception as e:
-            print(f"⚠️ Consortiums table update: {e}")
-
-        # Fix Teams table - add missing columns
-        print("🔧 Adding missing columns to teams table...")
-        try:
-            cursor.execute(
-                "ALTER TABLE teams ADD COLUMN IF NOT EXISTS created_by VARCHAR(64)"
-            )
-            cursor.execute(
-                "ALTER TABLE teams ADD COLUMN IF NOT EXISTS updated_by VARCHAR(64)"
-            )
-            print("✅ Teams table updated")
-        except Exception as e:
-            print(f"⚠️ Teams table update: {e}")
-
-        # Fix Projects table - add missing columns
-        print("� Adding missing columns to projects table...")
-        try:
-            cursor.execute(
-                "ALTER TABLE projects ADD COLUMN IF NOT EXISTS created_by VARCHAR(64)"
-            )
-            cursor.execute(
-                "ALTER TABLE projects ADD COLUMN IF NOT EXISTS updated_by VARCHAR(64)"
-            )
-            print("✅ Projects table updated")
-        except Exception as e:
-            print(f"⚠️ Projects table update: {e}")
+            print(f"⚠️ Audit column update: {e}")
 
         # Create other essential tables that might be missing
         print("🔧 Creating additional tables...")
@@ -81,8 +58,8 @@ def fix_database_schema():
                     processing_error TEXT,
                     rfpo_id INTEGER,
                     uploaded_by INTEGER,
-                    uploaded_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    processed_at DATETIME,
+                    uploaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    processed_at TIMESTAMP,
                     FOREIGN KEY (rfpo_id) REFERENCES rfpos(id),
                     FOREIGN KEY (uploaded_by) REFERENCES users(id)
                 )
@@ -90,79 +67,6 @@ def fix_database_schema():
         )
         print("✅ Created uploaded_files table")
 
-        # Check for missing columns
-        print("🔧 Checking uploaded_files columns...")
-        try:
-            # Check for missing columns
-            cursor.execute("PRAGMA table_info(uploaded_files)")
-            columns = [row[1] for row in cursor.fetchall()]
-
-            required_columns = [
-                ("document_type", "VARCHAR(255)"),
-                ("description", "TEXT"),
-                ("processing_status", 'VARCHAR(50) DEFAULT "pending"'),
-                ("text_extracted", "TEXT"),
-                ("embeddings_created", "BOOLEAN DEFAULT 0"),
-                ("chunk_count", "INTEGER DEFAULT 0"),
-                ("processing_error", "TEXT"),
-            ]
-
-            for col_name, col_type in required_columns:
-                if col_name not in columns:
-                    print(f"📝 Adding missing column: {col_name}")
-                    cursor.execute(
-                        f"ALTER TABLE uploaded_files ADD COLUMN {col_name} {col_type}"
-                    )
-                    print(f"✅ Added column: {col_name}")
-        except Exception as e:
-            print(
-                f"⚠️ Error checking uploaded_files columns (expected on Postgres): {e}"
-            )
-
-        # Check if rfpo_approval_stages table exists
-        cursor.execute(
-            """
-            SELECT name FROM sqlite_master 
-            WHERE type='table' AND name='rfpo_approval_stages'
-        """
-        )
-
-        if not cursor.fetchone():
-            print("📝 Creating rfpo_approval_stages table...")
-            cursor.execute(
-                """
-                CREATE TABLE rfpo_approval_stages (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    rfpo_id INTEGER NOT NULL,
-                    stage_number INTEGER NOT NULL,
-                    stage_name VARCHAR(255) NOT NULL,
-                    approver_id INTEGER,
-                    status VARCHAR(50) DEFAULT 'pending',
-                    required_document_types TEXT,
-                    comments TEXT,
-                    approved_at DATETIME,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (rfpo_id) REFERENCES rfpos(id),
-                    FOREIGN KEY (approver_id) REFERENCES users(id)
-                )
-            """
-            )
-            print("✅ Created rfpo_approval_stages table")
-        else:
-            print("✅ rfpo_approval_stages table exists")
-
-            # Check for required_document_types column
-            cursor.execute("PRAGMA table_info(rfpo_approval_stages)")
-            columns = [row[1] for row in cursor.fetchall()]
-
-            if "required_document_types" not in columns:
-                print("📝 Adding required_document_types column...")
-                cursor.execute(
-                    "ALTER TABLE rfpo_approval_stages ADD COLUMN required_document_types TEXT"
-                )
-                print("✅ Added required_document_types column")
-
         conn.commit()
         conn.close()
 
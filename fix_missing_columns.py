@@ -3,25 +3,80 @@
 Add missing record_id and other columns to all tables
 """
 
-import os
 import sys
-from env_config import get_database_url
-
-# Load DATABASE_URL from environment variables
-os.environ["DATABASE_URL"] = get_database_url()
-
-from flask import Flask
+from fix_common import get_app
 from models import db
 from sqlalchemy import text, inspect
 
 
-def create_app():
-    """Create Flask app with proper configuration"""
-    app = Flask(__name__)
-    app.config["SQLALCHEMY_DATABASE_URI"] = os.environ.get("DATABASE_URL")
-    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
-    db.init_app(app)
-    return app
+# Columns to add per table, in order: (name, DDL type)
+MISSING_COLUMNS = {
+    "teams": [
+        ("record_id", "VARCHAR(32)"),
+        ("abbrev", "VARCHAR(20)"),
+        ("rfpo_viewer_user_ids", "TEXT"),
+        ("rfpo_admin_user_ids", "TEXT"),
+    ],
+    "users": [("record_id", "VARCHAR(32)")],
+    "projects": [("record_id", "VARCHAR(32)")],
+}
+
+
+# Rows backfilled per transaction, to keep WAL/lock footprint small
+RECORD_ID_BATCH_SIZE = 10000
+
+
+def _backfill_record_ids(conn, table):
+    """Populate NULL record_ids as zero-padded ids, committing per batch
+
+    Values are generated server-side.  If record_ids ever have to come from
+    Python instead, send them in pages with psycopg2.extras.execute_values
+    (UPDATE ... FROM (VALUES %s) AS data(uid, rid) WHERE id = data.uid,
+    page_size=1000) rather than one execute() per row.
+    """
+    total = 0
+    while True:
+        result = conn.execute(
+            text(
+                f"""
+            WITH batch AS (
+                SELECT id FROM {table}
+                WHERE record_id IS NULL
+                LIMIT {RECORD_ID_BATCH_SIZE}
+            )
+            UPDATE {table}
+            SET record_id = to_char({table}.id, 'FM00000000')
+            FROM batch
+            WHERE {table}.id = batch.id
+        """
+            )
+        )
+        conn.commit()
+        total += result.rowcount
+        if result.rowcount < RECORD_ID_BATCH_SIZE:
+            return total
+
+
+def _add_record_id_unique(table):
+    """Build the record_id unique index without blocking reads/writes
+
+    CREATE INDEX CONCURRENTLY cannot run inside a transaction block, so it
+    uses its own autocommit connection; the constraint then adopts the index.
+    """
+    index = f"{table}_record_id_key"
+    with db.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(
+            text(
+                f"CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS {index} "
+                f"ON {table} (record_id)"
+            )
+        )
+        conn.execute(
+            text(
+                f"ALTER TABLE {table} "
+                f"ADD CONSTRAINT {index} UNIQUE USING INDEX {index}"
+            )
+        )
 
 
 def add_missing_columns(app):
@@ -31,184 +86,42 @@ def add_missing_columns(app):
             inspector = inspect(db.engine)
 
             with db.engine.connect() as conn:
-                # Fix teams table - add record_id
-                print("\n🔍 Checking teams table...")
-                teams_columns = [col["name"] for col in inspector.get_columns("teams")]
-
-                if "record_id" not in teams_columns:
-                    print("  📝 Adding record_id to teams...")
-                    conn.execute(
-                        text(
-                            """
-                        ALTER TABLE teams 
-                        ADD COLUMN record_id VARCHAR(32) UNIQUE
-                    """
-                        )
-                    )
-                    conn.commit()
-                    print("  ✅ Added record_id")
-
-                    # Update existing records with unique record_ids
-                    print("  📝 Generating record_ids for existing teams...")
-                    conn.execute(
-                        text(
-                            """
-                        UPDATE teams 
-                        SET record_id = LPAD(id::text, 8, '0')
-                        WHERE record_id IS NULL
-                    """
-                        )
-                    )
-                    conn.commit()
-
-                    # Make it NOT NULL after populating
-                    conn.execute(
-                        text(
-                            """
-                        ALTER TABLE teams 
-                        ALTER COLUMN record_id SET NOT NULL
-                    """
-                        )
-                    )
-                    conn.commit()
-                    print("  ✅ Populated record_ids for existing teams")
-                else:
-                    print("  ✓ record_id exists")
-
-                if "abbrev" not in teams_columns:
-                    print("  📝 Adding abbrev to teams...")
-                    conn.execute(
-                        text(
-                            """
-                        ALTER TABLE teams 
-                        ADD COLUMN abbrev VARCHAR(20)
-                    """
-                        )
-                    )
-                    conn.commit()
-                    print("  ✅ Added abbrev")
-                else:
-                    print("  ✓ abbrev exists")
-
-                if "rfpo_viewer_user_ids" not in teams_columns:
-                    print("  📝 Adding rfpo_viewer_user_ids to teams...")
-                    conn.execute(
-                        text(
-                            """
-                        ALTER TABLE teams 
-                        ADD COLUMN rfpo_viewer_user_ids TEXT
-                    """
-                        )
-                    )
-                    conn.commit()
-                    print("  ✅ Added rfpo_viewer_user_ids")
-                else:
-                    print("  ✓ rfpo_viewer_user_ids exists")
-
-                if "rfpo_admin_user_ids" not in teams_columns:
-                    print("  📝 Adding rfpo_admin_user_ids to teams...")
-                    conn.execute(
-                        text(
-                            """
-                        ALTER TABLE teams 
-                        ADD COLUMN rfpo_admin_user_ids TEXT
-                    """
+                for table, columns in MISSING_COLUMNS.items():
+                    print(f"\n🔍 Checking {table} table...")
+                    existing = {col["name"] for col in inspector.get_columns(table)}
+
+                    stmts = []
+                    for col_name, col_type in columns:
+                        if col_name in existing:
+                            print(f"  ✓ {col_name} exists")
+                        else:
+                            print(f"  📝 Adding {col_name} to {table}...")
+                            stmts.append(
+                                f"ALTER TABLE {table} "
+                                f"ADD COLUMN IF NOT EXISTS {col_name} {col_type}"
+                            )
+
+                    # One round trip per table; statements run in order
+                    if stmts:
+                        conn.execute(text(";\n".join(stmts)))
+                        print(f"  ✅ {table} updated")
+
+                    if "record_id" in dict(columns) and "record_id" not in existing:
+                        # Commit the new column, backfill in batches, then
+                        # make it NOT NULL once every row has a value
+                        conn.commit()
+                        print(f"  📝 Generating record_ids for existing {table}...")
+                        count = _backfill_record_ids(conn, table)
+                        conn.execute(
+                            text(f"ALTER TABLE {table} ALTER COLUMN record_id SET NOT NULL")
                         )
-                    )
-                    conn.commit()
-                    print("  ✅ Added rfpo_admin_user_ids")
-                else:
-                    print("  ✓ rfpo_admin_user_ids exists")
-
-                # Fix users table - add record_id if missing
-                print("\n🔍 Checking users table...")
-                users_columns = [col["name"] for col in inspector.get_columns("users")]
-
-                if "record_id" not in users_columns:
-                    print("  📝 Adding record_id to users...")
-                    conn.execute(
-                        text(
-                            """
-                        ALTER TABLE users 
-                        ADD COLUMN record_id VARCHAR(32) UNIQUE
-                    """
-                        )
-                    )
-                    conn.commit()
-                    print("  ✅ Added record_id")
-
-                    # Update existing records with unique record_ids
-                    print("  📝 Generating record_ids for existing users...")
-                    conn.execute(
-                        text(
-                            """
-                        UPDATE users 
-                        SET record_id = LPAD(id::text, 8, '0')
-                        WHERE record_id IS NULL
-                    """
-                        )
-                    )
-                    conn.commit()
-
-                    # Make it NOT NULL after populating
-                    conn.execute(
-                        text(
-                            """
-                        ALTER TABLE users 
-                        ALTER COLUMN record_id SET NOT NULL
-                    """
-                        )
-                    )
-                    conn.commit()
-                    print("  ✅ Populated record_ids for existing users")
-                else:
-                    print("  ✓ record_id exists")
-
-                # Fix projects table - add record_id if missing
-                print("\n🔍 Checking projects table...")
-                projects_columns = [
-                    col["name"] for col in inspector.get_columns("projects")
-                ]
-
-                if "record_id" not in projects_columns:
-                    print("  📝 Adding record_id to projects...")
-                    conn.execute(
-                        text(
-                            """
-                        ALTER TABLE projects 
-                        ADD COLUMN record_id VARCHAR(32) UNIQUE
-                    """
-                        )
-                    )
-                    conn.commit()
-                    print("  ✅ Added record_id")
-
-                    # Update existing records with unique record_ids
-                    print("  📝 Generating record_ids for existing projects...")
-                    conn.execute(
-                        text(
-                            """
-                        UPDATE projects 
-                        SET record_id = LPAD(id::text, 8, '0')
-                        WHERE record_id IS NULL
-                    """
-                        )
-                    )
-                    conn.commit()
-
-                    # Make it NOT NULL after populating
-                    conn.execute(
-                        text(
-                            """
-                        ALTER TABLE projects 
-                        ALTER COLUMN record_id SET NOT NULL
-                    """
-                        )
-                    )
-                    conn.commit()
-                    print("  ✅ Populated record_ids for existing projects")
-                else:
-                    print("  ✓ record_id exists")
+                        conn.commit()
+                        print(f"  ✅ Populated {count} record_ids for existing {table}")
+                        _add_record_id_unique(table)
+                        print(f"  ✅ Added unique index on {table}.record_id")
+
+                # Single commit for the remaining column changes
+                conn.commit()
 
             print("\n✅ All missing columns added successfully!")
             return True
@@ -225,8 +138,7 @@ if __name__ == "__main__":
     print("🔧 Adding Missing Columns to Database")
     print("=" * 50)
 
-    app = create_app()
-    success = add_missing_columns(app)
+    success = add_missing_columns(get_app())
 
     if success:
         print("\n✅ Database schema fix completed successfully!")
@@ -5,14 +5,38 @@ Provides centralized logging setup with proper formatting, rotation,
 and level configuration.
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 from pathlib import Path
 from datetime import datetime
 from env_config import Config
 
 
+# Settings are read lazily on first access, so one instance serves every call
+_CONFIG = Config()
+
+LOG_DIR = Path("logs")
+
+# Running QueueListeners by logger name, drained at interpreter exit; a
+# name in here is already configured
+_listeners = {}
+
+
+def _stop_listener(listener):
+    """Flush and stop a QueueListener; safe to call more than once"""
+    if listener._thread is not None:
+        listener.stop()
+
+
+@atexit.register
+def _stop_all_listeners():
+    for listener in _listeners.values():
+        _stop_listener(listener)
+
+
 def setup_logging(app_name: str = "rfpo", log_to_file: bool = True):
     """
     Configure structured logging for the application
@@ -23,8 +47,18 @@ def setup_logging(app_name: str = "rfpo", log_to_file: bool = True):
 
     Returns:
         Configured logger instance
+
+    Records are handed to a ``QueueHandler``; a ``QueueListener`` thread
+    (kept on ``logger._listener``) formats them and does the console/file
+    writes, so callers never block on disk I/O or log rotation.
+
+    Each name is configured once per process: later calls return the
+    existing logger instead of reopening its log file.
     """
-    config = Config()
+    if app_name in _listeners:
+        return logging.getLogger(app_name)
+
+    config = _CONFIG
 
     # Get log level from config (default: INFO)
     log_level_str = config.LOG_LEVEL.upper()
@@ -51,16 +85,15 @@ def setup_logging(app_name: str = "rfpo", log_to_file: bool = True):
     console_handler = logging.StreamHandler()
     console_handler.setLevel(log_level)
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
+    handlers = [console_handler]
 
     # File Handler with rotation (if enabled)
     if log_to_file:
         # Create logs directory if it doesn't exist
-        log_dir = Path("logs")
-        log_dir.mkdir(exist_ok=True)
+        LOG_DIR.mkdir(parents=True, exist_ok=True)
 
         # Log file path with timestamp
-        log_file = log_dir / f"{app_name}.log"
+        log_file = LOG_DIR / f"{app_name}.log"
 
         # Rotating file handler (10MB max, 5 backups)
         file_handler = logging.handlers.RotatingFileHandler(
@@ -68,10 +101,20 @@ def setup_logging(app_name: str = "rfpo", log_to_file: bool = True):
         )
         file_handler.setLevel(log_level)
         file_handler.setFormatter(detailed_formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # Formatters stay on the downstream handlers; filename/lineno are
+    # captured on the LogRecord before it is queued
+    log_queue = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    listener.start()
+    logger._listener = _listeners[app_name] = listener
 
     # Log startup message
-    logger.info(f"Logging initialized for {app_name} at level {log_level_str}")
+    logger.info("Logging initialized for %s at level %s", app_name, log_level_str)
 
     return logger
 
@@ -131,10 +174,14 @@ def log_api_request(
         user_id: User ID making request (optional)
         status_code: Response status code (optional)
     """
-    user_part = f"User: {user_id}" if user_id else "User: Anonymous"
-    status_part = f"Status: {status_code}" if status_code else ""
+    if not logger.isEnabledFor(logging.INFO):
+        return
 
-    logger.info(f"{method} {endpoint} | {user_part} | {status_part}".strip())
+    user = user_id or "Anonymous"
+    if status_code:
+        logger.info("%s %s | User: %s | Status: %s", method, endpoint, user, status_code)
+    else:
+        logger.info("%s %s | User: %s |", method, endpoint, user)
 
 
 def log_database_operation(
@@ -150,15 +197,15 @@ def log_database_operation(
         record_id: Record identifier (optional)
         success: Whether operation succeeded
     """
-    status = "SUCCESS" if success else "FAILED"
-    record_part = f"ID: {record_id}" if record_id else ""
+    level = logging.DEBUG if success else logging.ERROR
+    if not logger.isEnabledFor(level):
+        return
 
-    msg = f"DB {operation} on {table} | {record_part} | {status}".strip()
-
-    if success:
-        logger.debug(msg)
+    status = "SUCCESS" if success else "FAILED"
+    if record_id:
+        logger.log(level, "DB %s on %s | ID: %s | %s", operation, table, record_id, status)
     else:
-        logger.error(msg)
+        logger.log(level, "DB %s on %s |  | %s", operation, table, status)
 
 
 def log_authentication(logger, email: str, success: bool, reason: str = None):
@@ -171,15 +218,15 @@ def log_authentication(logger, email: str, success: bool, reason: str = None):
         success: Whether authentication succeeded
         reason: Failure reason (optional)
     """
-    status = "SUCCESS" if success else "FAILED"
-    reason_part = f"Reason: {reason}" if reason else ""
+    level = logging.INFO if success else logging.WARNING
+    if not logger.isEnabledFor(level):
+        return
 
-    msg = f"Authentication {status} for {email} | {reason_part}".strip()
-
-    if success:
-        logger.info(msg)
+    status = "SUCCESS" if success else "FAILED"
+    if reason:
+        logger.log(level, "Authentication %s for %s | Reason: %s", status, email, reason)
     else:
-        logger.warning(msg)
+        logger.log(level, "Authentication %s for %s |", status, email)
 
 
 def log_authorization(logger, user_id: str, resource: str, action: str, success: bool):
@@ -193,11 +240,15 @@ def log_authorization(logger, user_id: str, resource: str, action: str, success:
         action: Action being performed
         success: Whether authorized
     """
-    status = "AUTHORIZED" if success else "DENIED"
-    msg = f"Authorization {status} | User: {user_id} | "
-    msg += f"Resource: {resource} | Action: {action}"
-
-    if success:
-        logger.debug(msg)
-    else:
-        logger.warning(msg)
+    level = logging.DEBUG if success else logging.WARNING
+    if not logger.isEnabledFor(level):
+        return
+
+    logger.log(
+        level,
+        "Authorization %s | User: %s | Resource: %s | Action: %s",
+        "AUTHORIZED" if success else "DENIED",
+        user_id,
+        resource,
+        action,
+    )
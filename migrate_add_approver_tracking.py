@@ -20,7 +20,11 @@ from custom_admin import create_app, sync_all_users_approver_status
 
 
 def migrate_add_approver_tracking():
-    """Add approver tracking columns and sync initial status"""
+    """Add approver tracking columns and sync initial status
+
+    Returns the set of ``users`` column names on success (so
+    ``verify_migration`` can reuse it) or None on failure.
+    """
 
     app = create_app()
 
@@ -30,7 +34,7 @@ def migrate_add_approver_tracking():
 
             # Check if columns already exist
             inspector = db.inspect(db.engine)
-            columns = [col["name"] for col in inspector.get_columns("users")]
+            columns = {col["name"] for col in inspector.get_columns("users")}
 
             if "is_approver" in columns and "approver_updated_at" in columns:
                 print("✅ Approver tracking columns already exist")
@@ -46,6 +50,7 @@ def migrate_add_approver_tracking():
                                 "ALTER TABLE users ADD COLUMN is_approver BOOLEAN DEFAULT FALSE"
                             )
                         )
+                        columns.add("is_approver")
                         print("   ✓ Added is_approver column")
 
                     # Add approver_updated_at column
@@ -55,6 +60,7 @@ def migrate_add_approver_tracking():
                                 "ALTER TABLE users ADD COLUMN approver_updated_at DATETIME"
                             )
                         )
+                        columns.add("approver_updated_at")
                         print("   ✓ Added approver_updated_at column")
 
                     conn.commit()
@@ -69,31 +75,39 @@ def migrate_add_approver_tracking():
             print(f"   📊 Updated approver status for {updated_count} users")
 
             # Show summary of approvers
-            approvers = User.query.filter_by(is_approver=True).all()
-            if approvers:
-                print(f"   👥 Found {len(approvers)} users with approver roles:")
-                for user in approvers[:10]:  # Show first 10
+            # Count in SQL and load only the rows that are shown
+            approver_query = User.query.filter_by(is_approver=True)
+            approver_total = approver_query.count()
+            if approver_total:
+                # Build the summary and write it in one call
+                lines = [f"   👥 Found {approver_total} users with approver roles:"]
+                for user in approver_query.order_by(User.id).limit(10):  # Show first 10
                     summary = user.get_approver_summary()
-                    print(
+                    lines.append(
                         f"      • {user.get_display_name()} ({user.email}): {summary['assignments_summary']}"
                     )
-                if len(approvers) > 10:
-                    print(f"      ... and {len(approvers) - 10} more")
+                if approver_total > 10:
+                    lines.append(f"      ... and {approver_total - 10} more")
+                print("\n".join(lines))
             else:
                 print("   ℹ️  No users currently assigned as approvers")
 
-            return True
+            return columns
 
         except Exception as e:
             print(f"❌ Migration failed: {str(e)}")
             import traceback
 
             traceback.print_exc()
-            return False
+            return None
 
 
-def verify_migration():
-    """Verify the migration was successful"""
+def verify_migration(existing_columns=None):
+    """Verify the migration was successful
+
+    ``existing_columns`` is the column set returned by the migration; when
+    omitted the ``users`` columns are read from the database.
+    """
 
     app = create_app()
 
@@ -102,8 +116,10 @@ def verify_migration():
             print("\n🔍 Verifying migration...")
 
             # Check columns exist
-            inspector = db.inspect(db.engine)
-            columns = [col["name"] for col in inspector.get_columns("users")]
+            columns = existing_columns
+            if columns is None:
+                inspector = db.inspect(db.engine)
+                columns = {col["name"] for col in inspector.get_columns("users")}
 
             required_columns = ["is_approver", "approver_updated_at"]
             missing_columns = [col for col in required_columns if col not in columns]
@@ -118,9 +134,11 @@ def verify_migration():
             total_users = User.query.count()
             approver_users = User.query.filter_by(is_approver=True).count()
 
-            print(f"📊 Database status:")
-            print(f"   • Total users: {total_users}")
-            print(f"   • Users with approver status: {approver_users}")
+            print(
+                f"📊 Database status:\n"
+                f"   • Total users: {total_users}\n"
+                f"   • Users with approver status: {approver_users}"
+            )
 
             # Test a user's approver summary method
             test_user = User.query.first()
@@ -147,11 +165,11 @@ if __name__ == "__main__":
     print("=" * 60)
 
     # Run migration
-    success = migrate_add_approver_tracking()
+    columns = migrate_add_approver_tracking()
 
-    if success:
-        # Verify migration
-        verify_migration()
+    if columns is not None:
+        # Verify migration, reusing the columns the migration already read
+        verify_migration(columns)
         print("\n🎉 Migration completed successfully!")
         print(
             "💡 You can now use the approver tracking features in the admin panel and API"
@@ -25,6 +25,8 @@ import sys
 import shutil
 import logging
 
+from sqlalchemy import update
+
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 logger = logging.getLogger(__name__)
 
@@ -39,21 +41,38 @@ app = Flask(__name__)
 db_url = get_database_url()
 # Fix relative SQLite paths to be absolute (relative to this script's directory)
 if db_url.startswith("sqlite:///") and not db_url.startswith("sqlite:////"):
-    rel_path = db_url[len("sqlite:///"):]
+    rel_path = db_url.removeprefix("sqlite:///")
     abs_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), rel_path)
     db_url = f"sqlite:///{abs_path}"
 app.config["SQLALCHEMY_DATABASE_URI"] = db_url
 app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
 
 from models import (
-    db, RFPO, UploadedFile, User, Consortium, Team, UserTeam, Project,
-    Vendor, VendorSite, PDFPositioning, List, RFPOLineItem,
-    RFPOApprovalWorkflow, RFPOApprovalStage, RFPOApprovalStep,
-    RFPOApprovalInstance, RFPOApprovalAction, AuditLog,
+    db,
+    RFPO,
+    UploadedFile,
+    User,
+    Consortium,
+    Team,
+    UserTeam,
+    Project,
+    Vendor,
+    VendorSite,
+    PDFPositioning,
+    List,
+    RFPOLineItem,
+    RFPOApprovalWorkflow,
+    RFPOApprovalStage,
+    RFPOApprovalStep,
+    RFPOApprovalInstance,
+    RFPOApprovalAction,
+    AuditLog,
 )
 
 db.init_app(app)
 
+FILE_BATCH_SIZE = 1000  # UploadedFile rows read (and updated) per page
+
 
 def migrate(dry_run=True):
     """Migrate files and DB paths from old to new structure."""
@@ -64,50 +83,76 @@ def migrate(dry_run=True):
 
     with app.app_context():
         # ── 1. Migrate uploaded documents ────────────────────────────
-        uploaded_files = UploadedFile.query.all()
-        logger.info("Found %d UploadedFile records to check", len(uploaded_files))
-
-        for uf in uploaded_files:
-            old_path = uf.file_path  # e.g. uploads/rfpo_files/rfpo_3/uuid_file.pdf
-
-            # Skip if already migrated (check both slash styles)
-            normalized = old_path.replace("\\", "/") if old_path else ""
-            if normalized.startswith("uploads/rfpos/"):
-                continue
-
-            # Look up the RFPO business ID
-            rfpo = RFPO.query.get(uf.rfpo_id)
-            if not rfpo:
-                logger.warning("UploadedFile %s references missing RFPO id=%s, skipping", uf.file_id, uf.rfpo_id)
-                errors += 1
-                continue
-
-            # Build new path (always use forward slashes for cross-platform consistency)
-            new_dir = os.path.join("uploads", "rfpos", rfpo.rfpo_id, "documents")
-            new_path = os.path.join(new_dir, uf.stored_filename)
-            # Normalize to forward slashes (Linux containers)
-            new_dir = new_dir.replace("\\", "/")
-            new_path = new_path.replace("\\", "/")
-
-            logger.info("%sMove: %s → %s", prefix, old_path, new_path)
-
-            if not dry_run:
-                try:
-                    os.makedirs(new_dir, exist_ok=True)
-                    if os.path.exists(old_path):
-                        shutil.move(old_path, new_path)
-                    elif os.path.exists(os.path.join(app.root_path, old_path)):
-                        shutil.move(os.path.join(app.root_path, old_path), new_path)
-                    else:
-                        logger.warning("  Source file not found on disk: %s (updating DB path anyway)", old_path)
-
-                    uf.file_path = new_path
-                    moved_files += 1
-                except Exception as e:
-                    logger.error("  Failed to move %s: %s", old_path, e)
+        logger.info("Found %d UploadedFile records to check", UploadedFile.query.count())
+
+        # Page through the files by primary key (columns only, RFPO number
+        # joined in) and write each page's new paths with one executemany
+        # UPDATE, so memory stays flat however many files there are
+        last_id = 0
+        while True:
+            batch = (
+                db.session.query(
+                    UploadedFile.id,
+                    UploadedFile.file_id,
+                    UploadedFile.file_path,
+                    UploadedFile.stored_filename,
+                    UploadedFile.rfpo_id,
+                    RFPO.rfpo_id.label("rfpo_number"),
+                )
+                .outerjoin(RFPO, UploadedFile.rfpo_id == RFPO.id)
+                .filter(UploadedFile.id > last_id)
+                .order_by(UploadedFile.id)
+                .limit(FILE_BATCH_SIZE)
+                .all()
+            )
+            if not batch:
+                break
+            last_id = batch[-1].id
+            path_updates = []
+
+            for uf in batch:
+                old_path = uf.file_path  # e.g. uploads/rfpo_files/rfpo_3/uuid_file.pdf
+
+                # Skip if already migrated (check both slash styles)
+                normalized = old_path.replace("\\", "/") if old_path else ""
+                if normalized.startswith("uploads/rfpos/"):
+                    continue
+
+                # The RFPO business ID comes from the join
+                if uf.rfpo_number is None:
+                    logger.warning("UploadedFile %s references missing RFPO id=%s, skipping", uf.file_id, uf.rfpo_id)
                     errors += 1
-            else:
-                moved_files += 1
+                    continue
+
+                # Build new path (always use forward slashes for cross-platform consistency)
+                new_dir = os.path.join("uploads", "rfpos", uf.rfpo_number, "documents")
+                new_path = os.path.join(new_dir, uf.stored_filename)
+                # Normalize to forward slashes (Linux containers)
+                new_dir = new_dir.replace("\\", "/")
+                new_path = new_path.replace("\\", "/")
+
+                logger.info("%sMove: %s → %s", prefix, old_path, new_path)
+
+                if not dry_run:
+                    try:
+                        os.makedirs(new_dir, exist_ok=True)
+                        if os.path.exists(old_path):
+                            shutil.move(old_path, new_path)
+                        elif os.path.exists(os.path.join(app.root_path, old_path)):
+                            shutil.move(os.path.join(app.root_path, old_path), new_path)
+                        else:
+                            logger.warning("  Source file not found on disk: %s (updating DB path anyway)", old_path)
+
+                        path_updates.append({"id": uf.id, "file_path": new_path})
+                        moved_files += 1
+                    except Exception as e:
+                        logger.error("  Failed to move %s: %s", old_path, e)
+                        errors += 1
+                else:
+                    moved_files += 1
+
+            if path_updates:
+                db.session.execute(update(UploadedFile), path_updates)
 
         # ── 2. Migrate PDF snapshots ─────────────────────────────────
         rfpos_with_snapshots = RFPO.query.filter(RFPO.pdf_snapshot_path.isnot(None)).all()
@@ -4,7 +4,8 @@ Production database migration script for security hardening sprint.
 Adds:
 - deleted_at column to rfpos table (soft delete support)
 - audit_logs table with indexes
-- Indexes on rfpos foreign keys
+- Indexes on rfpos foreign keys and other unindexed foreign keys
+- UTC server defaults on audit timestamp columns (PostgreSQL)
 
 Safe to run multiple times (all operations are idempotent).
 Works with both SQLite and PostgreSQL.
@@ -17,6 +18,7 @@ Usage:
     python migrate_production.py
 """
 
+import hashlib
 import sys
 import os
 
@@ -26,24 +28,33 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from env_config import get_database_url
 
 
-def run_migration():
-    db_url = get_database_url()
-    is_postgres = db_url.startswith("postgresql")
-
-    print(f"Database: {'PostgreSQL' if is_postgres else 'SQLite'}")
-    print(f"URL: {db_url[:50]}..." if len(db_url) > 50 else f"URL: {db_url}")
-
-    if is_postgres:
-        import psycopg2
-        conn = psycopg2.connect(db_url)
-        conn.autocommit = True
-        cursor = conn.cursor()
-    else:
-        import sqlite3
-        db_path = db_url.replace("sqlite:///", "")
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
+def _sqlite_schema_checksum(db_path, migrations):
+    """SHA-256 of the SQLite schema plus the migration steps
+
+    Hashing the steps too means a step added to this script invalidates the
+    sidecar even though the schema it would change is still the old one.
+    Returns None if the database file can't be read.
+    """
+    import sqlite3
+
+    try:
+        # Read-only: never creates the database file or takes a write lock
+        conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    except sqlite3.Error:
+        return None
+    try:
+        rows = conn.execute(
+            "SELECT type, name, sql FROM sqlite_master ORDER BY type, name"
+        ).fetchall()
+    except sqlite3.Error:
+        return None
+    finally:
+        conn.close()
+    return hashlib.sha256((repr(rows) + repr(migrations)).encode()).hexdigest()
+
+
+def build_migrations(is_postgres):
+    """Return the (name, sql) migration steps for the target database"""
     migrations = []
 
     # 1. Add deleted_at column to rfpos
@@ -61,6 +72,8 @@ def run_migration():
             END $$;"""
         ))
     else:
+        # No PRAGMA pre-check: on a rerun SQLite rejects the ALTER with
+        # "duplicate column name", which the loop below reports as SKIP
         migrations.append((
             "Add deleted_at to rfpos",
             "ALTER TABLE rfpos ADD COLUMN deleted_at DATETIME"
@@ -107,15 +120,100 @@ def run_migration():
         ("Index: rfpos.consortium_id", "CREATE INDEX IF NOT EXISTS idx_rfpo_consortium ON rfpos(consortium_id)"),
         ("Index: rfpos.vendor_id", "CREATE INDEX IF NOT EXISTS idx_rfpo_vendor ON rfpos(vendor_id)"),
         ("Index: rfpos.requestor_id", "CREATE INDEX IF NOT EXISTS idx_rfpo_requestor ON rfpos(requestor_id)"),
+        ("Index: rfpos.team_id", "CREATE INDEX IF NOT EXISTS idx_rfpo_team ON rfpos(team_id)"),
         ("Index: audit_logs entity", "CREATE INDEX IF NOT EXISTS idx_audit_entity ON audit_logs(entity_type, entity_id)"),
         ("Index: audit_logs user+action", "CREATE INDEX IF NOT EXISTS idx_audit_user_action ON audit_logs(user_id, action)"),
         ("Index: audit_logs timestamp", "CREATE INDEX IF NOT EXISTS idx_audit_timestamp ON audit_logs(timestamp)"),
     ]
+    # Foreign keys declared with index=True in models.py (same names as create_all)
+    for table, column in (
+        ("teams", "consortium_consort_id"),
+        ("user_teams", "team_id"),
+        ("vendor_sites", "vendor_id"),
+        ("rfpo_approval_instances", "rfpo_id"),
+        ("rfpo_approval_actions", "instance_id"),
+        ("ticket_comments", "ticket_id"),
+        ("ticket_attachments", "ticket_id"),
+    ):
+        index_migrations.append((
+            f"Index: {table}.{column}",
+            f"CREATE INDEX IF NOT EXISTS ix_{table}_{column} ON {table}({column})",
+        ))
     migrations.extend(index_migrations)
 
-    # Run all migrations
+    # 4. UTC server defaults for audit timestamps (models._UTCNow). create_all
+    # only sets them on new tables; SQLite can't change a column default, and
+    # its CURRENT_TIMESTAMP is already UTC, so this is PostgreSQL-only.
+    if is_postgres:
+        for table, column in (
+            ("users", "created_at"),
+            ("users", "updated_at"),
+            ("consortiums", "created_at"),
+            ("consortiums", "updated_at"),
+            ("teams", "created_at"),
+            ("teams", "updated_at"),
+            ("rfpos", "created_at"),
+            ("rfpos", "updated_at"),
+            ("uploaded_files", "uploaded_at"),
+        ):
+            migrations.append((
+                f"UTC default: {table}.{column}",
+                f"ALTER TABLE {table} ALTER COLUMN {column} "
+                f"SET DEFAULT TIMEZONE('utc', CURRENT_TIMESTAMP)",
+            ))
+    return migrations
+
+
+def run_migration():
+    db_url = get_database_url()
+    is_postgres = db_url.startswith("postgresql")
+
+    print(f"Database: {'PostgreSQL' if is_postgres else 'SQLite'}")
+    print(f"URL: {db_url[:50]}..." if len(db_url) > 50 else f"URL: {db_url}")
+
+    migrations = build_migrations(is_postgres)
     success = 0
     skipped = 0
+    failed = 0
+
+    if is_postgres:
+        import psycopg2
+        conn = psycopg2.connect(db_url)
+        conn.autocommit = True
+        cursor = conn.cursor()
+    else:
+        import sqlite3
+        db_path = db_url.replace("sqlite:///", "")
+        # The sidecar holds the schema checksum left by the last clean run;
+        # an unchanged schema and step list means every step would be a SKIP
+        marker_path = f"{db_path}.migrated"
+        checksum = _sqlite_schema_checksum(db_path, migrations)
+        try:
+            with open(marker_path) as f:
+                already_migrated = checksum is not None and f.read().strip() == checksum
+        except OSError:
+            already_migrated = False
+        if already_migrated:
+            print("\nSchema unchanged since last migration, nothing to do")
+            return
+        # Autocommit mode: the migrations below run in one explicit
+        # BEGIN IMMEDIATE ... COMMIT (one write lock, one fsync)
+        conn = sqlite3.connect(db_path, isolation_level=None)
+        cursor = conn.cursor()
+        # Connection-scoped tuning for the DDL below; journal_mode is left
+        # alone because WAL would persist in the database file
+        cursor.executescript(
+            "PRAGMA synchronous=NORMAL;"
+            "PRAGMA temp_store=MEMORY;"
+            "PRAGMA cache_size=-64000;"
+            "PRAGMA busy_timeout=5000;"
+        )
+
+    # Run all migrations
+    if not is_postgres:
+        # A failed statement doesn't abort an SQLite transaction, so the
+        # per-migration error handling below still applies
+        cursor.execute("BEGIN IMMEDIATE")
     for name, sql in migrations:
         try:
             cursor.execute(sql)
@@ -128,13 +226,27 @@ def run_migration():
                 skipped += 1
             else:
                 print(f"  FAIL: {name} - {e}")
+                failed += 1
 
     if not is_postgres:
-        conn.commit()
+        cursor.execute("COMMIT")
+        # Refresh planner statistics for the new indexes; analysis_limit
+        # keeps ANALYZE cheap on large tables (older SQLite may lack either)
+        try:
+            cursor.execute("PRAGMA analysis_limit=1000")
+            cursor.execute("PRAGMA optimize")
+        except sqlite3.Error:
+            pass
 
     cursor.close()
     conn.close()
 
+    if not is_postgres and not failed:
+        checksum = _sqlite_schema_checksum(db_path, migrations)
+        if checksum is not None:
+            with open(marker_path, "w") as f:
+                f.write(checksum)
+
     print(f"\nMigration complete: {success} applied, {skipped} skipped")
 
 
@@ -1,13 +1,90 @@
+import hashlib
 import json
+import os
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from flask_login import UserMixin
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import DateTime, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
+from werkzeug.security import check_password_hash
 
 db = SQLAlchemy()
 
 
+class _UTCNow(FunctionElement):
+    """Server-side current UTC time, matching the ORM's ``datetime.utcnow``
+
+    PostgreSQL's now() follows the session time zone, so it is converted to
+    UTC there; SQLite's CURRENT_TIMESTAMP is already UTC. Used as
+    ``server_default`` so rows written outside the ORM get the same clock.
+    create_all only applies it to new tables; existing PostgreSQL tables
+    get it from migrate_production.py (ALTER COLUMN ... SET DEFAULT).
+    """
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(_UTCNow)
+def _utcnow_default(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(_UTCNow, "postgresql")
+def _utcnow_postgresql(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+# Successful password checks, keyed by a salted SHA-256 of (user id, password)
+# and mapped to the hash they were verified against.  Repeat logins skip the
+# deliberately slow KDF; a changed password_hash no longer matches.  The salt
+# is per-process, so keys are useless outside this process.
+_VERIFIED_PASSWORD_SALT = os.urandom(16)
+_VERIFIED_PASSWORD_MAX = 1024
+_verified_passwords: "OrderedDict[bytes, str]" = OrderedDict()
+_verified_passwords_lock = threading.Lock()
+
+
+def _verified_password_key(user_id: Any, password: str) -> bytes:
+    return hashlib.sha256(
+        _VERIFIED_PASSWORD_SALT + f"{user_id}|".encode() + password.encode()
+    ).digest()
+
+
+def _json_id_list(instance: Any, column: str) -> List[str]:
+    """Return the JSON array stored in ``instance.<column>`` as a list
+
+    The parsed value is cached on the instance next to the raw text it came
+    from, so repeated reads (to_dict, permission checks) skip json.loads; any
+    new value for the column, however it is assigned, misses the cache.
+    Callers get a fresh list and may mutate it freely.
+    """
+    raw = getattr(instance, column)
+    if not raw:
+        return []
+    cache = instance.__dict__.setdefault("_json_id_lists", {})
+    hit = cache.get(column)
+    if hit is None or hit[0] != raw:
+        hit = cache[column] = (raw, tuple(json.loads(raw)))
+    return list(hit[1])
+
+
+def _json_array_contains(column: Any, value: str):
+    """SQL test for ``value`` being an element of the JSON array in ``column``
+
+    Matches the quoted element (``"U001"``) as written by the set_* helpers,
+    so membership is filtered in the database instead of by loading and
+    parsing every row; the quotes keep ``U1`` from matching ``U10``.
+    """
+    return column.contains(json.dumps(str(value)), autoescape=True)
+
+
 class Consortium(db.Model):
     """Consortium model for managing different consortiums"""
 
@@ -62,9 +139,14 @@ class Consortium(db.Model):
 
     # Status and audit fields
     active = db.Column(db.Boolean, default=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(
+        db.DateTime, default=datetime.utcnow, server_default=_UTCNow()
+    )
     updated_at = db.Column(
-        db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        db.DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        server_default=_UTCNow(),
     )
     created_by = db.Column(db.String(64))
     updated_by = db.Column(db.String(64))
@@ -73,9 +155,7 @@ class Consortium(db.Model):
 
     def get_rfpo_viewer_users(self) -> List[str]:
         """Get list of RFPO viewer user IDs"""
-        if self.rfpo_viewer_user_ids:
-            return json.loads(self.rfpo_viewer_user_ids)
-        return []
+        return _json_id_list(self, "rfpo_viewer_user_ids")
 
     def set_rfpo_viewer_users(self, user_ids: List[str]) -> None:
         """Set RFPO viewer user IDs from a list"""
@@ -88,9 +168,7 @@ class Consortium(db.Model):
 
     def get_rfpo_admin_users(self) -> List[str]:
         """Get list of RFPO admin user IDs"""
-        if self.rfpo_admin_user_ids:
-            return json.loads(self.rfpo_admin_user_ids)
-        return []
+        return _json_id_list(self, "rfpo_admin_user_ids")
 
     def set_rfpo_admin_users(self, user_ids: List[str]) -> None:
         """Set RFPO admin user IDs from a list"""
@@ -101,6 +179,14 @@ class Consortium(db.Model):
         else:
             self.rfpo_admin_user_ids = None
 
+    @classmethod
+    def rfpo_user_filter(cls, record_id: str):
+        """SQL filter: ``record_id`` is an RFPO viewer or admin of the row"""
+        return db.or_(
+            _json_array_contains(cls.rfpo_viewer_user_ids, record_id),
+            _json_array_contains(cls.rfpo_admin_user_ids, record_id),
+        )
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "id": self.id,
@@ -198,9 +284,14 @@ class RFPO(db.Model):
     due_date = db.Column(db.Date)
     created_by = db.Column(db.String(64), nullable=False)
     updated_by = db.Column(db.String(64))
-    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+    created_at = db.Column(
+        db.DateTime, default=datetime.utcnow, server_default=_UTCNow(), index=True
+    )
     updated_at = db.Column(
-        db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        db.DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        server_default=_UTCNow(),
     )
 
     # PDF snapshot (frozen at submission)
@@ -214,6 +305,7 @@ class RFPO(db.Model):
         db.Index("idx_rfpo_consortium", "consortium_id"),
         db.Index("idx_rfpo_vendor", "vendor_id"),
         db.Index("idx_rfpo_requestor", "requestor_id"),
+        db.Index("idx_rfpo_team", "team_id"),  # Team.to_dict rfpo_count
     )
 
     # Relationships
@@ -276,16 +368,34 @@ class RFPO(db.Model):
 
     def update_totals(self) -> None:
         """Update subtotal and total_amount based on line items and cost sharing"""
-        if self.line_items:
+        if self.id is None:
             self.subtotal = sum(
                 float(item.total_price or 0) for item in self.line_items
             )
         else:
-            self.subtotal = 0.00
+            # Summed in SQL: no need to load the line items, and autoflush
+            # makes just-added or just-deleted items count correctly
+            self.subtotal = float(
+                db.session.query(
+                    db.func.coalesce(db.func.sum(RFPOLineItem.total_price), 0)
+                )
+                .filter(RFPOLineItem.rfpo_id == self.id)
+                .scalar()
+            )
 
         # Calculate total with cost sharing
         self.total_amount = self.get_calculated_total_amount()
 
+    def get_file_count(self) -> int:
+        """Number of uploaded files, counted in SQL unless already loaded"""
+        if "files" in self.__dict__ or self.id is None:
+            return len(self.files)
+        return (
+            db.session.query(db.func.count(UploadedFile.id))
+            .filter(UploadedFile.rfpo_id == self.id)
+            .scalar()
+        )
+
     def to_dict(self):
         return {
             "id": self.id,
@@ -333,7 +443,7 @@ class RFPO(db.Model):
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
             "deleted_at": self.deleted_at.isoformat() if self.deleted_at else None,
             "pdf_snapshot_path": self.pdf_snapshot_path,
-            "file_count": len(self.files) if self.files else 0,
+            "file_count": self.get_file_count(),
             "line_item_count": len(self.line_items) if self.line_items else 0,
         }
 
@@ -428,7 +538,9 @@ class UploadedFile(db.Model):
     # Associations
     rfpo_id = db.Column(db.Integer, db.ForeignKey("rfpos.id"), nullable=False, index=True)
     uploaded_by = db.Column(db.String(64), nullable=False)
-    uploaded_at = db.Column(db.DateTime, default=datetime.utcnow)
+    uploaded_at = db.Column(
+        db.DateTime, default=datetime.utcnow, server_default=_UTCNow()
+    )
 
     def to_dict(self):
         return {
@@ -463,7 +575,7 @@ class Team(db.Model):
 
     # Part of Consortium (optional - references consort_id from dropdown)
     consortium_consort_id = db.Column(
-        db.String(32), nullable=True
+        db.String(32), nullable=True, index=True
     )  # team_consort (consortium's consort_id)
 
     # Team-level user permissions (stored as JSON arrays)
@@ -476,18 +588,21 @@ class Team(db.Model):
 
     # Status and audit fields
     active = db.Column(db.Boolean, default=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(
+        db.DateTime, default=datetime.utcnow, server_default=_UTCNow()
+    )
     updated_at = db.Column(
-        db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        db.DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        server_default=_UTCNow(),
     )
     created_by = db.Column(db.String(64))
     updated_by = db.Column(db.String(64))
 
     def get_rfpo_viewer_users(self):
         """Get list of RFPO viewer user IDs for this team"""
-        if self.rfpo_viewer_user_ids:
-            return json.loads(self.rfpo_viewer_user_ids)
-        return []
+        return _json_id_list(self, "rfpo_viewer_user_ids")
 
     def set_rfpo_viewer_users(self, user_ids):
         """Set RFPO viewer user IDs from a list"""
@@ -500,9 +615,7 @@ class Team(db.Model):
 
     def get_rfpo_admin_users(self):
         """Get list of RFPO admin user IDs for this team"""
-        if self.rfpo_admin_user_ids:
-            return json.loads(self.rfpo_admin_user_ids)
-        return []
+        return _json_id_list(self, "rfpo_admin_user_ids")
 
     def set_rfpo_admin_users(self, user_ids):
         """Set RFPO admin user IDs from a list"""
@@ -513,6 +626,14 @@ class Team(db.Model):
         else:
             self.rfpo_admin_user_ids = None
 
+    @classmethod
+    def rfpo_user_filter(cls, record_id: str):
+        """SQL filter: ``record_id`` is an RFPO viewer or admin of the row"""
+        return db.or_(
+            _json_array_contains(cls.rfpo_viewer_user_ids, record_id),
+            _json_array_contains(cls.rfpo_admin_user_ids, record_id),
+        )
+
     def to_dict(self):
         return {
             "id": self.id,
@@ -623,18 +744,22 @@ class User(UserMixin, db.Model):
 
     # Status and Audit
     active = db.Column(db.Boolean, default=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    # server_default stamps rows written outside the ORM (raw SQL, psql)
+    created_at = db.Column(
+        db.DateTime, default=datetime.utcnow, server_default=_UTCNow()
+    )
     updated_at = db.Column(
-        db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        db.DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        server_default=_UTCNow(),
     )
     created_by = db.Column(db.String(64))
     updated_by = db.Column(db.String(64))
 
     def get_permissions(self) -> List[str]:
         """Get list of user permissions"""
-        if self.permissions:
-            return json.loads(self.permissions)
-        return []
+        return _json_id_list(self, "permissions")
 
     def set_permissions(self, permission_list: List[str]) -> None:
         """Set user permissions from a list"""
@@ -648,6 +773,11 @@ class User(UserMixin, db.Model):
         user_permissions = self.get_permissions()
         return permission in user_permissions
 
+    @classmethod
+    def permission_filter(cls, permission: str):
+        """SQL filter: the user holds ``permission``"""
+        return _json_array_contains(cls.permissions, permission)
+
     def is_super_admin(self) -> bool:
         """Check if user is a super admin (GOD permission)"""
         return self.has_permission("GOD")
@@ -660,6 +790,24 @@ class User(UserMixin, db.Model):
         """Check if user has RFPO user permissions"""
         return self.has_permission("RFPO_USER") or self.is_rfpo_admin()
 
+    def check_password(self, password: str) -> bool:
+        """Verify a plaintext password against password_hash (cached on success)"""
+        if not self.password_hash or password is None:
+            return False
+        key = _verified_password_key(self.id, password)
+        with _verified_passwords_lock:
+            if _verified_passwords.get(key) == self.password_hash:
+                _verified_passwords.move_to_end(key)
+                return True
+        if not check_password_hash(self.password_hash, password):
+            return False
+        with _verified_passwords_lock:
+            _verified_passwords[key] = self.password_hash
+            _verified_passwords.move_to_end(key)
+            while len(_verified_passwords) > _VERIFIED_PASSWORD_MAX:
+                _verified_passwords.popitem(last=False)
+        return True
+
     def get_display_name(self) -> str:
         """Get formatted display name"""
         return self.fullname if self.fullname else self.email
@@ -898,7 +1046,7 @@ class UserTeam(db.Model):
 
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
-    team_id = db.Column(db.Integer, db.ForeignKey("teams.id"), nullable=False)
+    team_id = db.Column(db.Integer, db.ForeignKey("teams.id"), nullable=False, index=True)
 
     # Role/Permission within the team (optional)
     role = db.Column(db.String(64))  # e.g., 'member', 'admin', 'viewer'
@@ -987,9 +1135,7 @@ class Project(db.Model):
 
     def get_consortium_ids(self):
         """Get list of consortium IDs this project belongs to"""
-        if self.consortium_ids:
-            return json.loads(self.consortium_ids)
-        return []
+        return _json_id_list(self, "consortium_ids")
 
     def set_consortium_ids(self, consortium_id_list):
         """Set consortium IDs from a list"""
@@ -1002,9 +1148,7 @@ class Project(db.Model):
 
     def get_rfpo_viewer_users(self):
         """Get list of RFPO viewer user IDs for this project"""
-        if self.rfpo_viewer_user_ids:
-            return json.loads(self.rfpo_viewer_user_ids)
-        return []
+        return _json_id_list(self, "rfpo_viewer_user_ids")
 
     def set_rfpo_viewer_users(self, user_ids):
         """Set RFPO viewer user IDs from a list"""
@@ -1015,6 +1159,11 @@ class Project(db.Model):
         else:
             self.rfpo_viewer_user_ids = None
 
+    @classmethod
+    def rfpo_viewer_filter(cls, record_id: str):
+        """SQL filter: ``record_id`` is an RFPO viewer of the project"""
+        return _json_array_contains(cls.rfpo_viewer_user_ids, record_id)
+
     def is_multi_consortium(self):
         """Check if project belongs to multiple consortiums"""
         return len(self.get_consortium_ids()) > 1
@@ -1125,9 +1274,7 @@ class Vendor(db.Model):
 
     def get_approved_consortiums(self):
         """Get list of consortium abbreviations this vendor is approved for"""
-        if self.approved_consortiums:
-            return json.loads(self.approved_consortiums)
-        return []
+        return _json_id_list(self, "approved_consortiums")
 
     def set_approved_consortiums(self, consortium_list):
         """Set approved consortiums from a list of abbreviations"""
@@ -1222,7 +1369,7 @@ class VendorSite(db.Model):
     )  # External site ID (e.g., "00000905")
 
     # Vendor association
-    vendor_id = db.Column(db.Integer, db.ForeignKey("vendors.id"), nullable=False)
+    vendor_id = db.Column(db.Integer, db.ForeignKey("vendors.id"), nullable=False, index=True)
 
     # Contact Information (matching form field names)
     contact_name = db.Column(db.String(255))  # vendor_site_contact_name
@@ -1898,7 +2045,7 @@ class RFPOApprovalInstance(db.Model):
     )  # External instance ID
 
     # RFPO Association
-    rfpo_id = db.Column(db.Integer, db.ForeignKey("rfpos.id"), nullable=False)
+    rfpo_id = db.Column(db.Integer, db.ForeignKey("rfpos.id"), nullable=False, index=True)
 
     # Workflow Template Association (snapshot at time of creation)
     template_workflow_id = db.Column(
@@ -2138,7 +2285,7 @@ class RFPOApprovalAction(db.Model):
 
     # Instance Association
     instance_id = db.Column(
-        db.Integer, db.ForeignKey("rfpo_approval_instances.id"), nullable=False
+        db.Integer, db.ForeignKey("rfpo_approval_instances.id"), nullable=False, index=True
     )
 
     # Action Context (snapshot from instance at time of action)
@@ -2581,7 +2728,7 @@ class TicketComment(db.Model):
     __tablename__ = "ticket_comments"
 
     id = db.Column(db.Integer, primary_key=True)
-    ticket_id = db.Column(db.Integer, db.ForeignKey("tickets.id", ondelete="CASCADE"), nullable=False)
+    ticket_id = db.Column(db.Integer, db.ForeignKey("tickets.id", ondelete="CASCADE"), nullable=False, index=True)
     user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
     content = db.Column(db.Text, nullable=False)
     is_internal = db.Column(db.Boolean, nullable=False, default=False)
@@ -2609,7 +2756,7 @@ class TicketAttachment(db.Model):
 
     id = db.Column(db.Integer, primary_key=True)
     file_id = db.Column(db.String(36), unique=True, nullable=False)
-    ticket_id = db.Column(db.Integer, db.ForeignKey("tickets.id", ondelete="CASCADE"), nullable=False)
+    ticket_id = db.Column(db.Integer, db.ForeignKey("tickets.id", ondelete="CASCADE"), nullable=False, index=True)
     original_filename = db.Column(db.String(256), nullable=False)
     stored_filename = db.Column(db.String(256), nullable=False)
     file_path = db.Column(db.String(512), nullable=False)
@@ -2638,3 +2785,47 @@ class TicketAttachment(db.Model):
 
     def __repr__(self):
         return f"<TicketAttachment {self.file_id}: {self.original_filename}>"
+
+
+# Fingerprint of every mapped table and column.  It changes automatically
+# when a model is added or altered, so ensure_schema() never skips
+# create_all() against a stale marker.
+SCHEMA_VERSION = hashlib.sha256(
+    "\n".join(
+        f"{table.name}:{','.join(column.name for column in table.columns)}"
+        for table in sorted(db.metadata.tables.values(), key=lambda t: t.name)
+    ).encode()
+).hexdigest()[:16]
+
+
+def ensure_schema(force: bool = False) -> bool:
+    """Run db.create_all() unless the recorded schema version is current
+
+    Warm starts cost one SELECT against ``schema_meta`` instead of a
+    per-table existence check.  Must be called inside an app context.
+
+    Returns:
+        True if create_all() ran, False if it was skipped
+    """
+    if not force:
+        try:
+            recorded = db.session.execute(
+                text("SELECT version FROM schema_meta")
+            ).scalar()
+        except SQLAlchemyError:
+            db.session.rollback()
+            recorded = None
+        if recorded == SCHEMA_VERSION:
+            return False
+
+    db.create_all()
+    db.session.execute(
+        text("CREATE TABLE IF NOT EXISTS schema_meta (version VARCHAR(64) NOT NULL)")
+    )
+    db.session.execute(text("DELETE FROM schema_meta"))
+    db.session.execute(
+        text("INSERT INTO schema_meta (version) VALUES (:version)"),
+        {"version": SCHEMA_VERSION},
+    )
+    db.session.commit()
+    return True
@@ -6,7 +6,6 @@ Just Flask + Database connection - nothing fancy
 
 from flask import Flask, request, jsonify
 from flask_cors import CORS
-from werkzeug.security import check_password_hash
 from werkzeug.middleware.proxy_fix import ProxyFix
 import jwt
 import logging
@@ -20,6 +19,7 @@ from collections import defaultdict
 # Import our models
 from models import (
     db,
+    ensure_schema,
     User,
     Team,
     UserTeam,
@@ -89,7 +89,7 @@ app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
 db.init_app(app)
 
 with app.app_context():
-    db.create_all()
+    ensure_schema()
 
 
 @app.teardown_appcontext
@@ -592,7 +592,7 @@ def login():
         return jsonify({"success": False, "message": "Invalid credentials"}), 401
 
     # Check password
-    if not check_password_hash(user.password_hash, password):
+    if not user.check_password(password):
         _record_login_attempt(client_ip)
         return jsonify({"success": False, "message": "Invalid credentials"}), 401
 
@@ -858,7 +858,7 @@ def change_password():
         user = request.current_user
 
         # Verify current password
-        if not check_password_hash(user.password_hash, current_password):
+        if not user.check_password(current_password):
             return (
                 jsonify({"success": False, "message": "Current password is incorrect"}),
                 400,
@@ -2338,7 +2338,9 @@ def get_user_permissions_summary():
 
         # Direct consortium access
         direct_consortium_access = []
-        all_consortiums = Consortium.query.all()
+        all_consortiums = Consortium.query.filter(
+            Consortium.rfpo_user_filter(user.record_id)
+        ).all()
         for consortium in all_consortiums:
             viewer_users = consortium.get_rfpo_viewer_users()
             admin_users = consortium.get_rfpo_admin_users()
@@ -2537,39 +2539,31 @@ def list_rfpos():
             user_teams = user.get_teams()
             team_ids = [team.id for team in user_teams]
 
-            # Also check team-level viewer/admin JSON arrays
-            all_teams = Team.query.filter_by(active=True).all()
-            for team in all_teams:
-                viewers = team.get_rfpo_viewer_users()
-                admins = team.get_rfpo_admin_users()
-                if user.record_id in viewers or \
-                   user.record_id in admins:
-                    if team.id not in team_ids:
-                        team_ids.append(team.id)
+            # Also check team-level viewer/admin JSON arrays (matched in SQL)
+            member_teams = Team.query.filter(
+                Team.active.is_(True), Team.rfpo_user_filter(user.record_id)
+            ).with_entities(Team.id)
+            for (team_id,) in member_teams:
+                if team_id not in team_ids:
+                    team_ids.append(team_id)
 
             # 3. Consortium access — viewer/admin JSON arrays
-            accessible_consortium_ids = []
-            all_consortiums = Consortium.query.filter_by(
-                active=True
-            ).all()
-            for consortium in all_consortiums:
-                viewers = consortium.get_rfpo_viewer_users()
-                admins = consortium.get_rfpo_admin_users()
-                if user.record_id in viewers or \
-                   user.record_id in admins:
-                    accessible_consortium_ids.append(
-                        consortium.consort_id
-                    )
+            accessible_consortium_ids = [
+                consort_id
+                for (consort_id,) in Consortium.query.filter(
+                    Consortium.active.is_(True),
+                    Consortium.rfpo_user_filter(user.record_id),
+                ).with_entities(Consortium.consort_id)
+            ]
 
             # 4. Project access — viewer JSON arrays
-            all_projects = Project.query.filter_by(active=True).all()
-            accessible_project_ids = []
-            for project in all_projects:
-                viewer_users = project.get_rfpo_viewer_users()
-                if user.record_id in viewer_users:
-                    accessible_project_ids.append(
-                        project.project_id
-                    )
+            accessible_project_ids = [
+                project_id
+                for (project_id,) in Project.query.filter(
+                    Project.active.is_(True),
+                    Project.rfpo_viewer_filter(user.record_id),
+                ).with_entities(Project.project_id)
+            ]
 
             # 5. Approver access — assigned in workflow steps
             #    (primary or backup approver)
@@ -2675,21 +2669,44 @@ def list_rfpos():
             except ValueError:
                 pass
 
-        # Order and paginate
-        query = query.order_by(RFPO.created_at.desc())
+        # Order and paginate; select only the listed columns (vendor name
+        # joined in) so rows skip ORM hydration and per-row vendor loads
+        query = (
+            query.outerjoin(Vendor, RFPO.vendor_id == Vendor.id)
+            .with_entities(
+                RFPO.id,
+                RFPO.rfpo_id,
+                RFPO.title,
+                RFPO.status,
+                RFPO.total_amount,
+                Vendor.company_name.label("vendor_name"),
+                RFPO.due_date,
+                RFPO.created_at,
+            )
+            .order_by(RFPO.created_at.desc())
+        )
         pagination = query.paginate(page=page, per_page=per_page, error_out=False)
         rfpos = pagination.items
 
         # Build a lookup of pending approval action_ids for this user
         pending_action_map = {}  # rfpo_id -> action_id
         try:
-            user_pending = RFPOApprovalAction.query.filter_by(
-                approver_id=user.record_id, status="pending"
-            ).all()
-            for pa in user_pending:
-                inst = RFPOApprovalInstance.query.get(pa.instance_id)
-                if inst and inst.rfpo_id:
-                    pending_action_map[inst.rfpo_id] = pa.action_id
+            user_pending = (
+                db.session.query(
+                    RFPOApprovalInstance.rfpo_id, RFPOApprovalAction.action_id
+                )
+                .join(
+                    RFPOApprovalInstance,
+                    RFPOApprovalAction.instance_id == RFPOApprovalInstance.id,
+                )
+                .filter(
+                    RFPOApprovalAction.approver_id == user.record_id,
+                    RFPOApprovalAction.status == "pending",
+                    RFPOApprovalInstance.rfpo_id.in_([r.id for r in rfpos]),
+                )
+            )
+            for rfpo_pk, action_id in user_pending:
+                pending_action_map[rfpo_pk] = action_id
         except Exception as e:
             app.logger.warning(f"Failed to load pending actions: {e}")
 
@@ -2703,7 +2720,7 @@ def list_rfpos():
                         "title": r.title,
                         "status": r.status,
                         "total_amount": float(r.total_amount) if r.total_amount else 0,
-                        "vendor": r.vendor.company_name if r.vendor else None,
+                        "vendor": r.vendor_name,
                         "due_date": r.due_date.isoformat() if r.due_date else None,
                         "created_at": (
                             r.created_at.isoformat() if r.created_at else None
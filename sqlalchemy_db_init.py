@@ -8,7 +8,8 @@ import os
 import sys
 from werkzeug.security import generate_password_hash
 from datetime import datetime
-from env_config import get_database_url, validate_configuration
+from sqlalchemy import insert
+from env_config import config, get_database_url, validate_configuration
 
 # Load DATABASE_URL from environment variables
 os.environ["DATABASE_URL"] = get_database_url()
@@ -72,7 +73,9 @@ def create_admin_user(app, force_recreate=False):
 
         # Hash the password using Werkzeug (same as custom_admin.py)
         password = "admin123"
-        password_hash = generate_password_hash(password)
+        password_hash = generate_password_hash(
+            password, method=config.PASSWORD_HASH_METHOD
+        )
 
         # Create admin user
         admin_user = User(
@@ -249,27 +252,30 @@ def initialize_reference_data(app):
             ("RFPO_APPRO", approval_types),
         ]
 
-        created_count = 0
-        for list_type, items in reference_data_sets:
-            for key, value in items:
-                # Check if item already exists
-                existing_item = List.query.filter_by(type=list_type, key=key).first()
-
-                if not existing_item:
-                    # Generate a list_id
-                    list_id = f"{created_count:010d}"
-
-                    new_item = List(
-                        list_id=list_id,
-                        type=list_type,
-                        key=key,
-                        value=value,
-                        active=True,
-                        created_at=datetime.utcnow(),
-                        updated_at=datetime.utcnow(),
-                    )
-                    db.session.add(new_item)
-                    created_count += 1
+        # One query for what already exists, then one multi-row INSERT
+        # (executemany / insertmanyvalues) instead of a SELECT + flush per item
+        existing = set(db.session.query(List.type, List.key).all())
+        now = datetime.utcnow()
+        new_items = [
+            {
+                "list_id": f"{index:010d}",
+                "type": list_type,
+                "key": key,
+                "value": value,
+                "active": True,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for index, (list_type, key, value) in enumerate(
+                (list_type, key, value)
+                for list_type, items in reference_data_sets
+                for key, value in items
+                if (list_type, key) not in existing
+            )
+        ]
+        created_count = len(new_items)
+        if new_items:
+            db.session.execute(insert(List), new_items)
 
         if created_count > 0:
             db.session.commit()
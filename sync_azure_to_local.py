@@ -18,13 +18,10 @@ from sqlalchemy.orm import sessionmaker
 sys.path.insert(0, os.path.dirname(__file__) or ".")
 
 from models import db  # noqa: E402 — imports all models via relationships
+from env_config import get_env  # noqa: E402
 
 # Azure source (read-only)
-AZURE_URL = os.environ.get(
-    "AZURE_DATABASE_URL",
-    "postgresql://rfpoadmin:RfpoSecure123!@"
-    "rfpo-db-5kn5bsg47vvac.postgres.database.azure.com:5432/rfpodb?sslmode=require",
-)
+AZURE_URL = get_env("AZURE_DATABASE_URL", required=True)
 
 # Local target
 LOCAL_DB = os.path.join(os.path.dirname(__file__) or ".", "instance", "rfpo_admin.db")
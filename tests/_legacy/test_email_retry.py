@@ -112,6 +112,9 @@ class TestSMTPRetry(unittest.TestCase):
         self.assertEqual(svc.failed_queue_size, 0)
         mock_smtp.assert_called_once()
         mock_server.send_message.assert_called_once()
+        # Session stays open for reuse until close()
+        mock_server.quit.assert_not_called()
+        svc.close()
         mock_server.quit.assert_called_once()
 
     @patch("email_service.time.sleep")
@@ -372,6 +375,7 @@ class TestACSRetry(unittest.TestCase):
         svc.default_sender = "test@example.com"
         svc.acs_connection_string = "endpoint=https://test.comm.azure.com/;accesskey=abc123"
         svc.acs_sender_email = "acs@mail.com"
+        svc._validate_config()
         return svc
 
     @patch("email_service.time.sleep")
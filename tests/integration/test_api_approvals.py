@@ -297,3 +297,30 @@ class TestReassignment:
             "new_approver_id": admin.id,
         }, headers=_auth(tok))
         assert resp.status_code in (404, 400)
+
+
+# ── Approver status sync ─────────────────────────────────────────────────────
+
+class TestSyncApproverStatus:
+    def test_sync_flags_primary_and_backup_and_clears_stale(self):
+        from custom_admin import sync_all_users_approver_status
+
+        n = _uid()
+        cons = Consortium(consort_id=f"CS{n:04d}", name=f"C {n}", abbrev=f"CS{n}")
+        db.session.add(cons)
+        db.session.commit()
+        primary, backup, stale = _make_user(), _make_user(), _make_user()
+        stale.is_approver = True
+        db.session.commit()
+        _seed_workflow(cons, primary, backup=backup)
+
+        assert sync_all_users_approver_status(updated_by="sync") >= 3
+        for user in (primary, backup, stale):
+            db.session.refresh(user)
+        assert primary.is_approver is True
+        assert backup.is_approver is True
+        assert stale.is_approver is False
+        assert primary.updated_by == "sync"
+
+        # Nothing changed since the last sync
+        assert sync_all_users_approver_status() == 0
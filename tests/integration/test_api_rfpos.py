@@ -6,7 +6,10 @@ import json
 import pytest
 from werkzeug.security import generate_password_hash
 
-from models import db, User, Consortium, Team, Project, Vendor, RFPO, RFPOLineItem
+from models import (
+    db, User, Consortium, Team, Project, Vendor, RFPO, RFPOLineItem,
+    RFPOApprovalWorkflow, RFPOApprovalInstance, RFPOApprovalAction,
+)
 
 pytestmark = [pytest.mark.integration, pytest.mark.rfpo]
 
@@ -121,6 +124,49 @@ class TestRFPOList:
         resp = client.get("/api/rfpos", headers=_auth(token))
         rfpos = resp.get_json().get("rfpos") or resp.get_json().get("data", [])
         assert len(rfpos) >= 1
+        assert rfpos[0]["vendor"] == vendor.company_name
+        assert rfpos[0]["pending_action_id"] is None
+
+    def test_list_rfpos_pending_action_id(self, client):
+        admin = _seed_admin()
+        other = _seed_user()
+        token = _login(client, admin.email)
+        cons, team, proj, vendor = _seed_full_context()
+        for _ in range(3):
+            client.post("/api/rfpos", json=_rfpo_payload(cons, team, proj, vendor),
+                        headers=_auth(token))
+        rfpo_mine, rfpo_other, rfpo_none = (
+            RFPO.query.filter_by(consortium_id=cons.consort_id).order_by(RFPO.id).all()
+        )
+
+        n = _uid()
+        wf = RFPOApprovalWorkflow(
+            workflow_id=f"WF{n:04d}", name=f"WF-{n}", consortium_id=cons.consort_id,
+        )
+        db.session.add(wf)
+        db.session.flush()
+        for i, (rfpo, approver) in enumerate(((rfpo_mine, admin), (rfpo_other, other))):
+            inst = RFPOApprovalInstance(
+                instance_id=f"INS{n:04d}{i}", rfpo_id=rfpo.id,
+                template_workflow_id=wf.id, workflow_name=wf.name,
+                workflow_version="1.0", consortium_id=cons.consort_id,
+                overall_status="waiting",
+            )
+            db.session.add(inst)
+            db.session.flush()
+            db.session.add(RFPOApprovalAction(
+                action_id=f"ACT{n:04d}{i}", instance_id=inst.id,
+                stage_order=1, step_order=1, stage_name="Stage 1", step_name="Step 1",
+                approval_type_key="RFPO_APPRO_TECH", approver_id=approver.record_id,
+                approver_name=approver.fullname, status="pending",
+            ))
+        db.session.commit()
+
+        resp = client.get("/api/rfpos", headers=_auth(token))
+        by_id = {r["id"]: r for r in resp.get_json()["rfpos"]}
+        assert by_id[rfpo_mine.id]["pending_action_id"] == f"ACT{n:04d}0"
+        assert by_id[rfpo_other.id]["pending_action_id"] is None
+        assert by_id[rfpo_none.id]["pending_action_id"] is None
 
 
 # ── RFPO create ──────────────────────────────────────────────────────────────
@@ -0,0 +1,475 @@
+"""
+Unit Tests — email_service module.
+
+Covers concurrent fan-out and message construction helpers.  No real
+SMTP/ACS traffic: ``send_email`` or the SMTP factory is patched per test.
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from email_service import EmailService
+
+pytestmark = [pytest.mark.unit, pytest.mark.email]
+
+
+@pytest.fixture
+def svc(monkeypatch):
+    for key in (
+        "MAIL_USERNAME",
+        "MAIL_PASSWORD",
+        "SMTP_USERNAME",
+        "SMTP_PASSWORD",
+        "GMAIL_USER",
+        "GMAIL_APP_PASSWORD",
+        "ACS_CONNECTION_STRING",
+        "ACS_SENDER_EMAIL",
+    ):
+        monkeypatch.delenv(key, raising=False)
+    return EmailService(config={"retry_base_delay": 0})
+
+
+class TestSendMany:
+    def test_results_in_input_order(self, svc, monkeypatch):
+        def fake_send(**kwargs):
+            return kwargs["subject"] != "bad"
+
+        monkeypatch.setattr(svc, "send_email", fake_send)
+        messages = [
+            {"to_emails": ["a@x.com"], "subject": "ok", "body_text": "hi"},
+            {"to_emails": ["b@x.com"], "subject": "bad", "body_text": "hi"},
+            {"to_emails": ["c@x.com"], "subject": "ok", "body_text": "hi"},
+        ]
+        assert asyncio.run(svc.send_many(messages)) == [True, False, True]
+
+    def test_empty_batch(self, svc):
+        assert asyncio.run(svc.send_many([])) == []
+
+    def test_concurrency_is_bounded(self, svc, monkeypatch):
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def fake_send(**kwargs):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.02)
+            with lock:
+                state["active"] -= 1
+            return True
+
+        monkeypatch.setattr(svc, "send_email", fake_send)
+        messages = [{"to_emails": [f"u{i}@x.com"], "subject": "s", "body_text": "b"} for i in range(12)]
+        results = asyncio.run(svc.send_many(messages, max_concurrent=3))
+        assert all(results)
+        assert state["peak"] <= 3
+
+
+class TestConcurrentSendResults:
+    def test_send_many_logs_each_message_id_and_provider(self, app, svc, monkeypatch):
+        import models
+
+        n = 4  # within the default to_thread executor's minimum of 5 workers
+        barrier = threading.Barrier(n, timeout=5)
+
+        class FakeAcsClient:
+            def begin_send(self, message):
+                barrier.wait()  # every send is in flight at once
+                to = message["recipients"]["to"][0]["address"]
+                return SimpleNamespace(result=lambda: {"messageId": f"id-{to}"})
+
+            def get_send_status(self, message_id):
+                time.sleep(0.01)  # let the other sends record their ids meanwhile
+                return {"status": "Succeeded"}
+
+        rows = []
+        # Capture the EmailLog fields instead of writing from many threads
+        monkeypatch.setattr(models, "EmailLog", lambda **kw: kw)
+        monkeypatch.setattr(models.db.session, "add", rows.append)
+        monkeypatch.setattr(models.db.session, "commit", lambda: None)
+        monkeypatch.setattr("email_service._is_kill_switch_on", lambda: False)
+        monkeypatch.setattr(
+            "email_service._get_email_test_settings", lambda: {"test_mode": False, "test_recipient": ""}
+        )
+        svc._acs_ready = True
+        monkeypatch.setattr(svc, "_get_acs_client", FakeAcsClient)
+        svc.acs_sender_email = "noreply@x.com"
+
+        messages = [{"to_emails": [f"u{i}@x.com"], "subject": "s", "body_text": "b"} for i in range(n)]
+        with app.app_context():
+            assert asyncio.run(svc.send_many(messages, max_concurrent=n)) == [True] * n
+
+        logged = {json.loads(row["to_emails"])[0]: row for row in rows}
+        assert len(rows) == n
+        for i in range(n):
+            row = logged[f"u{i}@x.com"]
+            assert row["message_id"] == f"id-u{i}@x.com"
+            assert row["provider"] == "ACS"
+            assert row["status"] == "sent"
+        assert svc.last_message_id is None  # concurrent sends leave last_* alone
+
+
+class TestTemplatedEmail:
+    def test_caller_date_fields_are_kept(self, svc, monkeypatch):
+        captured = {}
+
+        def fake_send(**kwargs):
+            captured.update(kwargs)
+            return True
+
+        monkeypatch.setattr(svc, "send_email", fake_send)
+        data = {"user_name": "Pat", "current_date": "October 01, 2026"}
+        assert svc.send_templated_email(["p@x.com"], "welcome", data, subject="Hi")
+        assert data["current_date"] == "October 01, 2026"
+        assert isinstance(data["current_year"], int)
+        assert "October 01, 2026" in captured["body_html"]
+
+    def test_subject_from_data_or_default(self, svc, monkeypatch):
+        subjects = []
+        monkeypatch.setattr(svc, "send_email", lambda **kw: subjects.append(kw["subject"]) or True)
+        svc.send_templated_email(["p@x.com"], "welcome", {"subject": "From data"})
+        svc.send_templated_email(["p@x.com"], "welcome", {"subject": ""})
+        assert subjects == ["From data", "RFPO Application - Welcome"]
+
+
+class TestAttachments:
+    def test_bytes_and_path_encode_identically(self, tmp_path):
+        from email_service import _build_attachment_part
+
+        payload = bytes(range(256)) * 200
+        f = tmp_path / "report.pdf"
+        f.write_bytes(payload)
+
+        from_bytes = _build_attachment_part({"filename": "report.pdf", "content": payload})
+        from_path = _build_attachment_part({"filename": "report.pdf", "path": str(f)})
+        assert from_bytes.get_payload() == from_path.get_payload()
+        assert from_path.get_payload(decode=True) == payload
+        assert from_path["Content-Transfer-Encoding"] == "base64"
+
+    def test_missing_payload_skipped(self):
+        from email_service import _build_attachment_part
+
+        assert _build_attachment_part({"filename": "x.txt"}) is None
+
+
+class TestFirstEnv:
+    def test_precedence_and_blank_fallthrough(self, monkeypatch):
+        from email_service import _first_env
+
+        monkeypatch.setenv("MAIL_SERVER", "")
+        monkeypatch.setenv("SMTP_SERVER", "smtp.example.com")
+        assert _first_env("MAIL_SERVER", "SMTP_SERVER", default="smtp.gmail.com") == "smtp.example.com"
+
+    def test_default_when_unset(self, monkeypatch):
+        from email_service import _first_env
+
+        monkeypatch.delenv("MAIL_PORT", raising=False)
+        monkeypatch.delenv("SMTP_PORT", raising=False)
+        assert _first_env("MAIL_PORT", "SMTP_PORT", default=587) == 587
+
+
+class TestSmtpMessage:
+    def test_text_only_is_single_part(self):
+        from email_service import _build_smtp_message
+
+        msg = _build_smtp_message("f@x.com", ["t@x.com"], "Hi", None, None, "plain body", None, None)
+        assert not msg.is_multipart()
+        assert msg.get_content_type() == "text/plain"
+
+    def test_text_html_and_attachment(self):
+        from email_service import _build_smtp_message
+
+        msg = _build_smtp_message(
+            "f@x.com",
+            ["t@x.com", "u@x.com"],
+            "Hi",
+            ["c@x.com"],
+            None,
+            "plain body",
+            "<p>html body</p>",
+            [{"filename": "a.bin", "content": b"\x00\x01"}],
+        )
+        assert msg["To"] == "t@x.com, u@x.com"
+        assert msg["Cc"] == "c@x.com"
+        assert msg.get_content_type() == "multipart/mixed"
+        body = msg.get_body(preferencelist=("html", "plain"))
+        assert "html body" in body.get_content()
+        (att,) = list(msg.iter_attachments())
+        assert att.get_filename() == "a.bin"
+        assert att.get_payload(decode=True) == b"\x00\x01"
+
+
+class TestProviderReadiness:
+    def test_acs_client_not_built_when_unconfigured(self, svc, monkeypatch):
+        assert svc._acs_ready is False
+
+        def boom():
+            raise AssertionError("_get_acs_client should not be called")
+
+        monkeypatch.setattr(svc, "_get_acs_client", boom)
+        monkeypatch.setattr("email_service._is_kill_switch_on", lambda: False)
+        assert svc.send_email(["a@x.com"], "Subject", body_text="hi") is False
+        assert svc.last_error == "Missing SMTP credentials"
+
+    def test_acs_client_shared_per_connection_string(self, monkeypatch):
+        import email_service
+
+        built = []
+
+        class FakeClient:
+            @classmethod
+            def from_connection_string(cls, conn):
+                built.append(conn)
+                return cls()
+
+        conn = "endpoint=https://unit.communication.azure.com/;accesskey=abc"
+        monkeypatch.setattr(email_service, "EmailClient", FakeClient)
+        monkeypatch.setattr(email_service, "_ACS_CLIENTS", {})
+        monkeypatch.setenv("ACS_CONNECTION_STRING", conn)
+        monkeypatch.setenv("ACS_SENDER_EMAIL", "noreply@x.com")
+
+        first, second = EmailService(), EmailService()
+        assert first._get_acs_client() is second._get_acs_client()
+        assert built == [conn]
+
+
+class TestHtmlToText:
+    def test_links_preserved_and_styles_dropped(self):
+        from email_service import _html_to_text
+
+        html = (
+            "<html><head><style>body { color: red; }</style></head><body>"
+            '<p>Hello <a href="https://x.com/login"><b>Log in</b></a> now &amp; later</p>'
+            "</body></html>"
+        )
+        text = _html_to_text(html)
+        assert "Log in (https://x.com/login) now & later" in text
+        assert "color" not in text
+
+    def test_regex_fallback_without_lxml(self, monkeypatch):
+        import email_service
+
+        monkeypatch.setattr(email_service, "lxml_html", None)
+        text = email_service._html_to_text('<p><a href="https://x.com">Go</a></p>')
+        assert text == "Go (https://x.com)"
+
+
+class TestAcsConnectionString:
+    def test_parses_mixed_case_keys_and_padded_key(self):
+        from email_service import _parse_acs_connection_string
+
+        endpoint, key = _parse_acs_connection_string("endpoint=https://r.communication.azure.com/; accessKey=abc+/12==")
+        assert endpoint == "https://r.communication.azure.com/"
+        assert key == "abc+/12=="
+
+    def test_missing_key_raises(self):
+        from email_service import _parse_acs_connection_string
+
+        with pytest.raises(ValueError, match="missing endpoint or access key"):
+            _parse_acs_connection_string("endpoint=https://r.communication.azure.com/")
+
+
+class TestSmtpSessionReuse:
+    def _smtp_svc(self, svc):
+        svc.username = "user@x.com"
+        svc.password = "pw"
+        svc.default_sender = "user@x.com"
+        return svc
+
+    def test_batch_reuses_one_session(self, svc, monkeypatch):
+        from unittest.mock import MagicMock
+
+        server = MagicMock()
+        server.noop.return_value = (250, b"OK")
+        factory = MagicMock(return_value=server)
+        monkeypatch.setattr(self._smtp_svc(svc), "_create_smtp_connection", factory)
+        monkeypatch.setattr("email_service._is_kill_switch_on", lambda: False)
+
+        results = svc.send_batch([{"to_emails": [f"u{i}@x.com"], "subject": "s", "body_text": "b"} for i in range(3)])
+        assert results == [True, True, True]
+        assert factory.call_count == 1
+        assert server.send_message.call_count == 3
+
+    def test_batch_does_not_hold_lock_between_sends(self, svc, monkeypatch):
+        acquired = []
+
+        def fake_send(**kwargs):
+            # Another thread can take the SMTP lock while the batch is running
+            def try_lock():
+                if svc._smtp_lock.acquire(timeout=1):
+                    svc._smtp_lock.release()
+                    acquired.append(True)
+
+            t = threading.Thread(target=try_lock)
+            t.start()
+            t.join()
+            return True
+
+        monkeypatch.setattr(svc, "send_email", fake_send)
+        assert svc.send_batch([{"to_emails": ["a@x.com"], "subject": "s"}]) == [True]
+        assert acquired == [True]
+
+    def test_unused_instances_can_be_collected(self):
+        import gc
+        import weakref
+
+        ref = weakref.ref(EmailService())
+        gc.collect()
+        assert ref() is None  # no per-instance atexit hook keeps it alive
+
+    def test_stale_session_reconnects(self, svc, monkeypatch):
+        from unittest.mock import MagicMock
+
+        stale, fresh = MagicMock(), MagicMock()
+        stale.noop.side_effect = OSError("connection reset")
+        monkeypatch.setattr(self._smtp_svc(svc), "_create_smtp_connection", MagicMock(return_value=fresh))
+        monkeypatch.setattr("email_service._is_kill_switch_on", lambda: False)
+        svc._smtp = stale
+
+        assert svc.send_email(["a@x.com"], "s", body_text="b")
+        fresh.send_message.assert_called_once()
+        assert svc._smtp is fresh
+
+    def test_bulk_templated_renders_per_recipient_on_one_session(self, svc, monkeypatch):
+        from unittest.mock import MagicMock
+
+        server = MagicMock()
+        server.noop.return_value = (250, b"OK")
+        factory = MagicMock(return_value=server)
+        monkeypatch.setattr(self._smtp_svc(svc), "_create_smtp_connection", factory)
+        monkeypatch.setattr("email_service._is_kill_switch_on", lambda: False)
+
+        results = svc.send_users_added_to_project(
+            [{"email": "a@x.com", "name": "Ann"}, {"email": "b@x.com", "name": "Bob"}],
+            "Apollo",
+            "Viewer",
+        )
+        assert results == [True, True]
+        assert factory.call_count == 1
+        sent = [c.args[0] for c in server.send_message.call_args_list]
+        assert [m["To"] for m in sent] == ["a@x.com", "b@x.com"]
+        assert all(m["Subject"] == "Added to Project: Apollo" for m in sent)
+        assert "Ann" in sent[0].get_body(("html",)).get_content()
+        assert "Bob" in sent[1].get_body(("html",)).get_content()
+
+
+class TestBackgroundQueue:
+    def test_enqueue_returns_immediately_and_sends(self, svc, monkeypatch):
+        sent = []
+        gate = threading.Event()
+
+        def fake_send(**kwargs):
+            gate.wait(2)
+            sent.append(kwargs["subject"])
+            return True
+
+        monkeypatch.setattr(svc, "send_email", fake_send)
+        assert svc.enqueue_email(to_emails=["a@x.com"], subject="queued", body_text="b")
+        assert sent == []
+        gate.set()
+        svc._send_queue.join()
+        assert sent == ["queued"]
+
+    def test_full_queue_falls_back_to_sync(self, monkeypatch):
+        svc = EmailService(config={"queue_size": 1, "workers": 1})
+        gate = threading.Event()
+        calls = []
+
+        def slow(tag):
+            gate.wait(2)
+            calls.append(tag)
+            return True
+
+        assert svc.submit(slow, "first")  # picked up by the worker, blocks
+        time.sleep(0.05)
+        assert svc.submit(slow, "second")  # fills the queue
+        threading.Timer(0.1, gate.set).start()
+        assert svc.submit(slow, "third")  # queue full -> runs inline
+        assert "third" in calls
+        svc._send_queue.join()
+        assert sorted(calls) == ["first", "second", "third"]
+
+    def test_worker_sends_leave_last_result_alone(self, svc, monkeypatch):
+        monkeypatch.setattr("email_service._is_kill_switch_on", lambda: False)
+        assert svc.enqueue_email(to_emails=["a@x.com"], subject="s", body_text="b")
+        svc._send_queue.join()
+        (entry,) = svc.get_failed_queue_snapshot()
+        assert entry["last_error"] == "Missing SMTP credentials"
+        assert svc.last_error is None
+
+
+class TestRetryFailed:
+    def test_keeps_failures_enqueued_during_retry(self, svc, monkeypatch):
+        monkeypatch.setattr("email_service._is_kill_switch_on", lambda: False)
+        svc._enqueue_failed(["a@x.com"], "retry-me", "b", None, None, None, None, None)
+
+        real_log = svc._log_email
+
+        def log_and_race(**kwargs):
+            # Another thread's send fails while the retry is in progress
+            svc._enqueue_failed(["b@x.com"], "other", "b", None, None, None, None, None, last_error="boom")
+            return real_log(**kwargs)
+
+        monkeypatch.setattr(svc, "_log_email", log_and_race)
+        assert svc.retry_failed() == (0, 1)
+        queued = {e["subject"]: e for e in svc.get_failed_queue_snapshot()}
+        assert set(queued) == {"retry-me", "other"}
+        assert queued["retry-me"]["last_error"] == "Missing SMTP credentials"
+        assert queued["other"]["last_error"] == "boom"
+
+
+class TestLoadEnvFile:
+    def test_loads_once_without_overriding(self, tmp_path, monkeypatch):
+        import email_service
+
+        env = tmp_path / ".env"
+        env.write_text('# comment\nRFPO_UNIT_A="quoted"\nRFPO_UNIT_B=from-file\n')
+        monkeypatch.setenv("RFPO_UNIT_B", "from-env")
+        monkeypatch.delenv("RFPO_UNIT_A", raising=False)
+        monkeypatch.setattr(email_service, "_loaded_env_files", set())
+
+        email_service.load_env_file(str(env))
+        assert os.environ["RFPO_UNIT_A"] == "quoted"
+        assert os.environ["RFPO_UNIT_B"] == "from-env"
+
+        monkeypatch.delenv("RFPO_UNIT_A")
+        email_service.load_env_file(str(env))  # second call is a no-op
+        assert "RFPO_UNIT_A" not in os.environ
+
+
+class TestTlsSessionReuse:
+    def test_last_session_offered_on_wrap(self, monkeypatch):
+        import ssl
+        from email_service import _make_smtp_tls_context
+
+        seen = {}
+
+        def fake_wrap(self, sock, *args, **kwargs):
+            seen.update(kwargs)
+            return sock
+
+        monkeypatch.setattr(ssl.SSLContext, "wrap_socket", fake_wrap)
+        ctx = _make_smtp_tls_context()
+        ctx.wrap_socket("sock", server_hostname="smtp.x.com")
+        assert "session" not in seen
+
+        ctx.last_session = sentinel = object()
+        ctx.wrap_socket("sock", server_hostname="smtp.x.com")
+        assert seen["session"] is sentinel
+
+    def test_starttls_uses_shared_context(self, svc, monkeypatch):
+        from unittest.mock import MagicMock
+
+        server = MagicMock()
+        server.sock.session = "tls-session"
+        monkeypatch.setattr("email_service.smtplib.SMTP", MagicMock(return_value=server))
+        svc.use_tls = True
+        svc._create_smtp_connection()
+        server.starttls.assert_called_once_with(context=svc._tls_context)
+        assert svc._tls_context.last_session == "tls-session"
@@ -59,3 +59,58 @@ class TestGetSecretKey:
         with patch.dict(os.environ, {"FLASK_SECRET_KEY": "CHANGE-ME-to-something-secure-and-long-enough"}):
             with pytest.raises(ConfigError, match="default"):
                 get_secret_key("FLASK_SECRET_KEY")
+
+
+class TestLazyConfig:
+    def test_reads_on_first_access_and_caches(self):
+        from env_config import Config
+
+        cfg = Config()
+        with patch.dict(os.environ, {"MAIL_PORT": "2525", "DEBUG": "TRUE"}):
+            assert cfg.MAIL_PORT == 2525
+            assert cfg.DEBUG is True
+        # Cached: later env changes don't affect this instance
+        with patch.dict(os.environ, {"MAIL_PORT": "25"}):
+            assert cfg.MAIL_PORT == 2525
+
+    def test_blank_openai_values_use_defaults(self):
+        from env_config import Config
+
+        with patch.dict(os.environ, {"AZURE_OPENAI_DEPLOYMENT": "", "AZURE_OPENAI_BUDGET_LIMIT": ""}):
+            cfg = Config()
+            assert cfg.AZURE_OPENAI_DEPLOYMENT == "gpt-4o"
+            assert cfg.AZURE_OPENAI_BUDGET_LIMIT == 100.0
+
+    def test_unknown_attribute(self):
+        from env_config import Config
+
+        with pytest.raises(AttributeError):
+            Config().NOT_A_SETTING
+
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            ("True", True),
+            ("1", True),
+            ("yes", True),
+            (" ON ", True),
+            ("False", False),
+            ("0", False),
+            ("", False),
+            ("nope", False),
+        ],
+    )
+    def test_bool_settings(self, raw, expected):
+        from env_config import Config
+
+        with patch.dict(os.environ, {"FORCE_HTTPS": raw}):
+            assert Config().FORCE_HTTPS is expected
+
+    def test_password_hash_method(self):
+        from env_config import Config
+
+        with patch.dict(os.environ, {}, clear=False):
+            os.environ.pop("PASSWORD_HASH_METHOD", None)
+            assert Config().PASSWORD_HASH_METHOD == "scrypt"
+        with patch.dict(os.environ, {"PASSWORD_HASH_METHOD": "pbkdf2:sha256:1000"}):
+            assert Config().PASSWORD_HASH_METHOD == "pbkdf2:sha256:1000"
@@ -0,0 +1,105 @@
+"""
+Unit Tests — error_handlers module.
+
+Registers the shared handlers on a throwaway Flask app and checks the
+JSON (API) vs HTML (web) response split and status codes.
+"""
+
+import os
+
+import pytest
+from flask import Flask
+
+from error_handlers import register_error_handlers
+from exceptions import AuthorizationException, ValidationException
+
+pytestmark = pytest.mark.unit
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "templates")
+
+
+@pytest.fixture
+def error_app():
+    app = Flask(__name__, template_folder=TEMPLATE_DIR)
+    app.config["TESTING"] = True
+    register_error_handlers(app, "unit_errors")
+
+    @app.route("/api/forbidden")
+    def api_forbidden():
+        raise AuthorizationException("nope")
+
+    @app.route("/api/invalid")
+    def api_invalid():
+        raise ValidationException("bad input", payload={"field": "name"})
+
+    @app.route("/page/forbidden")
+    def page_forbidden():
+        raise AuthorizationException("nope")
+
+    return app
+
+
+class TestErrorHandlers:
+    def test_api_path_returns_json(self, error_app):
+        resp = error_app.test_client().get("/api/forbidden")
+        assert resp.status_code == 403
+        assert resp.get_json() == {
+            "success": False,
+            "error": "nope",
+            "error_type": "AuthorizationException",
+        }
+
+    def test_validation_payload_included(self, error_app):
+        resp = error_app.test_client().get("/api/invalid")
+        assert resp.status_code == 400
+        assert resp.get_json()["validation_errors"] == {"field": "name"}
+
+    def test_web_path_returns_html(self, error_app):
+        resp = error_app.test_client().get("/page/forbidden")
+        assert resp.status_code == 403
+        assert resp.mimetype == "text/html"
+        assert b"nope" in resp.data
+
+    def test_not_found_json_and_html(self, error_app):
+        client = error_app.test_client()
+        api = client.get("/api/missing")
+        assert api.status_code == 404
+        assert api.get_json()["error_type"] == "NotFound"
+        page = client.get("/missing")
+        assert page.status_code == 404
+        assert b"Page not found" in page.data
+
+    def test_html_escapes_dynamic_message(self, error_app):
+        @error_app.route("/page/xss")
+        def page_xss():
+            raise ValidationException("<script>x</script>")
+
+        resp = error_app.test_client().get("/page/xss")
+        assert resp.status_code == 400
+        assert b"<script>x</script>" not in resp.data
+        assert b"&lt;script&gt;" in resp.data
+
+    def test_log_exception_skipped_when_error_disabled(self, error_app, monkeypatch):
+        import logging
+        import error_handlers
+
+        calls = []
+        monkeypatch.setattr(error_handlers, "log_exception", lambda *a, **k: calls.append(a))
+
+        @error_app.route("/api/boom")
+        def api_boom():
+            raise RuntimeError("boom")
+
+        logger = logging.getLogger("unit_errors")
+        previous = logger.level
+        try:
+            logger.setLevel(logging.CRITICAL)
+            resp = error_app.test_client().get("/api/boom")
+            assert resp.status_code == 500
+            assert calls == []
+
+            logger.setLevel(logging.DEBUG)
+            error_app.test_client().get("/api/boom")
+            assert len(calls) == 1
+        finally:
+            logger.setLevel(previous)
@@ -52,3 +52,27 @@ class TestExceptions:
     def test_exception_str(self):
         e = ResourceNotFoundException("RFPO not found")
         assert str(e) == "RFPO not found"
+
+    def test_to_dict_error_type_per_subclass(self):
+        class CustomException(ValidationException):
+            pass
+
+        assert RFPOException("x").to_dict()["error_type"] == "RFPOException"
+        assert ValidationException("x").to_dict()["error_type"] == "ValidationException"
+        assert CustomException("x").to_dict()["error_type"] == "CustomException"
+
+    def test_to_dict_fixed_keys_override_payload(self):
+        e = ValidationException("real", payload={"message": "spoof", "field": "a"})
+        assert e.to_dict() == {"field": "a", "message": "real", "error_type": "ValidationException"}
+
+    def test_explicit_status_code_overrides_default(self):
+        assert ValidationException("x", 409).status_code == 409
+        assert ValidationException("x", status_code=None).status_code == 400
+
+    def test_default_payload_is_shared_and_read_only(self):
+        a, b = ValidationException("a"), AuthenticationException("b")
+        assert a.payload is b.payload
+        assert dict(a.payload) == {}
+        with pytest.raises(TypeError):
+            a.payload["x"] = 1
+        assert a.to_dict() == {"message": "a", "error_type": "ValidationException"}
@@ -0,0 +1,63 @@
+"""
+Unit Tests — migrate_production module.
+
+Covers the SQLite path's schema-checksum sidecar (<db>.migrated).
+"""
+
+import sqlite3
+import pytest
+
+import migrate_production
+
+pytestmark = pytest.mark.unit
+
+
+_TABLES = (
+    "users(id INTEGER PRIMARY KEY)",
+    "rfpos(id INTEGER PRIMARY KEY, project_id, consortium_id, vendor_id, requestor_id, team_id)",
+    "teams(id INTEGER PRIMARY KEY, consortium_consort_id)",
+    "user_teams(team_id)",
+    "vendor_sites(vendor_id)",
+    "rfpo_approval_instances(rfpo_id)",
+    "rfpo_approval_actions(instance_id)",
+    "ticket_comments(ticket_id)",
+    "ticket_attachments(ticket_id)",
+)
+
+
+@pytest.fixture
+def sqlite_db(tmp_path, monkeypatch):
+    db_path = tmp_path / "rfpo.db"
+    conn = sqlite3.connect(db_path)
+    conn.executescript("".join(f"CREATE TABLE {table};" for table in _TABLES))
+    conn.close()
+    monkeypatch.setattr(migrate_production, "get_database_url", lambda: f"sqlite:///{db_path}")
+    return db_path
+
+
+class TestSchemaChecksum:
+    def test_rerun_skips_when_unchanged(self, sqlite_db, capsys):
+        migrate_production.run_migration()
+        assert (sqlite_db.parent / "rfpo.db.migrated").exists()
+        capsys.readouterr()
+        migrate_production.run_migration()
+        assert "nothing to do" in capsys.readouterr().out
+
+    def test_new_step_runs_after_checksum(self, sqlite_db, monkeypatch, capsys):
+        migrate_production.run_migration()
+        build = migrate_production.build_migrations
+
+        def build_with_new_step(is_postgres):
+            step = ("Index: users.id", "CREATE INDEX IF NOT EXISTS idx_test_users ON users(id)")
+            return build(is_postgres) + [step]
+
+        monkeypatch.setattr(migrate_production, "build_migrations", build_with_new_step)
+        capsys.readouterr()
+        migrate_production.run_migration()
+        assert "OK: Index: users.id" in capsys.readouterr().out
+        conn = sqlite3.connect(sqlite_db)
+        try:
+            names = {row[0] for row in conn.execute("SELECT name FROM sqlite_master")}
+        finally:
+            conn.close()
+        assert "idx_test_users" in names
@@ -30,6 +30,7 @@ from models import (
     RFPOApprovalStep,
     RFPOApprovalInstance,
     RFPOApprovalAction,
+    UploadedFile,
 )
 
 pytestmark = [pytest.mark.unit, pytest.mark.models]
@@ -65,6 +66,13 @@ class TestUser:
         assert u.has_permission("RFPO_USER") is True
         assert u.has_permission("GOD") is False
 
+    def test_permission_filter(self, app):
+        u = self._make()
+        u.set_permissions(["RFPO_ADMIN"])
+        db.session.flush()
+        assert User.query.filter(User.permission_filter("RFPO_ADMIN")).all() == [u]
+        assert User.query.filter(User.permission_filter("ADMIN")).all() == []
+
     def test_is_super_admin(self, app):
         u = self._make()
         u.set_permissions(["GOD"])
@@ -88,6 +96,41 @@ class TestUser:
         u = self._make()
         assert check_password_hash(u.password_hash, "pw")
 
+    def test_created_at_server_default_is_utc(self, app):
+        before = datetime.utcnow().replace(microsecond=0)
+        # Raw SQL skips the ORM's Python-side default
+        db.session.execute(db.text(
+            "INSERT INTO users (record_id, email, fullname, password_hash, permissions_version) "
+            "VALUES ('URAW1', 'raw@t.com', 'Raw', 'x', 0)"
+        ))
+        created_at = db.session.execute(db.text(
+            "SELECT created_at FROM users WHERE record_id = 'URAW1'"
+        )).scalar()
+        created_at = datetime.fromisoformat(str(created_at))
+        assert before <= created_at <= datetime.utcnow()
+
+    def test_check_password_caches_success_only(self, app, monkeypatch):
+        import models
+
+        u = self._make()
+        calls = []
+        real = models.check_password_hash
+        monkeypatch.setattr(
+            models, "check_password_hash", lambda h, p: calls.append(p) or real(h, p)
+        )
+        assert u.check_password("wrong") is False
+        assert u.check_password("wrong") is False
+        assert u.check_password("pw") is True
+        assert u.check_password("pw") is True
+        assert calls == ["wrong", "wrong", "pw"]
+
+    def test_check_password_rechecks_after_hash_change(self, app):
+        u = self._make()
+        assert u.check_password("pw") is True
+        u.password_hash = generate_password_hash("new-pw")
+        assert u.check_password("pw") is False
+        assert u.check_password("new-pw") is True
+
     def test_to_dict_returns_dict(self, app):
         u = self._make()
         d = u.to_dict()
@@ -164,6 +207,12 @@ class TestRFPO:
         assert float(sample_rfpo.subtotal) == 200.0
         assert float(sample_rfpo.total_amount) == 200.0
 
+    def test_update_totals_after_delete(self, app, sample_rfpo):
+        assert len(sample_rfpo.line_items) == 1  # collection already loaded
+        db.session.delete(sample_rfpo.line_items[0])
+        sample_rfpo.update_totals()
+        assert float(sample_rfpo.subtotal) == 0.0
+
     def test_cost_share_percent(self, app, sample_rfpo):
         sample_rfpo.cost_share_type = "percent"
         sample_rfpo.cost_share_amount = 10  # 10%
@@ -191,6 +240,17 @@ class TestRFPO:
         d = sample_rfpo.to_dict()
         assert "deleted_at" in d
 
+    def test_to_dict_file_count(self, app, db_cleanup, sample_rfpo):
+        db_cleanup.add(UploadedFile(
+            file_id="F-COUNT-1", original_filename="a.pdf",
+            stored_filename="F-COUNT-1_a.pdf", file_path="/tmp/a.pdf",
+            file_size=10, rfpo_id=sample_rfpo.id, uploaded_by="tester",
+        ))
+        db_cleanup.commit()
+        db_cleanup.expire(sample_rfpo, ["files"])
+        assert sample_rfpo.to_dict()["file_count"] == 1
+        assert "files" not in sample_rfpo.__dict__  # counted, not loaded
+
     def test_generate_po_number(self, app):
         po = RFPO.generate_po_number("TST")
         assert po.startswith("PO-TST-")
@@ -227,6 +287,37 @@ class TestTeam:
         sample_team.set_rfpo_admin_users(["A1"])
         assert sample_team.get_rfpo_admin_users() == ["A1"]
 
+    def test_viewer_users_cache_follows_column(self, app, sample_team):
+        sample_team.set_rfpo_viewer_users(["U1"])
+        ids = sample_team.get_rfpo_viewer_users()
+        ids.append("U2")  # callers get their own copy
+        assert sample_team.get_rfpo_viewer_users() == ["U1"]
+        sample_team.rfpo_viewer_user_ids = json.dumps(["U3"])
+        assert sample_team.get_rfpo_viewer_users() == ["U3"]
+        sample_team.set_rfpo_viewer_users([])
+        assert sample_team.get_rfpo_viewer_users() == []
+
+    def test_viewer_users_cache_survives_refresh(self, app, db_cleanup, sample_team):
+        sample_team.set_rfpo_viewer_users(["U1"])
+        db_cleanup.commit()
+        assert sample_team.get_rfpo_viewer_users() == ["U1"]
+        db_cleanup.execute(
+            Team.__table__.update()
+            .where(Team.__table__.c.id == sample_team.id)
+            .values(rfpo_viewer_user_ids=json.dumps(["U2"]))
+        )
+        db_cleanup.refresh(sample_team)
+        assert sample_team.get_rfpo_viewer_users() == ["U2"]
+
+    def test_rfpo_user_filter(self, app, db_cleanup, sample_team):
+        sample_team.set_rfpo_viewer_users(["U10"])
+        sample_team.set_rfpo_admin_users(["A_1"])
+        db_cleanup.commit()
+        assert Team.query.filter(Team.rfpo_user_filter("U10")).all() == [sample_team]
+        assert Team.query.filter(Team.rfpo_user_filter("A_1")).all() == [sample_team]
+        assert Team.query.filter(Team.rfpo_user_filter("U1")).all() == []
+        assert Team.query.filter(Team.rfpo_user_filter("A%1")).all() == []
+
     def test_to_dict(self, app, sample_team):
         d = sample_team.to_dict()
         assert d["name"] == sample_team.name
@@ -423,3 +514,18 @@ class TestApprovalInstance:
             overall_status="draft",
         )
         assert inst.overall_status == "draft"
+
+
+# ── Schema marker ─────────────────────────────────────────────────────────
+
+class TestEnsureSchema:
+    def test_skips_create_all_when_marker_current(self, app, monkeypatch):
+        from models import ensure_schema
+
+        ensure_schema(force=True)
+        calls = []
+        monkeypatch.setattr(db, "create_all", lambda *a, **k: calls.append(1))
+        assert ensure_schema() is False
+        assert calls == []
+        assert ensure_schema(force=True) is True
+        assert calls == [1]